@@ -1,47 +1,95 @@
 import contextlib
 
 from fastapi.security import OAuth2PasswordRequestForm
+from fastapi_users.exceptions import UserNotExists
 from starlette.requests import Request
 from starlette.responses import RedirectResponse, Response
 from starlette_admin.auth import AdminUser, AuthProvider
 from starlette_admin.exceptions import LoginFailed
 
+from core.config import settings
 from core.models import db_connector
+from users.auth.user_cache import user_change_handlers
 from users.dependencies.user_manager import get_user_manager
 from users.dependencies.users import get_user_db
 
+from .session_cache import AdminSessionCache
+
 get_async_session_context = contextlib.asynccontextmanager(db_connector.get_session)
 get_user_db_context = contextlib.asynccontextmanager(get_user_db)
 get_user_manager_context = contextlib.asynccontextmanager(get_user_manager)
 
 
+async def get_admin_identity(username: str) -> tuple[int, str] | None:
+    """Fetches the admin by the session's username.
+
+    Args:
+        username (str): Username (email) of the admin session
+
+    Returns:
+        tuple[int, str] | None: Admin's id and email, None if the user doesn't exist
+        or isn't an active superuser
+    """
+
+    async with get_async_session_context() as session:
+        async with get_user_db_context(session) as user_db:
+            async with get_user_manager_context(user_db) as user_manager:
+                try:
+                    user = await user_manager.get_by_email(user_email=username)
+                except UserNotExists:
+                    return None
+
+                if not (user.is_active and user.is_superuser):
+                    return None
+
+                return user.id, user.email
+
+
+admin_sessions = AdminSessionCache(
+    verify=get_admin_identity,
+    ttl=settings.admin_auth_cache.ttl,
+    stale_ttl=settings.admin_auth_cache.stale_ttl,
+    max_size=settings.admin_auth_cache.max_size,
+)
+
+if settings.admin_auth_cache.enabled:
+    user_change_handlers.append(admin_sessions.invalidate)
+
+
 class FastApiUsersAuthProvider(AuthProvider):
     """Authentication provider for Starlette-admin using FastAPI-users."""
 
     async def is_authenticated(self, request: Request) -> bool:
         """Validates each incoming request. Saves user's email getting from
         request.session username (if it exists) to request.state.admin_username.
+        A recently verified session is trusted without database queries, if the
+        admin sessions cache is enabled.
 
         Args:
             request (Request): Incoming request
 
         Returns:
-            bool: True if the user is authenticated, False otherwise
+            bool: True if the user is an authenticated admin, False otherwise
         """
 
         username: str | None = request.session.get("username")
 
-        if username:
-            async with get_async_session_context() as session:
-                async with get_user_db_context(session) as user_db:
-                    async with get_user_manager_context(user_db) as user_manager:
-                        user = await user_manager.get_by_email(user_email=username)
-                        if user:
-                            request.state.admin_username = user.email
+        if not username:
+            return False
+
+        email = (
+            admin_sessions.get(username) if settings.admin_auth_cache.enabled else None
+        )
+
+        if email is None:
+            email = await admin_sessions.load(username)
+
+        if email is None:
+            return False
 
-                            return True
+        request.state.admin_username = email
 
-        return False
+        return True
 
     async def login(
         self,
@@ -0,0 +1,167 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from core.cache import TTLCache
+from core.metrics import Counter
+from users.auth.user_cache import INVALIDATE_ALL, USER_PREFIX
+
+logger = logging.getLogger(__name__)
+
+admin_session_lookups = Counter(
+    "admin_session_cache_lookups_total",
+    "The number of the admin sessions lookups in the in-process cache",
+    label_names=("result",),
+)
+
+
+class AdminSessionCache:
+    """In-process cache of the verified admin sessions by the admin's username. A
+    session verified within the ttl is trusted as is, a session verified within the
+    stale ttl is trusted while it's verified again in the background.
+
+    Attributes:
+        ttl (float): For how many seconds a verified session is trusted as is
+        identities (TTLCache[str, tuple[int, str, float]]): Admin's id, email and
+        monotonic verification time by username
+        generation (int): The number of invalidations, an identity verified before
+        an invalidation isn't stored
+    """
+
+    def __init__(
+        self,
+        verify: Callable[[str], Awaitable[tuple[int, str] | None]],
+        ttl: float,
+        stale_ttl: float,
+        max_size: int,
+    ) -> None:
+        """Inits AdminSessionCache.
+
+        Args:
+            verify (Callable[[str], Awaitable[tuple[int, str] | None]]): Provides the
+            admin's id and email by username, None if the user isn't an admin
+            ttl (float): For how many seconds a verified session is trusted as is
+            stale_ttl (float): For how many seconds a verified session is trusted
+            while it's verified again
+            max_size (int): The number of sessions to keep
+        """
+
+        self.verify = verify
+        self.ttl = ttl
+        self.identities: TTLCache[str, tuple[int, str, float]] = TTLCache(
+            max_size=max_size, ttl=stale_ttl
+        )
+        self.generation = 0
+        self._revalidations: dict[str, asyncio.Task] = {}
+
+    def get(self, username: str) -> str | None:
+        """Provides the email of the verified admin, starting the verification in
+        the background if the session is stale.
+
+        Args:
+            username (str): Username of the admin session
+
+        Returns:
+            str | None: Admin's email, None if not verified recently
+        """
+
+        identity = self.identities.get(username)
+
+        if identity is None:
+            admin_session_lookups.inc(result="miss")
+            return None
+
+        _, email, verified_at = identity
+
+        if time.monotonic() - verified_at < self.ttl:
+            admin_session_lookups.inc(result="fresh")
+        else:
+            admin_session_lookups.inc(result="stale")
+            self.revalidate(username)
+
+        return email
+
+    def store(self, username: str, identity: tuple[int, str], generation: int) -> None:
+        """Stores the verified admin if no invalidation happened since the admin was
+        loaded.
+
+        Args:
+            username (str): Username of the admin session
+            identity (tuple[int, str]): Admin's id and email
+            generation (int): The cache generation before the admin was loaded
+        """
+
+        if generation == self.generation:
+            self.identities.set(username, (*identity, time.monotonic()))
+
+    async def load(self, username: str) -> str | None:
+        """Verifies the admin and stores the result.
+
+        Args:
+            username (str): Username of the admin session
+
+        Returns:
+            str | None: Admin's email, None if the user isn't an admin
+        """
+
+        generation = self.generation
+        identity = await self.verify(username)
+
+        if identity is None:
+            self.identities.pop(username)
+            return None
+
+        self.store(username, identity, generation)
+
+        return identity[1]
+
+    async def _revalidate(self, username: str) -> None:
+        """Verifies the admin again, keeping the stale identity if the database
+        fails.
+
+        Args:
+            username (str): Username of the admin session
+        """
+
+        try:
+            await self.load(username)
+        except (SQLAlchemyError, OSError):
+            logger.exception("Failed to verify the admin session again")
+
+    def revalidate(self, username: str) -> None:
+        """Verifies the admin again in the background, once at a time.
+
+        Args:
+            username (str): Username of the admin session
+        """
+
+        if username in self._revalidations:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._revalidate(username))
+        self._revalidations[username] = task
+        task.add_done_callback(lambda _: self._revalidations.pop(username, None))
+
+    def invalidate(self, messages: set[str]) -> None:
+        """Removes the identities of the changed users. Handler of the committed
+        users changes.
+
+        Args:
+            messages (set[str]): "user:<id>" or "all" messages of the changes
+        """
+
+        self.generation += 1
+
+        if INVALIDATE_ALL in messages:
+            self.identities.clear()
+            return
+
+        user_ids = {
+            int(message.removeprefix(USER_PREFIX))
+            for message in messages
+            if message.startswith(USER_PREFIX)
+        }
+        self.identities.remove_if(lambda identity: identity[0] in user_ids)
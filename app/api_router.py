@@ -1,7 +1,9 @@
 from fastapi import APIRouter
 
 from core.config import settings
+from core.responses import get_default_response_class
 from meetings.routes import router as meetings_router
+from monitoring.routes import router as monitoring_router
 from structures.relations_routes import router as relations_router
 from structures.roles_routes import router as roles_router
 from structures.structures_routes import router as structures_router
@@ -11,6 +13,7 @@ from work_tasks.routes import router as tasks_router
 
 router = APIRouter(
     prefix=settings.prefix.api_prefix,
+    default_response_class=get_default_response_class(),
 )
 
 router.include_router(auth_router)
@@ -20,3 +23,4 @@ router.include_router(roles_router)
 router.include_router(relations_router)
 router.include_router(meetings_router)
 router.include_router(tasks_router)
+router.include_router(monitoring_router)
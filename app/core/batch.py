@@ -0,0 +1,54 @@
+from typing import Generic, TypeVar
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from core.config import settings
+from core.query_stats import query_budget
+
+T = TypeVar("T")
+
+# Batch endpoints issue a fixed number of statements whatever the batch size
+batch_query_budget = query_budget(settings.batch.query_budget)
+
+
+class BatchItemError(BaseModel):
+    """An error of a single batch item.
+
+    Attributes:
+        index (int): Position of the failed item in the request batch
+        status_code (int): Http status code the item would get as a single request
+        detail (str): Error description
+    """
+
+    index: int
+    status_code: int
+    detail: str
+
+    @classmethod
+    def from_exception(cls, index: int, exception: HTTPException) -> "BatchItemError":
+        """Builds item error from the http exception raised for the item.
+
+        Args:
+            index (int): Position of the failed item in the request batch
+            exception (HTTPException): Exception raised for the item
+
+        Returns:
+            BatchItemError: Batch item error
+        """
+
+        return cls(
+            index=index, status_code=exception.status_code, detail=exception.detail
+        )
+
+
+class BatchResult(BaseModel, Generic[T]):
+    """A result of the batch operation.
+
+    Attributes:
+        items (list[T]): Successfully processed items
+        errors (list[BatchItemError]): Errors of the failed items
+    """
+
+    items: list[T]
+    errors: list[BatchItemError]
@@ -0,0 +1,98 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """In-process cache keeping at most the given number of values, each for the
+    given time. The least recently used value is evicted when the cache is full.
+
+    Attributes:
+        max_size (int): The number of values the cache keeps
+        ttl (float): For how many seconds a value is kept
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """Inits TTLCache.
+
+        Args:
+            max_size (int): The number of values the cache keeps
+            ttl (float): For how many seconds a value is kept
+        """
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self._values: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, key: K) -> V | None:
+        """Provides the value by the key and marks it as recently used.
+
+        Args:
+            key (K): Key of the value
+
+        Returns:
+            V | None: The value or None if it's missing or expired
+        """
+
+        entry = self._values.get(key)
+
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+
+        if expires_at <= time.monotonic():
+            del self._values[key]
+            return None
+
+        self._values.move_to_end(key)
+
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Stores the value by the key, evicting the least recently used value if the
+        cache is full.
+
+        Args:
+            key (K): Key of the value
+            value (V): The value to store
+        """
+
+        self._values[key] = (time.monotonic() + self.ttl, value)
+        self._values.move_to_end(key)
+
+        while len(self._values) > self.max_size:
+            self._values.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """Removes the value by the key if it's stored.
+
+        Args:
+            key (K): Key of the value
+        """
+
+        self._values.pop(key, None)
+
+    def remove_if(self, predicate: Callable[[V], bool]) -> None:
+        """Removes every value matching the predicate.
+
+        Args:
+            predicate (Callable[[V], bool]): Returns True for a value to remove
+        """
+
+        for key in [
+            key for key, (_, value) in self._values.items() if predicate(value)
+        ]:
+            del self._values[key]
+
+    def clear(self) -> None:
+        """Removes every value."""
+
+        self._values.clear()
@@ -1,7 +1,7 @@
 from pydantic import BaseModel, PostgresDsn, StringConstraints, computed_field, constr
 from pydantic_core import MultiHostUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing_extensions import Annotated
+from typing_extensions import Annotated, Literal
 
 
 class RunConfig(BaseModel):
@@ -11,13 +11,23 @@ class RunConfig(BaseModel):
         app (str): Entrypoint to start fastapi app by uvicorn
         host (str): Host to start app on
         port (int): Port to start app on
-        auto_reload (bool): Auto reload app
+        auto_reload (bool): Auto reload app, runs a single worker
+        workers (int): The number of worker processes serving the app. 1 by default
+        max_requests (int): The number of requests a worker serves before it's
+        restarted, which releases the memory it has grown. 0 disables. 0 by default
+        performance_profile (bool): Serve with the uvloop event loop and the
+        httptools http parser, and send the api responses serialized to JSON by
+        orjson. Requires the "performance" poetry dependency group.
+        "False" by default
     """
 
     app: str
     host: str
     port: int
     auto_reload: bool
+    workers: int = 1
+    max_requests: int = 0
+    performance_profile: bool = False
 
 
 class ApiPrefix(BaseModel):
@@ -39,6 +49,8 @@ class ApiPrefix(BaseModel):
         meetings (str): Url prefix for meetings routes. Defaults to "/meetings"
 
         work_tasks (str): Url prefix for work tasks routes. Defaults to "/tasks"
+
+        monitoring (str): Url prefix for monitoring routes. Defaults to "/monitoring"
     """
 
     api_prefix: str = "/api"
@@ -49,6 +61,7 @@ class ApiPrefix(BaseModel):
     relations: str = "/relations"
     meetings: str = "/meetings"
     work_tasks: str = "/tasks"
+    monitoring: str = "/monitoring"
 
     @computed_field
     @property
@@ -87,6 +100,41 @@ class PostgresDBConfig(BaseModel):
         max_overflow (int): The number of connections to allow in connection pool
         overflow. 10 by default
 
+        replica_urls (list[str]): Urls of the read replicas. Read sessions use the
+        primary database if empty. Empty by default
+
+        replica_max_lag (float): The replication lag in seconds above which a replica
+        isn't used for reads. 5.0 by default
+
+        replica_lag_check_interval (float): How often in seconds the replication lag of
+        a replica is checked. 1.0 by default
+
+        read_your_writes_seconds (int): For how many seconds after the user's write the
+        user's reads are served by the primary database. 0 disables. 5 by default
+
+        statement_timeout (float): The longest time in seconds a statement may run,
+        routes with a deadline shorten it to the time left. 0 disables. 30.0 by
+        default
+
+        lock_timeout (float): The longest time in seconds a statement may wait for a
+        lock. 0 disables. 10.0 by default
+
+        max_connections (int): The number of connections all the app workers may
+        open to a database server. Every worker gets an equal share, its pool_size
+        and max_overflow are lowered to fit it. Should leave room for the other
+        clients under the server's max_connections. Not applied in "transaction"
+        pooler mode, where the pooler limits the server connections. 0 disables. 0
+        by default
+
+        pooler_mode (str): "session" for direct connections or a session pooler,
+        "transaction" for a transaction pooler like PgBouncer in transaction mode,
+        which disables prepared statements caching and session level settings.
+        "session" by default
+
+        pooler_pool_size (int): The number of connections to the transaction pooler
+        to keep open in "transaction" mode, pool_size isn't used then. 0 opens a
+        connection per session. 0 by default
+
         naming_convention (dict): Naming conventions to use in database migrations
 
     Properties:
@@ -103,6 +151,15 @@ class PostgresDBConfig(BaseModel):
     echo_pool: bool = True
     pool_size: int = 40
     max_overflow: int = 10
+    replica_urls: list[str] = []
+    replica_max_lag: float = 5.0
+    replica_lag_check_interval: float = 1.0
+    read_your_writes_seconds: int = 5
+    statement_timeout: float = 30.0
+    lock_timeout: float = 10.0
+    max_connections: int = 0
+    pooler_mode: Literal["session", "transaction"] = "session"
+    pooler_pool_size: int = 0
     naming_convention: dict[str, str] = {
         "ix": "ix_%(column_0_label)s",
         "uq": "uq_%(table_name)s_%(column_0_name)s",
@@ -124,6 +181,271 @@ class PostgresDBConfig(BaseModel):
         )
 
 
+class PaginationConfig(BaseModel):
+    """A class for keyset pagination settings.
+
+    Attributes:
+        default_limit (int): Page size used when a client doesn't provide a limit. 50
+        by default
+
+        max_limit (int): The biggest page size a client can request. 200 by default
+    """
+
+    default_limit: int = 50
+    max_limit: int = 200
+
+
+class BatchConfig(BaseModel):
+    """A class for batch endpoints settings.
+
+    Attributes:
+        max_size (int): The biggest number of items a client can send in one batch. 500
+        by default
+
+        query_budget (int): The number of statements a batch endpoint may issue, which
+        doesn't depend on the batch size. 10 by default
+    """
+
+    max_size: int = 500
+    query_budget: int = 10
+
+
+class ExportConfig(BaseModel):
+    """A class for streaming export settings.
+
+    Attributes:
+        yield_per (int): The number of rows fetched from the server-side cursor at a
+        time. Also the number of rows sent to a client in one chunk. 1000 by default
+    """
+
+    yield_per: int = 1000
+
+
+class QueryStatsConfig(BaseModel):
+    """A class for per-request sql statements statistics settings.
+
+    Attributes:
+        enabled (bool): Count statements and database time of every request. "True" by
+        default
+
+        default_budget (int): The number of statements a route may issue unless the
+        route sets its own budget. 20 by default
+
+        repeated_statement_threshold (int): The number of executions of the same
+        statement with different parameters in one request to report it as a N+1
+        pattern. 5 by default
+
+        raise_on_exceed (bool): Raise an error instead of logging a warning when the
+        budget is exceeded or a N+1 pattern is detected. Meant for the test
+        environment. "False" by default
+    """
+
+    enabled: bool = True
+    default_budget: int = 20
+    repeated_statement_threshold: int = 5
+    raise_on_exceed: bool = False
+
+
+class SlowQueriesConfig(BaseModel):
+    """A class for the slow queries log settings.
+
+    Attributes:
+        enabled (bool): Log the statements running longer than the threshold. "True"
+        by default
+
+        threshold (float): Execution time in seconds above which a statement is slow.
+        0.5 by default
+
+        log_parameters (bool): Log the slow statement's bound parameters. "True" by
+        default
+
+        max_parameters_length (int): The longest logged parameters representation,
+        the longer one is truncated. 1000 by default
+
+        explain (bool): Capture the execution plans of the slow select statements by
+        running them again with EXPLAIN (ANALYZE, BUFFERS). Doubles the work of the
+        slow statements, not meant for production. "False" by default
+
+        explain_buffer_size (int): The number of the latest slow statements kept with
+        their plans for the superusers to browse. 100 by default
+    """
+
+    enabled: bool = True
+    threshold: float = 0.5
+    log_parameters: bool = True
+    max_parameters_length: int = 1000
+    explain: bool = False
+    explain_buffer_size: int = 100
+
+
+class TransactionsConfig(BaseModel):
+    """A class for transactional operations settings.
+
+    Attributes:
+        max_attempts (int): The number of times an operation runs before a
+        serialization failure or a deadlock is reported to the client. 3 by default
+
+        backoff_base (float): Upper bound in seconds of the random delay before the
+        first retry, doubled for every next retry. 0.05 by default
+
+        backoff_max (float): The biggest upper bound in seconds of the random delay
+        before a retry. 1.0 by default
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.05
+    backoff_max: float = 1.0
+
+
+class WarmupConfig(BaseModel):
+    """A class for the worker startup warm-up settings.
+
+    Attributes:
+        enabled (bool): Warm up the worker before it starts serving requests. "True"
+        by default
+
+        db_connections (int): The number of connections to open in every database
+        pool. Capped by the pool size. 5 by default
+
+        prepare_statements (bool): Prepare the hot statements on every opened
+        connection, which also loads the asyncpg type codecs they need. "True" by
+        default
+
+        redis (bool): Open a redis connection by a ping. "True" by default
+    """
+
+    enabled: bool = True
+    db_connections: int = 5
+    prepare_statements: bool = True
+    redis: bool = True
+
+
+class LoggingConfig(BaseModel):
+    """A class for logging settings.
+
+    Attributes:
+        enabled (bool): Route every log record through a queue to a background
+        thread writing it to stdout, so slow output doesn't block the event loop.
+        Replaces the sqlalchemy echo handlers and the uvicorn handlers. "True" by
+        default
+
+        level (str): Root logger level. "INFO" by default
+
+        json_format (bool): Write the records as JSON objects, one per line, instead
+        of text. "False" by default
+
+        queue_size (int): The number of records the queue holds before new records
+        are dropped. 0 makes the queue unbounded. 10000 by default
+
+        rate_limits (dict[str, int]): The number of records per second a logger and
+        its children may write, the exceeding records are dropped and counted.
+        "sqlalchemy.engine": 50, "sqlalchemy.pool": 20 by default
+    """
+
+    enabled: bool = True
+    level: str = "INFO"
+    json_format: bool = False
+    queue_size: int = 10000
+    rate_limits: dict[str, int] = {"sqlalchemy.engine": 50, "sqlalchemy.pool": 20}
+
+
+class AuthCacheConfig(BaseModel):
+    """A class for the in-process cache of the authenticated users.
+
+    Attributes:
+        enabled (bool): Resolve the access tokens to the users from the cache, without
+        redis and database queries. "True" by default
+
+        ttl (float): For how many seconds a cached user is used. Bounds how long a
+        change missed by the invalidations is seen. 30.0 by default
+
+        max_size (int): The number of users a worker keeps, the least recently used
+        are evicted. 10000 by default
+
+        channel (str): Redis channel the workers exchange the invalidations through.
+        "auth-cache:invalidations" by default
+    """
+
+    enabled: bool = True
+    ttl: float = 30.0
+    max_size: int = 10000
+    channel: str = "auth-cache:invalidations"
+
+
+class SignedTokenConfig(BaseModel):
+    """A class for the signed access tokens settings. The signed tokens carry the
+    user's data and are verified without redis and database queries, the revoked
+    tokens are kept in a redis denylist synced by every worker.
+
+    Attributes:
+        enabled (bool): Issue and accept the signed tokens. "False" by default
+
+        secret (str): Secret the tokens are signed with, required if enabled
+
+        lifetime_seconds (int): Lifetime of the token. 900 by default
+
+        algorithm (str): Signing algorithm. "HS256" by default
+
+        denylist_key (str): Redis hash of the revoked tokens and users.
+        "auth:signed-token-denylist" by default
+
+        denylist_sync_interval (float): How often in seconds a worker fetches the
+        denylist. 1.0 by default
+
+        denylist_max_age (float): For how many seconds after the last successful
+        sync the tokens are accepted, after that every signed token is rejected
+        until the denylist is fetched again. 10.0 by default
+    """
+
+    enabled: bool = False
+    secret: str = ""
+    lifetime_seconds: int = 900
+    algorithm: str = "HS256"
+    denylist_key: str = "auth:signed-token-denylist"
+    denylist_sync_interval: float = 1.0
+    denylist_max_age: float = 10.0
+
+
+class AdminAuthCacheConfig(BaseModel):
+    """A class for the in-process cache of the verified admin sessions.
+
+    Attributes:
+        enabled (bool): Trust the recently verified admin sessions without database
+        queries. "True" by default
+
+        ttl (float): For how many seconds a verified session is trusted as is. 10.0
+        by default
+
+        stale_ttl (float): For how many seconds a verified session is trusted while
+        it's verified again in the background. Bounds how long a demoted admin
+        keeps the access. 60.0 by default
+
+        max_size (int): The number of sessions a worker keeps, the least recently
+        used are evicted. 1000 by default
+    """
+
+    enabled: bool = True
+    ttl: float = 10.0
+    stale_ttl: float = 60.0
+    max_size: int = 1000
+
+
+class PasswordHashingConfig(BaseModel):
+    """A class for the password hashing worker threads settings.
+
+    Attributes:
+        workers (int): The number of threads of a worker process hashing and
+        verifying the passwords. 2 by default
+
+        max_queue (int): The number of password operations waiting for a thread,
+        further operations are rejected with 503 until the queue drains. 32 by
+        default
+    """
+
+    workers: int = 2
+    max_queue: int = 32
+
+
 class AlembicConfig(BaseModel):
     """A class for alembic settings.
 
@@ -225,6 +547,33 @@ class Settings(BaseSettings):
 
         prefix (ApiPrefix): Api prefixes configuration settings model
 
+        pagination (PaginationConfig): Keyset pagination settings model
+
+        batch (BatchConfig): Batch endpoints settings model
+
+        export (ExportConfig): Streaming export settings model
+
+        query_stats (QueryStatsConfig): Per-request sql statements statistics settings
+        model
+
+        slow_queries (SlowQueriesConfig): Slow queries log settings model
+
+        warmup (WarmupConfig): Worker startup warm-up settings model
+
+        transactions (TransactionsConfig): Transactional operations settings model
+
+        logging (LoggingConfig): Logging settings model
+
+        auth_cache (AuthCacheConfig): Authenticated users cache settings model
+
+        signed_token (SignedTokenConfig): Signed access tokens settings model
+
+        admin_auth_cache (AdminAuthCacheConfig): Verified admin sessions cache
+        settings model
+
+        password_hashing (PasswordHashingConfig): Password hashing threads settings
+        model
+
         session_middleware (SessionMiddlewareConfig): SessionMiddlware settings model
 
         superuser (SuperUserConfig): Superusers credentials settings model
@@ -240,6 +589,18 @@ class Settings(BaseSettings):
 
     alembic: AlembicConfig = AlembicConfig()
     prefix: ApiPrefix = ApiPrefix()
+    pagination: PaginationConfig = PaginationConfig()
+    batch: BatchConfig = BatchConfig()
+    export: ExportConfig = ExportConfig()
+    query_stats: QueryStatsConfig = QueryStatsConfig()
+    slow_queries: SlowQueriesConfig = SlowQueriesConfig()
+    warmup: WarmupConfig = WarmupConfig()
+    transactions: TransactionsConfig = TransactionsConfig()
+    logging: LoggingConfig = LoggingConfig()
+    auth_cache: AuthCacheConfig = AuthCacheConfig()
+    signed_token: SignedTokenConfig = SignedTokenConfig()
+    admin_auth_cache: AdminAuthCacheConfig = AdminAuthCacheConfig()
+    password_hashing: PasswordHashingConfig = PasswordHashingConfig()
     session_middleware: SessionMiddlewareConfig
     redis: RedisConfig
     superuser: SuperUserConfig
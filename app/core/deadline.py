@@ -0,0 +1,235 @@
+import asyncio
+import math
+from collections.abc import Awaitable, Callable, Coroutine
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, SessionTransaction
+from starlette.requests import ClientDisconnect
+
+from core.config import settings
+from core.exceptions import RequestDeadlineExceeded
+
+QUERY_CANCELED = "57014"
+LOCK_NOT_AVAILABLE = "55P03"
+
+CLIENT_CLOSED_REQUEST = 499
+
+SET_TIMEOUTS_STATEMENT = text(
+    "SELECT set_config('statement_timeout', :statement_timeout, true), "
+    "set_config('lock_timeout', :lock_timeout, true)"
+)
+
+
+@dataclass
+class Deadline:
+    """Deadline of a single request.
+
+    Attributes:
+        timeout (asyncio.Timeout): Timeout cancelling the request handling when the
+        deadline passes
+        lock_timeout (float | None): The longest time in seconds a statement may wait
+        for a lock, settings.main_db.lock_timeout if not provided
+    """
+
+    timeout: asyncio.Timeout
+    lock_timeout: float | None = None
+
+    @property
+    def is_set(self) -> bool:
+        """Whether the route has declared its deadline.
+
+        Returns:
+            bool: True if the deadline is set
+        """
+
+        return self.timeout.when() is not None
+
+    def set(self, seconds: float, lock_timeout: float | None = None) -> None:
+        """Sets the deadline to the given number of seconds from now.
+
+        Args:
+            seconds (float): The time in seconds the request may take
+            lock_timeout (float | None): The longest time in seconds a statement may
+            wait for a lock
+        """
+
+        self.timeout.reschedule(asyncio.get_running_loop().time() + seconds)
+        self.lock_timeout = lock_timeout
+
+    def remaining(self) -> float:
+        """Provides the time left before the deadline.
+
+        Returns:
+            float: Seconds left, infinity if the deadline isn't set
+        """
+
+        when = self.timeout.when()
+
+        if when is None:
+            return math.inf
+
+        return max(when - asyncio.get_running_loop().time(), 0.0)
+
+
+deadline_var: ContextVar[Deadline | None] = ContextVar("deadline", default=None)
+
+
+def request_deadline(
+    seconds: float, lock_timeout: float | None = None
+) -> Callable[[], Awaitable[None]]:
+    """Builds a dependency setting the route's deadline. The route must be served by
+    DeadlineRoute, the dependency does nothing otherwise.
+
+    The route handling is cancelled with RequestDeadlineExceeded when the deadline
+    passes, and every transaction the route begins gets the statement timeout equal
+    to the time left, so Postgres stops a slow statement by itself.
+
+    Args:
+        seconds (float): The time in seconds the route may take
+        lock_timeout (float | None): The longest time in seconds a statement may wait
+        for a lock. settings.main_db.lock_timeout if not provided
+
+    Returns:
+        Callable[[], Awaitable[None]]: Dependency to use in the route's dependencies
+    """
+
+    async def set_request_deadline() -> None:
+        deadline = deadline_var.get()
+
+        if deadline is not None:
+            deadline.set(seconds, lock_timeout=lock_timeout)
+
+    return set_request_deadline
+
+
+def to_milliseconds(seconds: float) -> str:
+    """Formats the timeout for a Postgres setting. Zero disables a timeout in
+    Postgres, so a finite timeout is at least one millisecond.
+
+    Args:
+        seconds (float): Timeout in seconds, infinity for no timeout
+
+    Returns:
+        str: Timeout in milliseconds
+    """
+
+    if math.isinf(seconds):
+        return "0"
+
+    return str(max(math.ceil(seconds * 1000), 1))
+
+
+@event.listens_for(Session, "after_begin")
+def set_transaction_timeouts(
+    session: Session, transaction: SessionTransaction, connection: Connection
+) -> None:
+    """Sets statement and lock timeouts of the transaction, limited by the time left
+    before the request's deadline. Without a deadline the timeouts are set only in
+    the "transaction" pooler mode, where they can't be the connection defaults.
+
+    Args:
+        session (Session): Session beginning the transaction
+        transaction (SessionTransaction): Begun transaction
+        connection (Connection): Connection of the transaction
+    """
+
+    deadline = deadline_var.get()
+
+    if deadline is not None and deadline.is_set:
+        remaining = deadline.remaining()
+        lock_timeout = deadline.lock_timeout
+    elif settings.main_db.pooler_mode == "transaction":
+        remaining = math.inf
+        lock_timeout = None
+    else:
+        return
+
+    connection.execute(
+        SET_TIMEOUTS_STATEMENT,
+        {
+            "statement_timeout": to_milliseconds(
+                min(settings.main_db.statement_timeout or math.inf, remaining)
+            ),
+            "lock_timeout": to_milliseconds(
+                min(
+                    lock_timeout or settings.main_db.lock_timeout or math.inf, remaining
+                )
+            ),
+        },
+    )
+
+
+async def cancel_on_disconnect(request: Request, task: asyncio.Task) -> None:
+    """Cancels the task handling the request when the client disconnects. Must be
+    started after the request body is read, so it doesn't consume the body.
+
+    Args:
+        request (Request): Handled request
+        task (asyncio.Task): Task handling the request
+    """
+
+    while True:
+        message = await request.receive()
+
+        if message["type"] == "http.disconnect":
+            request.state.client_disconnected = True
+            task.cancel()
+            return
+
+
+class DeadlineRoute(APIRoute):
+    """Route cancelling its handling, along with the running database statement,
+    when the client disconnects or the deadline set by request_deadline passes.
+
+    The route answers with 504 when the deadline passes or Postgres cancels a
+    statement by the statement or lock timeout.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler = super().get_route_handler()
+
+        async def deadline_route_handler(request: Request) -> Response:
+            try:
+                await request.body()
+            except ClientDisconnect:
+                return Response(status_code=CLIENT_CLOSED_REQUEST)
+
+            task = asyncio.current_task()
+            watcher = asyncio.create_task(cancel_on_disconnect(request, task))
+
+            try:
+                async with asyncio.timeout(None) as timeout:
+                    token = deadline_var.set(Deadline(timeout=timeout))
+
+                    try:
+                        return await route_handler(request)
+                    finally:
+                        deadline_var.reset(token)
+            except TimeoutError as error:
+                raise RequestDeadlineExceeded from error
+            except DBAPIError as error:
+                if getattr(error.orig, "sqlstate", None) in (
+                    QUERY_CANCELED,
+                    LOCK_NOT_AVAILABLE,
+                ):
+                    raise RequestDeadlineExceeded from error
+
+                raise
+            except asyncio.CancelledError:
+                if not getattr(request.state, "client_disconnected", False):
+                    raise
+
+                task.uncancel()
+
+                return Response(status_code=CLIENT_CLOSED_REQUEST)
+            finally:
+                watcher.cancel()
+
+        return deadline_route_handler
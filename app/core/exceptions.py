@@ -0,0 +1,21 @@
+from fastapi import HTTPException, status
+
+InvalidCursor = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor"
+)
+
+
+DuplicatedBatchItem = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST, detail="Item is duplicated in the batch"
+)
+
+
+RequestDeadlineExceeded = HTTPException(
+    status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail="Request deadline exceeded"
+)
+
+
+TransactionConflict = HTTPException(
+    status_code=status.HTTP_409_CONFLICT,
+    detail="The operation conflicted with concurrent changes, try again",
+)
@@ -0,0 +1,126 @@
+import csv
+import io
+from collections.abc import AsyncIterator, Callable
+from enum import Enum
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel as PydanticSchema
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.model_adapter import ModelAdapter
+from core.models import db_connector
+
+
+class ExportFormat(Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def to_ndjson_line(item: PydanticSchema) -> str:
+    """Serializes the schema to a newline delimited JSON line.
+
+    Args:
+        item (PydanticSchema): Schema to serialize
+
+    Returns:
+        str: JSON line
+    """
+
+    return item.model_dump_json() + "\n"
+
+
+def to_csv_line(values: list) -> str:
+    """Serializes values to a CSV line.
+
+    Args:
+        values (list): Row values
+
+    Returns:
+        str: CSV line
+    """
+
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+
+    return buffer.getvalue()
+
+
+async def stream_export(
+    adapter_factory: Callable[[AsyncSession], ModelAdapter],
+    schema: type[PydanticSchema],
+    export_format: ExportFormat,
+) -> AsyncIterator[str]:
+    """Streams all the adapter's items serialized with the schema by chunks.
+
+    The stream opens its own read session, since the request's session is closed
+    before the response body is sent.
+
+    Args:
+        adapter_factory (Callable[[AsyncSession], ModelAdapter]): Builds the adapter
+        to stream the items with from the session
+        schema (type[PydanticSchema]): Schema to serialize the items with
+        export_format (ExportFormat): Export format
+
+    Yields:
+        str: Chunk of serialized items
+    """
+
+    fields = list(schema.model_fields)
+    chunk = []
+
+    if export_format == ExportFormat.CSV:
+        chunk.append(to_csv_line(fields))
+
+    async with db_connector.read_session() as session:
+        async for item in adapter_factory(session).stream_items():
+            item_schema = schema.model_validate(item)
+
+            if export_format == ExportFormat.CSV:
+                row = item_schema.model_dump(mode="json")
+                chunk.append(to_csv_line([row[field] for field in fields]))
+            else:
+                chunk.append(to_ndjson_line(item_schema))
+
+            if len(chunk) >= settings.export.yield_per:
+                yield "".join(chunk)
+                chunk.clear()
+
+    if chunk:
+        yield "".join(chunk)
+
+
+def export_response(
+    adapter_factory: Callable[[AsyncSession], ModelAdapter],
+    schema: type[PydanticSchema],
+    export_format: ExportFormat,
+    filename: str,
+) -> StreamingResponse:
+    """Builds the streaming response exporting all the adapter's items.
+
+    Args:
+        adapter_factory (Callable[[AsyncSession], ModelAdapter]): Builds the adapter
+        to stream the items with from the session
+        schema (type[PydanticSchema]): Schema to serialize the items with
+        export_format (ExportFormat): Export format
+        filename (str): Name of the exported file without extension
+
+    Returns:
+        StreamingResponse: Streaming response
+    """
+
+    return StreamingResponse(
+        stream_export(adapter_factory, schema, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{filename}.{export_format.value}"'
+            )
+        },
+    )
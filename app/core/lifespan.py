@@ -3,8 +3,13 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 
+from core.config import settings
 from core.models import db_connector
 from core.redis import redis_connector
+from core.warmup import warm_up
+from users.auth.password_hasher import password_hasher
+from users.auth.signed_tokens import token_denylist
+from users.auth.user_cache import user_cache
 
 
 @asynccontextmanager
@@ -12,10 +17,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Manages the fastapi application's lifespan handling startup and shutdown events.
 
     on startup:
+        1) warms up redis and database pools, the worker starts serving requests
+        when the warm-up finishes
+        2) starts receiving the authenticated users cache invalidations
+        3) fetches the signed tokens denylist and starts syncing it
 
     on shutdown:
-        1) closes redis connection
-        2) closes database connection
+        1) stops receiving the authenticated users cache invalidations
+        2) stops syncing the signed tokens denylist
+        3) stops the password hashing threads
+        4) closes redis connection
+        5) closes database connection
 
     Args:
         app (FastAPI): The FastAPI application instance
@@ -24,7 +36,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         AsyncGenerator[None, None]: AsyncGenerator using by FastAPI
     """
 
+    await warm_up()
+
+    if settings.auth_cache.enabled:
+        user_cache.start()
+
+    if settings.signed_token.enabled:
+        await token_denylist.sync()
+        token_denylist.start()
+
     yield
 
+    await user_cache.stop()
+    await token_denylist.stop()
+    password_hasher.shutdown()
     await redis_connector.close_connection()
     await db_connector.dispose()
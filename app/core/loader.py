@@ -0,0 +1,208 @@
+import asyncio
+from collections.abc import Iterable
+
+from sqlalchemy import Integer, any_, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import Base as SQLAlchemyBaseModel
+
+LOADERS_KEY = "model_loaders"
+LOADERS_LOCK_KEY = "model_loaders_lock"
+
+
+class ModelLoader:
+    """Batching loader of the model items by id.
+
+    Ids requested within one event loop iteration are resolved with a single
+    "WHERE id = ANY(...)" query. Loaded items are cached for the session lifetime, so
+    the same row is never fetched twice. The session is the request scope, use
+    get_model_loader to get the loader bound to the session.
+
+    The query runs in the task of the first caller of the batch, so it's cancelled
+    with that caller's request and never outlives the session's use.
+    """
+
+    def __init__(self, model: SQLAlchemyBaseModel, session: AsyncSession) -> None:
+        """Inits ModelLoader.
+
+        Args:
+            model (SQLAlchemyBaseModel): SQLAlchemy model class
+            session (AsyncSession): Async session
+        """
+
+        self.model = model
+        self.session = session
+        self._cache: dict[int, asyncio.Future] = {}
+        self._queue: dict[int, asyncio.Future] = {}
+
+    async def load(self, item_id: int) -> SQLAlchemyBaseModel | None:
+        """Loads item by id, batching it with the other ids requested in the same
+        event loop iteration.
+
+        Args:
+            item_id (int): Id of the item to load
+
+        Returns:
+            SQLAlchemyBaseModel | None: Object from the db or None if not found
+        """
+
+        future = self._cache.get(item_id)
+
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._cache[item_id] = future
+            self._queue[item_id] = future
+
+            if len(self._queue) == 1:
+                await self._dispatch()
+
+        return await future
+
+    async def load_many(
+        self, item_ids: Iterable[int]
+    ) -> list[SQLAlchemyBaseModel | None]:
+        """Loads items by ids with a single query.
+
+        Args:
+            item_ids (Iterable[int]): Ids of the items to load
+
+        Returns:
+            list[SQLAlchemyBaseModel | None]: Objects in the order of the ids, None for
+            the items not found
+        """
+
+        return await asyncio.gather(*(self.load(item_id) for item_id in item_ids))
+
+    def prime(self, item: SQLAlchemyBaseModel) -> None:
+        """Puts the item into the cache.
+
+        Args:
+            item (SQLAlchemyBaseModel): Object to cache
+        """
+
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(item)
+
+        self._cache[item.id] = future
+
+    def clear(self, item_ids: Iterable[int] | None = None) -> None:
+        """Removes items from the cache.
+
+        Args:
+            item_ids (Iterable[int] | None): Ids of the items to remove. All the
+            cached items are removed if not provided
+        """
+
+        if item_ids is None:
+            self._cache.clear()
+            return
+
+        for item_id in item_ids:
+            self._cache.pop(item_id, None)
+
+    def _take_queue(self) -> dict[int, asyncio.Future]:
+        """Empties the queue.
+
+        Returns:
+            dict[int, asyncio.Future]: Futures of the queued ids by id
+        """
+
+        futures, self._queue = self._queue, {}
+
+        return futures
+
+    def _fail(
+        self, futures: dict[int, asyncio.Future], error: Exception | None
+    ) -> None:
+        """Removes the failed ids from the cache and passes the error to their
+        callers.
+
+        Args:
+            futures (dict[int, asyncio.Future]): Futures of the failed ids by id
+            error (Exception | None): Query error, the futures are cancelled if None
+        """
+
+        self.clear(futures)
+
+        for future in futures.values():
+            if future.done():
+                continue
+
+            if error is None:
+                future.cancel()
+            else:
+                future.set_exception(error)
+
+    async def _dispatch(self) -> None:
+        """Resolves all the queued ids with a single query. If the calling task is
+        cancelled, the batch is cancelled for its other callers too, as they share
+        the request's session."""
+
+        futures: dict[int, asyncio.Future] = {}
+
+        try:
+            # Let the other tasks add the ids requested in this iteration
+            await asyncio.sleep(0)
+
+            futures = self._take_queue()
+            stmt = select(self.model).where(
+                self.model.id == any_(literal(list(futures), ARRAY(Integer)))
+            )
+
+            async with get_loaders_lock(self.session):
+                results = await self.session.scalars(stmt)
+                items = {item.id: item for item in results.all()}
+        except asyncio.CancelledError:
+            self._fail(futures or self._take_queue(), None)
+            raise
+        except Exception as error:
+            self._fail(futures, error)
+        else:
+            for item_id, future in futures.items():
+                if not future.done():
+                    future.set_result(items.get(item_id))
+
+
+def get_loaders_lock(session: AsyncSession) -> asyncio.Lock:
+    """Provides the lock serializing loaders queries on the session, as the session
+    can't run concurrent statements.
+
+    Args:
+        session (AsyncSession): Async session
+
+    Returns:
+        asyncio.Lock: Session loaders lock
+    """
+
+    return session.info.setdefault(LOADERS_LOCK_KEY, asyncio.Lock())
+
+
+def get_model_loader(model: SQLAlchemyBaseModel, session: AsyncSession) -> ModelLoader:
+    """Provides the model loader bound to the session, creates it if not exists.
+
+    Args:
+        model (SQLAlchemyBaseModel): SQLAlchemy model class
+        session (AsyncSession): Async session
+
+    Returns:
+        ModelLoader: Model loader
+    """
+
+    loaders: dict = session.info.setdefault(LOADERS_KEY, {})
+
+    if model not in loaders:
+        loaders[model] = ModelLoader(model, session)
+
+    return loaders[model]
+
+
+def clear_model_loaders(session: AsyncSession) -> None:
+    """Removes all the items from the caches of the loaders bound to the session.
+
+    Args:
+        session (AsyncSession): Async session
+    """
+
+    for loader in session.info.get(LOADERS_KEY, {}).values():
+        loader.clear()
@@ -0,0 +1,195 @@
+import atexit
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+from core.config import settings
+from core.metrics import Counter
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s %(message)s"
+DROPPED_RECORDS_ATTRIBUTE = "dropped_records"
+UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+records_dropped = Counter(
+    "log_records_dropped_total",
+    "The number of log records dropped by the rate limit or the full queue",
+    label_names=("logger", "reason"),
+)
+
+_listener: QueueListener | None = None
+
+
+class TextFormatter(logging.Formatter):
+    """Text formatter noting the number of the logger's records dropped by the
+    rate limit before the record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        dropped = getattr(record, DROPPED_RECORDS_ATTRIBUTE, None)
+
+        if dropped:
+            return f"{message} ({dropped} records dropped by the rate limit before)"
+
+        return message
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatter writing the record as a single line JSON object."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "process": record.process,
+            "thread": record.threadName,
+        }
+
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+
+        dropped = getattr(record, DROPPED_RECORDS_ATTRIBUTE, None)
+
+        if dropped:
+            data[DROPPED_RECORDS_ATTRIBUTE] = dropped
+
+        return json.dumps(data, default=str, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    """Lets through no more than the configured number of records per second of a
+    logger and its children. The number of dropped records is attached to the first
+    record let through in the next second."""
+
+    def __init__(self, limits: dict[str, int]) -> None:
+        """Inits RateLimitFilter.
+
+        Args:
+            limits (dict[str, int]): The number of records per second by logger name
+        """
+
+        super().__init__()
+        self.limits = limits
+        self._windows: dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def get_limited_logger(self, name: str) -> str | None:
+        """Finds the closest rate limited ancestor of the logger.
+
+        Args:
+            name (str): Logger name
+
+        Returns:
+            str | None: Name of the rate limited logger, None if not limited
+        """
+
+        while name:
+            if name in self.limits:
+                return name
+
+            name = name.rpartition(".")[0]
+
+        return None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        limited_logger = self.get_limited_logger(record.name)
+
+        if limited_logger is None:
+            return True
+
+        now = time.monotonic()
+
+        with self._lock:
+            window = self._windows.setdefault(limited_logger, [now, 0, 0])
+            window_start, count, dropped = window
+
+            if now - window_start >= 1:
+                window[:] = [now, 1, 0]
+
+                if dropped:
+                    setattr(record, DROPPED_RECORDS_ATTRIBUTE, dropped)
+
+                return True
+
+            if count < self.limits[limited_logger]:
+                window[1] += 1
+                return True
+
+            window[2] += 1
+
+        records_dropped.inc(logger=limited_logger, reason="rate_limit")
+
+        return False
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Queue handler dropping the record instead of blocking when the queue is
+    full."""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            records_dropped.inc(logger=record.name, reason="queue_full")
+
+
+def stop_logging() -> None:
+    """Writes the queued records and stops the background logging thread."""
+
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def setup_logging() -> None:
+    """Routes every log record through a queue to a background thread writing it to
+    stdout, so the event loop only puts the record into the queue. The rate limits
+    are applied before the queue. Does nothing if already set up or disabled.
+
+    The uvicorn loggers' handlers are removed, so their records go through the
+    queue too. The sqlalchemy echo settings are applied as the sqlalchemy loggers
+    levels, the engines don't add their own handlers then.
+    """
+
+    global _listener
+
+    if _listener is not None or not settings.logging.enabled:
+        return
+
+    output_handler = logging.StreamHandler(sys.stdout)
+    output_handler.setFormatter(
+        JsonFormatter() if settings.logging.json_format else TextFormatter(TEXT_FORMAT)
+    )
+
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.logging.queue_size)
+    queue_handler = DroppingQueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter(settings.logging.rate_limits))
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(settings.logging.level)
+
+    for name in UVICORN_LOGGERS:
+        logger = logging.getLogger(name)
+        logger.handlers = []
+        logger.propagate = True
+
+    if settings.main_db.echo_sql:
+        logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
+
+    if settings.main_db.echo_pool:
+        logging.getLogger("sqlalchemy.pool").setLevel(logging.INFO)
+
+    _listener = QueueListener(log_queue, output_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
@@ -0,0 +1,308 @@
+import math
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+
+LabelValues = tuple[str, ...]
+
+
+def escape_label_value(value: str) -> str:
+    """Escapes the label value for the Prometheus text format.
+
+    Args:
+        value (str): Label value
+
+    Returns:
+        str: Escaped label value
+    """
+
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Metric:
+    """Base class of the in-process metrics exposed in the Prometheus text format.
+
+    Attributes:
+        name (str): Metric name
+        description (str): Metric help text
+        label_names (tuple[str, ...]): Names of the metric labels
+    """
+
+    kind: str = "untyped"
+
+    def __init__(
+        self, name: str, description: str, label_names: Iterable[str] = ()
+    ) -> None:
+        """Inits the metric and registers it in the metrics registry.
+
+        Args:
+            name (str): Metric name
+            description (str): Metric help text
+            label_names (Iterable[str]): Names of the metric labels. No labels by
+            default
+        """
+
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+
+        registry.register(self)
+
+    def get_label_values(self, labels: dict[str, str]) -> LabelValues:
+        """Orders the label values by the metric label names.
+
+        Args:
+            labels (dict[str, str]): Label values by label names
+
+        Raises:
+            ValueError: If the labels don't match the metric label names
+
+        Returns:
+            LabelValues: Label values
+        """
+
+        if labels.keys() != set(self.label_names):
+            raise ValueError(
+                f"Metric {self.name} expects labels {self.label_names}, "
+                f"got {tuple(labels)}"
+            )
+
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def format_labels(self, label_values: LabelValues, **extra_labels: str) -> str:
+        """Formats the labels of a sample.
+
+        Args:
+            label_values (LabelValues): Label values ordered by the label names
+            **extra_labels (str): Sample specific labels, like histogram "le"
+
+        Returns:
+            str: Labels in the Prometheus text format, empty string if no labels
+        """
+
+        labels = [
+            *zip(self.label_names, label_values, strict=True),
+            *extra_labels.items(),
+        ]
+
+        if not labels:
+            return ""
+
+        return (
+            "{"
+            + ",".join(
+                f'{name}="{escape_label_value(value)}"' for name, value in labels
+            )
+            + "}"
+        )
+
+    def collect(self) -> list[str]:
+        """Renders the metric samples.
+
+        Returns:
+            list[str]: Sample lines in the Prometheus text format
+        """
+
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """Renders the metric with its help and type lines.
+
+        Returns:
+            str: Metric in the Prometheus text format
+        """
+
+        return "\n".join(
+            [
+                f"# HELP {self.name} {self.description}",
+                f"# TYPE {self.name} {self.kind}",
+                *self.collect(),
+            ]
+        )
+
+
+class Counter(Metric):
+    """Monotonically increasing metric."""
+
+    kind = "counter"
+
+    def __init__(
+        self, name: str, description: str, label_names: Iterable[str] = ()
+    ) -> None:
+        super().__init__(name, description, label_names)
+        self._values: dict[LabelValues, float] = defaultdict(float)
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Increases the counter.
+
+        Args:
+            amount (float): The value to add. 1 by default
+            **labels (str): Label values by label names
+        """
+
+        self._values[self.get_label_values(labels)] += amount
+
+    def collect(self) -> list[str]:
+        return [
+            f"{self.name}{self.format_labels(label_values)} {value}"
+            for label_values, value in self._values.items()
+        ]
+
+
+class Gauge(Metric):
+    """Metric which can go up and down. The value is either set or read from a
+    function when the metrics are rendered."""
+
+    kind = "gauge"
+
+    def __init__(
+        self, name: str, description: str, label_names: Iterable[str] = ()
+    ) -> None:
+        super().__init__(name, description, label_names)
+        self._values: dict[LabelValues, float] = {}
+        self._functions: dict[LabelValues, Callable[[], float]] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Sets the gauge value.
+
+        Args:
+            value (float): The value to set
+            **labels (str): Label values by label names
+        """
+
+        self._values[self.get_label_values(labels)] = value
+
+    def set_function(self, function: Callable[[], float], **labels: str) -> None:
+        """Makes the gauge read its value from the function on render.
+
+        Args:
+            function (Callable[[], float]): Function returning the current value
+            **labels (str): Label values by label names
+        """
+
+        self._functions[self.get_label_values(labels)] = function
+
+    def collect(self) -> list[str]:
+        values = self._values | {
+            label_values: function()
+            for label_values, function in self._functions.items()
+        }
+
+        return [
+            f"{self.name}{self.format_labels(label_values)} {value}"
+            for label_values, value in values.items()
+        ]
+
+
+class Histogram(Metric):
+    """Metric counting observed values in cumulative buckets."""
+
+    kind = "histogram"
+
+    DEFAULT_BUCKETS = (
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    )
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Inits the histogram and registers it in the metrics registry.
+
+        Args:
+            name (str): Metric name
+            description (str): Metric help text
+            label_names (Iterable[str]): Names of the metric labels. No labels by
+            default
+            buckets (Iterable[float]): Upper bounds of the buckets. Seconds from 1 ms
+            to 10 s by default
+        """
+
+        super().__init__(name, description, label_names)
+        self.buckets = (*sorted(buckets), math.inf)
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = defaultdict(float)
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Counts the value in the first bucket it fits in.
+
+        Args:
+            value (float): Observed value
+            **labels (str): Label values by label names
+        """
+
+        label_values = self.get_label_values(labels)
+        counts = self._counts.setdefault(label_values, [0] * len(self.buckets))
+
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[index] += 1
+                break
+
+        self._sums[label_values] += value
+
+    def collect(self) -> list[str]:
+        lines = []
+
+        for label_values, counts in self._counts.items():
+            cumulative_count = 0
+
+            for bound, count in zip(self.buckets, counts, strict=True):
+                cumulative_count += count
+                le = "+Inf" if bound == math.inf else repr(bound)
+                labels = self.format_labels(label_values, le=le)
+                lines.append(f"{self.name}_bucket{labels} {cumulative_count}")
+
+            labels = self.format_labels(label_values)
+            lines.append(f"{self.name}_sum{labels} {self._sums[label_values]}")
+            lines.append(f"{self.name}_count{labels} {cumulative_count}")
+
+        return lines
+
+
+class MetricsRegistry:
+    """Registry of the application metrics."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> None:
+        """Adds the metric to the registry.
+
+        Args:
+            metric (Metric): Metric to add
+
+        Raises:
+            ValueError: If a metric with the same name is already registered
+        """
+
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+
+        self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        """Renders all the registered metrics.
+
+        Returns:
+            str: Metrics in the Prometheus text format
+        """
+
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+registry = MetricsRegistry()
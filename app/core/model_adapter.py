@@ -1,8 +1,28 @@
+from collections.abc import AsyncIterator, Iterable
+
 from pydantic import BaseModel as PydanticSchema
-from sqlalchemy import select
+from sqlalchemy import (
+    Integer,
+    Row,
+    Select,
+    any_,
+    column,
+    delete,
+    insert,
+    literal,
+    select,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
+from core.config import settings
+from core.loader import ModelLoader, get_model_loader
 from core.models import Base as SQLAlchemyBaseModel
+from core.pagination import decode_cursor, encode_cursor
 
 
 class ModelAdapter:
@@ -18,20 +38,148 @@ class ModelAdapter:
         self.model = model
         self.session = session
 
-    async def read_all_items(self) -> list[SQLAlchemyBaseModel]:
-        """Retrieves all items from db.
+    async def commit(self) -> None:
+        """Commits the session's transaction. Adapters only flush their changes, the
+        request's unit of work commits them once when the request succeeds, see
+        DataBaseConnector.get_session. Commit explicitly only when the following
+        steps need the changes committed, e.g. to be seen by other connections.
+        """
+
+        await self.session.commit()
+
+    @property
+    def loader(self) -> ModelLoader:
+        """Request scoped batching loader of the model items by id.
 
         Returns:
-            list[SQLAlchemyBaseModel]: List of all objects from db
+            ModelLoader: Model loader bound to the adapter's session
         """
 
-        stmt = select(self.model)
-        results = await self.session.scalars(stmt)
+        return get_model_loader(self.model, self.session)
+
+    def get_projection_columns(
+        self, schema: type[PydanticSchema]
+    ) -> list[InstrumentedAttribute]:
+        """Collects the model columns required to build the schema.
+
+        Args:
+            schema (type[PydanticSchema]): Pydantic schema to build from the rows
+
+        Returns:
+            list[InstrumentedAttribute]: Model columns named as the schema fields
+        """
+
+        table_columns = self.model.__table__.columns
+
+        return [
+            getattr(self.model, name)
+            for name in schema.model_fields
+            if name in table_columns
+        ]
+
+    async def read_page(
+        self,
+        stmt: Select | None = None,
+        sort_column: InstrumentedAttribute | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+        schema: type[PydanticSchema] | None = None,
+    ) -> tuple[list[SQLAlchemyBaseModel | Row], str | None]:
+        """Retrieves a page of items using keyset pagination on (sort_column, id).
+        The page continues right after the item the cursor points to, so every page
+        costs the same index range scan regardless of its position.
+
+        If the schema is provided, only the columns the schema needs are selected and
+        plain rows are returned instead of objects, skipping the identity map and the
+        unit of work. Rows can be validated into the schema with from_attributes.
+
+        Args:
+            stmt (Select | None): Select statement of the model to paginate. Selects
+            all the model's items by default
+            sort_column (InstrumentedAttribute | None): Model column to sort by. Model's
+            id by default
+            cursor (str | None): Cursor returned with the previous page
+            limit (int | None): Maximum number of items in the page. Capped by
+            settings.pagination.max_limit
+            schema (type[PydanticSchema] | None): Response schema to select the
+            columns for. Objects are loaded if not provided
+
+        Returns:
+            tuple[list[SQLAlchemyBaseModel | Row], str | None]: Objects or rows of the
+            page and the cursor of the next page or None if the page is the last one
+        """
+
+        if stmt is None:
+            stmt = select(self.model)
+
+        if sort_column is None:
+            sort_column = self.model.id
+
+        if schema is not None:
+            columns = self.get_projection_columns(schema)
+            columns += [
+                column
+                for column in (sort_column, self.model.id)
+                if column.key not in schema.model_fields
+            ]
+            stmt = stmt.with_only_columns(*columns)
+
+        limit = min(
+            limit or settings.pagination.default_limit, settings.pagination.max_limit
+        )
+
+        if cursor:
+            sort_value, item_id = decode_cursor(cursor, sort_column)
+            stmt = stmt.where(
+                tuple_(sort_column, self.model.id)
+                > tuple_(
+                    literal(sort_value, sort_column.type),
+                    literal(item_id, self.model.id.type),
+                )
+            )
 
-        return results.all()
+        stmt = stmt.order_by(sort_column, self.model.id).limit(limit + 1)
+
+        if schema is not None:
+            items = list((await self.session.execute(stmt)).all())
+        else:
+            items = list((await self.session.scalars(stmt)).all())
+
+        next_cursor = None
+
+        if len(items) > limit:
+            items = items[:limit]
+            last_item = items[-1]
+            next_cursor = encode_cursor(
+                getattr(last_item, sort_column.key), last_item.id
+            )
+
+        return items, next_cursor
+
+    async def read_all_items(
+        self,
+        cursor: str | None = None,
+        limit: int | None = None,
+        schema: type[PydanticSchema] | None = None,
+    ) -> tuple[list[SQLAlchemyBaseModel | Row], str | None]:
+        """Retrieves a page of items from db ordered by id.
+
+        Args:
+            cursor (str | None): Cursor returned with the previous page
+            limit (int | None): Maximum number of items in the page
+            schema (type[PydanticSchema] | None): Response schema to select the
+            columns for. Objects are loaded if not provided
+
+        Returns:
+            tuple[list[SQLAlchemyBaseModel | Row], str | None]: Objects or rows of the
+            page and the cursor of the next page
+        """
+
+        return await self.read_page(cursor=cursor, limit=limit, schema=schema)
 
     async def read_item_by_id(self, item_id: int) -> SQLAlchemyBaseModel | None:
-        """Retrieves a single item by it's id
+        """Retrieves a single item by it's id. Lookups requested concurrently are
+        batched into one query and cached for the request.
 
         Args:
             item_id (int): id of the item to retrieve
@@ -40,9 +188,62 @@ class ModelAdapter:
             SQLAlchemyBaseModel | None: Object from the db or None if not found
         """
 
-        result = await self.session.get(self.model, item_id)
+        return await self.loader.load(item_id)
+
+    async def read_items_by_ids(
+        self, item_ids: Iterable[int]
+    ) -> list[SQLAlchemyBaseModel]:
+        """Retrieves items with provided ids by a single "WHERE id = ANY(...)" query.
+
+        Args:
+            item_ids (Iterable[int]): Ids of the items to retrieve
+
+        Returns:
+            list[SQLAlchemyBaseModel]: Found objects from the db in no particular order
+        """
+
+        item_ids = list(item_ids)
+
+        if not item_ids:
+            return []
+
+        stmt = select(self.model).where(
+            self.model.id == any_(literal(item_ids, ARRAY(Integer)))
+        )
+        results = await self.session.scalars(stmt)
+
+        return list(results.all())
+
+    async def stream_items(
+        self, stmt: Select | None = None, yield_per: int | None = None
+    ) -> AsyncIterator[SQLAlchemyBaseModel]:
+        """Streams items from a server-side cursor fetching them by chunks, so the
+        whole result is never buffered in memory.
+
+        Args:
+            stmt (Select | None): Select statement of the model. All the items ordered
+            by id by default
+            yield_per (int | None): Number of rows fetched at a time. Taken from
+            settings by default
+
+        Yields:
+            SQLAlchemyBaseModel: Objects from the db
+        """
+
+        if stmt is None:
+            stmt = select(self.model).order_by(self.model.id)
+
+        results = await self.session.stream_scalars(
+            stmt,
+            execution_options={"yield_per": yield_per or settings.export.yield_per},
+        )
 
-        return result
+        try:
+            async for partition in results.partitions():
+                for item in partition:
+                    yield item
+        finally:
+            await results.close()
 
     async def create_item(self, item_schema: PydanticSchema) -> SQLAlchemyBaseModel:
         """Creates a new item using the provided schema.
@@ -57,15 +258,35 @@ class ModelAdapter:
         item = self.model(**item_schema.model_dump())
 
         self.session.add(item)
-        await self.session.commit()
-        await self.session.refresh(item)
+        await self.session.flush()
 
         return item
 
+    @staticmethod
+    def get_changed_values(
+        update_schema: PydanticSchema, item: SQLAlchemyBaseModel
+    ) -> dict:
+        """Collects the fields set in the schema which differ from the item's values.
+
+        Args:
+            update_schema (PydanticSchema): Pydantic schema with data to update
+            item (SQLAlchemyBaseModel): Object to compare with
+
+        Returns:
+            dict: Changed values by field names
+        """
+
+        return {
+            key: value
+            for key, value in update_schema.model_dump(exclude_unset=True).items()
+            if getattr(item, key) != value
+        }
+
     async def update_item(
         self, update_schema: PydanticSchema, item: SQLAlchemyBaseModel
     ) -> SQLAlchemyBaseModel:
-        """Updates item with the provided schema.
+        """Updates item with the fields set in the provided schema. Only changed
+        columns are updated, nothing is written if no field has changed.
 
         Args:
             update_schema (PydanticSchema): Pydantic schema with data to update
@@ -75,11 +296,15 @@ class ModelAdapter:
             SQLAlchemyBaseModel: Updated object from db
         """
 
-        for key, value in update_schema.model_dump().items():
+        changed_values = self.get_changed_values(update_schema, item)
+
+        if not changed_values:
+            return item
+
+        for key, value in changed_values.items():
             setattr(item, key, value)
 
-        await self.session.commit()
-        await self.session.refresh(item)
+        await self.session.flush()
 
         return item
 
@@ -91,4 +316,98 @@ class ModelAdapter:
         """
 
         await self.session.delete(item)
-        await self.session.commit()
+        await self.session.flush()
+
+        self.loader.clear([item.id])
+
+    async def bulk_create_items(
+        self, item_schemas: list[PydanticSchema], **extra_values
+    ) -> list[SQLAlchemyBaseModel]:
+        """Creates items using the provided schemas by a single multi-row
+        "INSERT ... RETURNING" statement.
+
+        Args:
+            item_schemas (list[PydanticSchema]): Pydantic schemas containing items data
+            extra_values: Values to set on every created item
+
+        Returns:
+            list[SQLAlchemyBaseModel]: Created objects in the order of the schemas
+        """
+
+        if not item_schemas:
+            return []
+
+        rows = [{**schema.model_dump(), **extra_values} for schema in item_schemas]
+
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        results = await self.session.scalars(stmt, rows)
+        items = list(results.all())
+
+        return items
+
+    async def bulk_update_items(
+        self, update_schemas: list[PydanticSchema]
+    ) -> list[SQLAlchemyBaseModel]:
+        """Updates items using the provided schemas by a single
+        "UPDATE ... FROM (VALUES ...)" statement. Every schema must contain the id of
+        the item to update.
+
+        Args:
+            update_schemas (list[PydanticSchema]): Pydantic schemas with ids and data
+            to update
+
+        Returns:
+            list[SQLAlchemyBaseModel]: Updated objects in no particular order
+        """
+
+        if not update_schemas:
+            return []
+
+        rows = [schema.model_dump() for schema in update_schemas]
+        column_names = list(rows[0])
+        table_columns = self.model.__table__.columns
+
+        update_values = values(
+            *[column(name, table_columns[name].type) for name in column_names],
+            name="update_values",
+        ).data([tuple(row[name] for name in column_names) for row in rows])
+
+        stmt = (
+            update(self.model)
+            .where(self.model.id == update_values.c.id)
+            .values(
+                {name: update_values.c[name] for name in column_names if name != "id"}
+            )
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        results = await self.session.scalars(stmt)
+        items = list(results.all())
+
+        return items
+
+    async def bulk_delete_items(self, item_ids: list[int]) -> list[int]:
+        """Deletes items with provided ids by a single "DELETE ... WHERE id = ANY(...)"
+        statement.
+
+        Args:
+            item_ids (list[int]): Ids of the items to delete
+
+        Returns:
+            list[int]: Ids of the deleted items
+        """
+
+        if not item_ids:
+            return []
+
+        stmt = (
+            delete(self.model)
+            .where(self.model.id == any_(literal(item_ids, ARRAY(Integer))))
+            .returning(self.model.id)
+        )
+        results = await self.session.scalars(stmt)
+        deleted_ids = list(results.all())
+
+        self.loader.clear(deleted_ids)
+
+        return deleted_ids
@@ -14,9 +14,13 @@ class Base(DeclarativeBase):
         id (int): Primary key
         created_at (datetime): Timestamp indicating when the record was created
         updated_at (datetime): Timestamp indicating when the record was last updated
+
+    Server generated values are fetched with "INSERT/UPDATE ... RETURNING" during flush,
+    so written objects don't need to be refreshed.
     """
 
     __abstract__ = True
+    __mapper_args__ = {"eager_defaults": True}
 
     metadata = MetaData(
         naming_convention=settings.main_db.naming_convention,
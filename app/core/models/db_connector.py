@@ -1,13 +1,339 @@
+import asyncio
+import itertools
+import logging
+import math
+import time
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from uuid import uuid4
 
+from sqlalchemy import event, text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.pool import NullPool
 
 from core.config import settings
+from core.models.pool_telemetry import InstrumentedQueuePool, PoolTelemetry
+from core.query_stats import register_query_stats_events
+from core.redis import redis_connector
+from core.slow_queries import register_slow_query_events
+
+logger = logging.getLogger(__name__)
+
+COMMITTED_KEY = "committed"
+WROTE_KEY = "wrote"
+RECENT_WRITE_KEY = "db:recent-write:{owner}"
+
+POOLER_SESSION_MODE = "session"
+POOLER_TRANSACTION_MODE = "transaction"
+
+REPLICATION_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery()
+            OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+        THEN 0
+        ELSE coalesce(
+            extract(epoch FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+    """
+)
+
+session_owner_var: ContextVar[int | None] = ContextVar("session_owner", default=None)
+
+
+class PrimarySession(Session):
+    """Session of the primary database. Marks itself as committed if its transaction
+    has written, so the owner's reads can be routed to the primary database for a
+    while."""
+
+
+@event.listens_for(PrimarySession, "after_flush")
+def mark_flush_written(session: Session, flush_context) -> None:
+    """Marks the session's transaction as written by the unit of work flush.
+
+    Args:
+        session (Session): Flushed session
+        flush_context: Unit of work flush context
+    """
+
+    session.info[WROTE_KEY] = True
+
+
+@event.listens_for(PrimarySession, "do_orm_execute")
+def mark_statement_written(orm_execute_state: ORMExecuteState) -> None:
+    """Marks the session's transaction as written by an insert, update or delete
+    statement.
+
+    Args:
+        orm_execute_state (ORMExecuteState): Executed statement state
+    """
+
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info[WROTE_KEY] = True
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def mark_committed(session: Session) -> None:
+    """Marks the session as committed if the committed transaction has written.
+
+    Args:
+        session (Session): Committed session
+    """
+
+    if session.info.pop(WROTE_KEY, False):
+        session.info[COMMITTED_KEY] = True
+
+
+@event.listens_for(PrimarySession, "after_rollback")
+def discard_written(session: Session) -> None:
+    """Forgets the rolled back transaction writes.
+
+    Args:
+        session (Session): Rolled back session
+    """
+
+    session.info.pop(WROTE_KEY, None)
+
+
+def get_engine_options(
+    pool_size: int,
+    max_overflow: int,
+    statement_timeout: float,
+    lock_timeout: float,
+    pooler_mode: str,
+    pooler_pool_size: int,
+) -> dict:
+    """Builds the async engine pool and connection options.
+
+    In "session" mode the engine keeps a queue pool of direct connections with the
+    timeouts set as the connection defaults. In "transaction" mode the engine
+    connects to a transaction pooler, like PgBouncer, where a server connection
+    changes between transactions: the pool is small or absent, as the pooler does
+    the pooling, prepared statements aren't cached and get unique names, so they
+    never clash on a shared server connection, and no session level settings are
+    sent. The timeouts are set per transaction instead, see
+    core.deadline.set_transaction_timeouts.
+
+    Args:
+        pool_size (int): The number of connections to keep open in "session" mode
+        max_overflow (int): The number of connections to allow in pool overflow
+        statement_timeout (float): The longest time in seconds a statement may run.
+        0 disables
+        lock_timeout (float): The longest time in seconds a statement may wait for a
+        lock. 0 disables
+        pooler_mode (str): "session" or "transaction"
+        pooler_pool_size (int): The number of connections to the pooler to keep open
+        in "transaction" mode. 0 disables the pool
+
+    Returns:
+        dict: Keyword arguments of create_async_engine
+    """
+
+    if pooler_mode == POOLER_TRANSACTION_MODE:
+        pool_options = (
+            {
+                "poolclass": InstrumentedQueuePool,
+                "pool_size": pooler_pool_size,
+                "max_overflow": max_overflow,
+            }
+            if pooler_pool_size
+            else {"poolclass": NullPool}
+        )
+
+        return pool_options | {
+            "connect_args": {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": get_prepared_statement_name,
+            }
+        }
+
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "connect_args": {
+            "server_settings": {
+                "statement_timeout": str(round(statement_timeout * 1000)),
+                "lock_timeout": str(round(lock_timeout * 1000)),
+            }
+        },
+    }
+
+
+def get_worker_pool_limits(
+    pool_size: int, max_overflow: int, max_connections: int, workers: int
+) -> tuple[int, int]:
+    """Lowers the worker's pool size and overflow to fit the worker's equal share of
+    the database connections, so pool_size plus max_overflow times the number of
+    workers stays within the limit. The pool size is lowered first.
+
+    Args:
+        pool_size (int): The number of connections to keep open in the pool
+        max_overflow (int): The number of connections to allow in pool overflow
+        max_connections (int): The number of connections all the workers may open.
+        0 disables the limit
+        workers (int): The number of worker processes
+
+    Raises:
+        ValueError: If the limit is less than one connection per worker
+
+    Returns:
+        tuple[int, int]: The worker's pool size and max overflow
+    """
+
+    if not max_connections:
+        return pool_size, max_overflow
+
+    worker_connections = max_connections // workers
+
+    if worker_connections < 1:
+        raise ValueError(
+            f"{max_connections} database connections can't be divided between "
+            f"{workers} workers"
+        )
+
+    worker_pool_size = min(pool_size, worker_connections)
+    worker_max_overflow = min(max_overflow, worker_connections - worker_pool_size)
+
+    if (worker_pool_size, worker_max_overflow) != (pool_size, max_overflow):
+        logger.warning(
+            "Worker pool is lowered to %d connections and %d overflow to fit %d "
+            "connections of %d workers",
+            worker_pool_size,
+            worker_max_overflow,
+            max_connections,
+            workers,
+        )
+
+    return worker_pool_size, worker_max_overflow
+
+
+def get_prepared_statement_name() -> str:
+    """Provides a unique prepared statement name.
+
+    Returns:
+        str: Prepared statement name
+    """
+
+    return f"__asyncpg_{uuid4()}__"
+
+
+class ReplicaConnector:
+    """A class to manage connection to a read replica and to track its replication
+    lag."""
+
+    def __init__(
+        self,
+        url: str,
+        name: str = "replica",
+        echo: bool = False,
+        echo_pool: bool = False,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        statement_timeout: float = 0,
+        lock_timeout: float = 0,
+        pooler_mode: str = POOLER_SESSION_MODE,
+        pooler_pool_size: int = 0,
+    ) -> None:
+        """Inits the replica connector with given parameters.
+
+        Args:
+            url (str): Url to connect the replica
+            name (str): Name of the replica in the pool statistics. "replica" by
+            default
+            echo (bool): Logging sql statesments. "False" by default
+            echo_pool (bool): Logging connection pool information. "False" by default
+            pool_size (int): The number of connections to keep open inside the
+            connection pool. 5 by default
+            max_overflow (int): The number of connections to allow in connection pool
+            overflow. 10 by default
+            statement_timeout (float): The longest time in seconds a statement may
+            run. 0 disables. 0 by default
+            lock_timeout (float): The longest time in seconds a statement may wait
+            for a lock. 0 disables. 0 by default
+            pooler_mode (str): "session" for direct connections or a session
+            pooler, "transaction" for a transaction pooler. "session" by default
+            pooler_pool_size (int): The number of connections to keep open in
+            "transaction" mode. 0 disables the pool. 0 by default
+        """
+
+        self.engine: AsyncEngine = create_async_engine(
+            url=url,
+            echo=echo,
+            echo_pool=echo_pool,
+            **get_engine_options(
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                statement_timeout=statement_timeout,
+                lock_timeout=lock_timeout,
+                pooler_mode=pooler_mode,
+                pooler_pool_size=pooler_pool_size,
+            ),
+        )
+        self.session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
+            bind=self.engine,
+            autoflush=False,
+            autocommit=False,
+            expire_on_commit=False,
+        )
+        self.pool_telemetry = PoolTelemetry(self.engine, database=name)
+        self.lag: float = 0.0
+        self._checked_at: float = -math.inf
+        self._check_lock = asyncio.Lock()
+
+    async def refresh_lag(self) -> None:
+        """Checks the replication lag. The replica is considered infinitely lagging if
+        it can't be reached."""
+
+        try:
+            async with self.engine.connect() as connection:
+                self.lag = float(await connection.scalar(REPLICATION_LAG_QUERY))
+        except (SQLAlchemyError, OSError):
+            logger.exception("Replica %r is unavailable", self.engine.url)
+            self.lag = math.inf
+
+        self._checked_at = time.monotonic()
+
+    async def is_available(self, max_lag: float, check_interval: float) -> bool:
+        """Checks if the replica is lagging no more than allowed. The lag is
+        rechecked at most once in the check interval, concurrent callers use the
+        previously checked value.
+
+        Args:
+            max_lag (float): The biggest allowed replication lag in seconds
+            check_interval (float): How often in seconds the lag is checked
+
+        Returns:
+            bool: True if the replica can serve reads, False if not
+        """
+
+        if (
+            time.monotonic() - self._checked_at > check_interval
+            and not self._check_lock.locked()
+        ):
+            async with self._check_lock:
+                await self.refresh_lag()
+
+        return self.lag <= max_lag
+
+    async def dispose(self) -> None:
+        """Closes engine connection to the replica."""
+
+        await self.engine.dispose()
 
 
 class DataBaseConnector:
@@ -20,6 +346,14 @@ class DataBaseConnector:
         echo_pool: bool = False,
         pool_size: int = 5,
         max_overflow: int = 10,
+        statement_timeout: float = 0,
+        lock_timeout: float = 0,
+        pooler_mode: str = POOLER_SESSION_MODE,
+        pooler_pool_size: int = 0,
+        replica_urls: list[str] | None = None,
+        replica_max_lag: float = 5.0,
+        replica_lag_check_interval: float = 1.0,
+        read_your_writes_seconds: int = 0,
     ) -> None:
         """Inits the database connector with given parameters.
 
@@ -31,42 +365,260 @@ class DataBaseConnector:
             connection pool. 5 by default
             max_overflow (int): The number of connections to allow in connection pool
             overflow. 10 by default
+            statement_timeout (float): The longest time in seconds a statement may
+            run. 0 disables. 0 by default
+            lock_timeout (float): The longest time in seconds a statement may wait
+            for a lock. 0 disables. 0 by default
+            pooler_mode (str): "session" for direct connections or a session
+            pooler, "transaction" for a transaction pooler. "session" by default
+            pooler_pool_size (int): The number of connections to keep open in
+            "transaction" mode. 0 disables the pool. 0 by default
+            replica_urls (list[str] | None): Urls of the read replicas. Reads use the
+            primary database if not provided
+            replica_max_lag (float): The replication lag in seconds above which a
+            replica isn't used for reads. 5.0 by default
+            replica_lag_check_interval (float): How often in seconds the replication
+            lag is checked. 1.0 by default
+            read_your_writes_seconds (int): For how many seconds after the session
+            owner's write their reads are served by the primary. 0 by default
         """
 
         self.engine: AsyncEngine = create_async_engine(
             url=url,
             echo=echo,
             echo_pool=echo_pool,
-            pool_size=pool_size,
-            max_overflow=max_overflow,
+            **get_engine_options(
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                statement_timeout=statement_timeout,
+                lock_timeout=lock_timeout,
+                pooler_mode=pooler_mode,
+                pooler_pool_size=pooler_pool_size,
+            ),
         )
         self.session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
             bind=self.engine,
             autoflush=False,
             autocommit=False,
             expire_on_commit=False,
+            sync_session_class=PrimarySession,
         )
+        self.pool_telemetry = PoolTelemetry(self.engine, database="primary")
+
+        self.replicas = [
+            ReplicaConnector(
+                url=replica_url,
+                name=f"replica-{index}",
+                echo=echo,
+                echo_pool=echo_pool,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                statement_timeout=statement_timeout,
+                lock_timeout=lock_timeout,
+                pooler_mode=pooler_mode,
+                pooler_pool_size=pooler_pool_size,
+            )
+            for index, replica_url in enumerate(replica_urls or [])
+        ]
+        self._replicas_cycle = itertools.cycle(self.replicas)
+        self.replica_max_lag = replica_max_lag
+        self.replica_lag_check_interval = replica_lag_check_interval
+        self.read_your_writes_seconds = read_your_writes_seconds
+
+        if settings.query_stats.enabled:
+            register_query_stats_events(self.engine)
+
+            for replica in self.replicas:
+                register_query_stats_events(replica.engine)
+
+        if settings.slow_queries.enabled:
+            register_slow_query_events(self.engine, database="primary")
+
+            for replica in self.replicas:
+                register_slow_query_events(
+                    replica.engine, database=replica.pool_telemetry.database
+                )
 
     async def dispose(self) -> None:
         """Closes engine connection to the database."""
 
         await self.engine.dispose()
 
+        for replica in self.replicas:
+            await replica.dispose()
+
+    def stats(self) -> list[dict]:
+        """Provides the connection pools statistics of the primary and the replicas.
+
+        Returns:
+            list[dict]: Pool statistics of every database, see PoolTelemetry.stats
+        """
+
+        return [
+            self.pool_telemetry.stats(),
+            *(replica.pool_telemetry.stats() for replica in self.replicas),
+        ]
+
+    @staticmethod
+    def set_session_owner(owner_id: int) -> None:
+        """Binds the current request's sessions to the user, so the user's writes
+        are tracked for read-your-writes consistency.
+
+        Args:
+            owner_id (int): Id of the user the request is made by
+        """
+
+        session_owner_var.set(owner_id)
+
+    @staticmethod
+    async def release_connection(session: AsyncSession) -> None:
+        """Ends the session's read only transaction, so the session's connection goes
+        back to the pool until the next statement. Loaded objects stay usable, as they
+        aren't expired on commit. Does nothing if the transaction has pending or
+        flushed changes.
+
+        Args:
+            session (AsyncSession): Async database session
+        """
+
+        if (
+            not session.in_transaction()
+            or session.info.get(WROTE_KEY)
+            or session.new
+            or session.dirty
+            or session.deleted
+        ):
+            return
+
+        await session.commit()
+
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
-        """Provides an async database session.
+        """Provides an async database session, which is the request's unit of work.
+        Adapters only flush their changes, the session commits them once when the
+        request succeeds and rolls them back when it fails. The session checks a
+        connection out of the pool on the first statement and returns it on commit,
+        rollback or close.
+
+        Yields:
+            AsyncSession: An active async database session
+        """
+
+        session = self.session_factory()
+
+        try:
+            async with session:
+                yield session
+
+                if session.in_transaction():
+                    await session.commit()
+        finally:
+            if session.info.get(COMMITTED_KEY):
+                await self._mark_recent_write()
+
+    async def get_read_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Provides an async database session for read only operations. The session
+        is bound to a read replica if there is one lagging no more than allowed and
+        the session owner hasn't written recently, otherwise to the primary.
 
         Yields:
             AsyncSession: An active async database session
         """
 
-        async with self.session_factory() as session:
+        async with self.read_session() as session:
             yield session
 
+    @asynccontextmanager
+    async def read_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Opens an async database session for read only operations, see
+        get_read_session.
+
+        Yields:
+            AsyncSession: An active async database session
+        """
+
+        session_factory = await self._choose_read_session_factory()
+
+        async with session_factory() as session:
+            yield session
+
+    async def _choose_read_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Chooses the next available replica using round-robin, falls back to the
+        primary.
+
+        Returns:
+            async_sessionmaker[AsyncSession]: Session factory of the chosen database
+        """
+
+        if not self.replicas or await self._has_recent_write():
+            return self.session_factory
+
+        for _ in range(len(self.replicas)):
+            replica = next(self._replicas_cycle)
+
+            if await replica.is_available(
+                max_lag=self.replica_max_lag,
+                check_interval=self.replica_lag_check_interval,
+            ):
+                return replica.session_factory
+
+        return self.session_factory
+
+    async def _mark_recent_write(self) -> None:
+        """Remembers that the session owner has written to the primary."""
+
+        owner_id = session_owner_var.get()
+
+        if not self.replicas or not self.read_your_writes_seconds or owner_id is None:
+            return
+
+        await redis_connector.get_client().set(
+            RECENT_WRITE_KEY.format(owner=owner_id),
+            1,
+            ex=self.read_your_writes_seconds,
+        )
+
+    async def _has_recent_write(self) -> bool:
+        """Checks if the session owner has written to the primary recently.
+
+        Returns:
+            bool: True if the owner's reads must be served by the primary
+        """
+
+        owner_id = session_owner_var.get()
+
+        if not self.read_your_writes_seconds or owner_id is None:
+            return False
+
+        return bool(
+            await redis_connector.get_client().exists(
+                RECENT_WRITE_KEY.format(owner=owner_id)
+            )
+        )
+
+
+worker_pool_size, worker_max_overflow = (
+    get_worker_pool_limits(
+        pool_size=settings.main_db.pool_size,
+        max_overflow=settings.main_db.max_overflow,
+        max_connections=settings.main_db.max_connections,
+        workers=1 if settings.run.auto_reload else settings.run.workers,
+    )
+    if settings.main_db.pooler_mode == POOLER_SESSION_MODE
+    else (settings.main_db.pool_size, settings.main_db.max_overflow)
+)
 
 db_connector = DataBaseConnector(
     url=settings.main_db.postgres_url.unicode_string(),
-    echo=settings.main_db.echo_sql,
-    echo_pool=settings.main_db.echo_pool,
-    pool_size=settings.main_db.pool_size,
-    max_overflow=settings.main_db.max_overflow,
+    echo=settings.main_db.echo_sql and not settings.logging.enabled,
+    echo_pool=settings.main_db.echo_pool and not settings.logging.enabled,
+    pool_size=worker_pool_size,
+    max_overflow=worker_max_overflow,
+    statement_timeout=settings.main_db.statement_timeout,
+    lock_timeout=settings.main_db.lock_timeout,
+    pooler_mode=settings.main_db.pooler_mode,
+    pooler_pool_size=settings.main_db.pooler_pool_size,
+    replica_urls=settings.main_db.replica_urls,
+    replica_max_lag=settings.main_db.replica_max_lag,
+    replica_lag_check_interval=settings.main_db.replica_lag_check_interval,
+    read_your_writes_seconds=settings.main_db.read_your_writes_seconds,
 )
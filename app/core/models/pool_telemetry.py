@@ -0,0 +1,219 @@
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, Pool
+
+from core.metrics import Counter, Gauge, Histogram
+
+CHECKED_OUT_AT_KEY = "checked_out_at"
+CHECKOUT_WAIT_KEY = "checkout_wait"
+
+connection_checkouts = Counter(
+    "db_connection_checkouts_total",
+    "The number of connections checked out from the pool",
+    label_names=("database",),
+)
+connection_hold_seconds = Histogram(
+    "db_connection_hold_seconds",
+    "How long a connection is held out of the pool",
+    label_names=("database",),
+)
+checkout_wait_seconds = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "How long a checkout waits for a pooled or a new connection",
+    label_names=("database",),
+    buckets=(
+        0.0001,
+        0.0005,
+        0.001,
+        0.005,
+        0.01,
+        0.05,
+        0.1,
+        0.5,
+        1.0,
+        5.0,
+        10.0,
+        30.0,
+    ),
+)
+connections_opened = Counter(
+    "db_connections_opened_total",
+    "The number of database connections opened by the pool",
+    label_names=("database",),
+)
+connections_invalidated = Counter(
+    "db_connections_invalidated_total",
+    "The number of pooled connections invalidated because of errors",
+    label_names=("database",),
+)
+connection_lifetime_seconds = Histogram(
+    "db_connection_lifetime_seconds",
+    "Age of the database connections at close",
+    label_names=("database",),
+    buckets=(1.0, 10.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 7200.0, 14400.0),
+)
+pool_checked_out = Gauge(
+    "db_pool_checked_out_connections",
+    "The number of connections currently checked out from the pool",
+    label_names=("database",),
+)
+pool_overflow = Gauge(
+    "db_pool_overflow_connections",
+    "The number of overflow connections currently open over the pool size",
+    label_names=("database",),
+)
+pool_idle = Gauge(
+    "db_pool_idle_connections",
+    "The number of connections currently idle in the pool",
+    label_names=("database",),
+)
+oldest_connection_age = Gauge(
+    "db_pool_oldest_connection_age_seconds",
+    "Age of the oldest open connection of the pool",
+    label_names=("database",),
+)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool measuring how long each checkout waits for a connection,
+    including waiting for a connection to be returned and opening a new one."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started_at = time.perf_counter()
+        connection_record = super()._do_get()
+        connection_record.info[CHECKOUT_WAIT_KEY] = time.perf_counter() - started_at
+
+        return connection_record
+
+
+class PoolTelemetry:
+    """Collects the engine's connection pool statistics from the pool events and
+    exports them as metrics labeled by the database name.
+
+    Attributes:
+        engine (AsyncEngine): Async engine of the pool
+        database (str): Database name used as the metrics label
+        checkouts (int): The number of checkouts
+        checkout_wait_total (float): Total checkout wait time in seconds
+        checkout_wait_max (float): The longest checkout wait time in seconds
+        connections_opened (int): The number of opened connections
+        connections_invalidated (int): The number of invalidated connections
+    """
+
+    def __init__(self, engine: AsyncEngine, database: str) -> None:
+        """Inits PoolTelemetry and starts listening to the engine's pool events.
+
+        Args:
+            engine (AsyncEngine): Async engine to listen to
+            database (str): Database name used as the metrics label
+        """
+
+        self.engine = engine
+        self.database = database
+        self.checkouts = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+        self.connections_opened = 0
+        self.connections_invalidated = 0
+        self._connected_at: dict[int, float] = {}
+
+        event.listen(engine.sync_engine, "connect", self._on_connect)
+        event.listen(engine.sync_engine, "checkout", self._on_checkout)
+        event.listen(engine.sync_engine, "checkin", self._on_checkin)
+        event.listen(engine.sync_engine, "invalidate", self._on_invalidate)
+        event.listen(engine.sync_engine, "close", self._on_close)
+
+        pool_checked_out.set_function(
+            lambda: self.stats()["checked_out"], database=database
+        )
+        pool_overflow.set_function(lambda: self.stats()["overflow"], database=database)
+        pool_idle.set_function(lambda: self.stats()["idle"], database=database)
+        oldest_connection_age.set_function(
+            lambda: self.stats()["oldest_connection_age"], database=database
+        )
+
+    @property
+    def pool(self) -> Pool:
+        """The engine's current pool, which is replaced on engine dispose.
+
+        Returns:
+            Pool: Connection pool
+        """
+
+        return self.engine.sync_engine.pool
+
+    def stats(self) -> dict:
+        """Provides the pool's current state and the statistics collected since the
+        start.
+
+        Returns:
+            dict: Dict with the pool statistics
+        """
+
+        pool = self.pool
+        now = time.monotonic()
+        is_queue_pool = isinstance(pool, AsyncAdaptedQueuePool)
+
+        return {
+            "database": self.database,
+            "pool_class": type(pool).__name__,
+            "size": pool.size() if is_queue_pool else 0,
+            "max_overflow": pool._max_overflow if is_queue_pool else 0,
+            "checked_out": pool.checkedout() if is_queue_pool else 0,
+            "overflow": max(pool.overflow(), 0) if is_queue_pool else 0,
+            "idle": pool.checkedin() if is_queue_pool else 0,
+            "open_connections": len(self._connected_at),
+            "oldest_connection_age": max(
+                (now - connected_at for connected_at in self._connected_at.values()),
+                default=0.0,
+            ),
+            "checkouts": self.checkouts,
+            "checkout_wait_avg": (
+                self.checkout_wait_total / self.checkouts if self.checkouts else 0.0
+            ),
+            "checkout_wait_max": self.checkout_wait_max,
+            "connections_opened": self.connections_opened,
+            "connections_invalidated": self.connections_invalidated,
+        }
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        self.connections_opened += 1
+        connections_opened.inc(database=self.database)
+
+        self._connected_at[id(connection_record)] = time.monotonic()
+
+    def _on_checkout(
+        self, dbapi_connection, connection_record, connection_proxy
+    ) -> None:
+        self.checkouts += 1
+        connection_checkouts.inc(database=self.database)
+
+        connection_record.info[CHECKED_OUT_AT_KEY] = time.perf_counter()
+        wait = connection_record.info.pop(CHECKOUT_WAIT_KEY, None)
+
+        if wait is not None:
+            self.checkout_wait_total += wait
+            self.checkout_wait_max = max(self.checkout_wait_max, wait)
+            checkout_wait_seconds.observe(wait, database=self.database)
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        checked_out_at = connection_record.info.pop(CHECKED_OUT_AT_KEY, None)
+
+        if checked_out_at is not None:
+            connection_hold_seconds.observe(
+                time.perf_counter() - checked_out_at, database=self.database
+            )
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        self.connections_invalidated += 1
+        connections_invalidated.inc(database=self.database)
+
+    def _on_close(self, dbapi_connection, connection_record) -> None:
+        connected_at = self._connected_at.pop(id(connection_record), None)
+
+        if connected_at is not None:
+            connection_lifetime_seconds.observe(
+                time.monotonic() - connected_at, database=self.database
+            )
@@ -0,0 +1,117 @@
+import base64
+import binascii
+import datetime
+import json
+from typing import Any, Generic, TypeVar
+
+from fastapi import Query
+from pydantic import BaseModel
+from sqlalchemy.orm import InstrumentedAttribute
+
+from core.config import settings
+from core.exceptions import InvalidCursor
+
+T = TypeVar("T")
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """A page of items retrieved with keyset pagination.
+
+    Attributes:
+        items (list[T]): Items of the page
+        next_cursor (str | None): Opaque cursor to retrieve the next page or None if
+        the page is the last one
+    """
+
+    items: list[T]
+    next_cursor: str | None = None
+
+
+class PaginationParams(BaseModel):
+    """Keyset pagination query parameters.
+
+    Attributes:
+        cursor (str | None): Opaque cursor returned with the previous page
+        limit (int): Maximum number of items in the page
+    """
+
+    cursor: str | None = None
+    limit: int = settings.pagination.default_limit
+
+
+def get_pagination_params(
+    cursor: str | None = Query(
+        default=None,
+        description="Cursor returned with the previous page as 'next_cursor'",
+    ),
+    limit: int = Query(
+        default=settings.pagination.default_limit,
+        ge=1,
+        le=settings.pagination.max_limit,
+        description="Maximum number of items in the page",
+    ),
+) -> PaginationParams:
+    """Provides keyset pagination parameters from the query string.
+
+    Args:
+        cursor (str | None): Cursor returned with the previous page
+        limit (int): Maximum number of items in the page
+
+    Returns:
+        PaginationParams: Pagination parameters
+    """
+
+    return PaginationParams(cursor=cursor, limit=limit)
+
+
+def encode_cursor(sort_value: Any, item_id: int) -> str:
+    """Builds an opaque cursor pointing to the item with provided sort key and id.
+
+    Args:
+        sort_value (Any): Value of the item's sort column
+        item_id (int): Item id
+
+    Returns:
+        str: Url safe cursor string
+    """
+
+    if isinstance(sort_value, (datetime.datetime, datetime.date)):
+        sort_value = sort_value.isoformat()
+
+    raw_cursor = json.dumps([sort_value, item_id], separators=(",", ":"))
+
+    return base64.urlsafe_b64encode(raw_cursor.encode()).decode()
+
+
+def decode_cursor(cursor: str, sort_column: InstrumentedAttribute) -> tuple[Any, int]:
+    """Restores sort key and id from the opaque cursor.
+
+    Args:
+        cursor (str): Cursor built by encode_cursor
+        sort_column (InstrumentedAttribute): Model column the cursor was built for
+
+    Raises:
+        InvalidCursor: If the cursor is malformed
+
+    Returns:
+        tuple[Any, int]: Sort key value and item id
+    """
+
+    try:
+        sort_value, item_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+
+        python_type = sort_column.type.python_type
+
+        if issubclass(python_type, datetime.datetime):
+            sort_value = datetime.datetime.fromisoformat(sort_value)
+        elif issubclass(python_type, datetime.date):
+            sort_value = datetime.date.fromisoformat(sort_value)
+        elif not isinstance(sort_value, python_type):
+            raise InvalidCursor
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as error:
+        raise InvalidCursor from error
+
+    if not isinstance(item_id, int):
+        raise InvalidCursor
+
+    return sort_value, item_id
@@ -0,0 +1,218 @@
+import logging
+import time
+from collections import Counter
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised in strict mode when a request exceeds its statements budget or repeats
+    the same statement too many times."""
+
+
+@dataclass
+class QueryStats:
+    """Sql statements statistics of a single request.
+
+    Attributes:
+        budget (int): The number of statements the request may issue
+        count (int): The number of executed statements
+        duration (float): Total statements execution time in seconds
+        statements (Counter[str]): Executions count by statement text
+        parameter_sets (dict[str, set[int]]): Hashes of the distinct parameters the
+        statement was executed with by statement text
+    """
+
+    budget: int
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+    parameter_sets: dict[str, set[int]] = field(default_factory=dict)
+
+    @property
+    def repeated_statements(self) -> dict[str, int]:
+        """Statements executed with at least the threshold number of distinct
+        parameters, which is the N+1 pattern. The same statement executed again
+        with the same parameters isn't a N+1.
+
+        Returns:
+            dict[str, int]: The number of distinct parameters by statement text
+        """
+
+        threshold = settings.query_stats.repeated_statement_threshold
+
+        return {
+            statement: len(parameter_sets)
+            for statement, parameter_sets in self.parameter_sets.items()
+            if len(parameter_sets) >= threshold
+        }
+
+    def register_statement(self, statement: str, parameters) -> None:
+        """Counts the statement, raises in strict mode if the request exceeds the
+        budget or repeats the statement with different parameters too many times.
+
+        Args:
+            statement (str): Sql statement text
+            parameters: Statement parameters as passed to the DBAPI cursor
+
+        Raises:
+            QueryBudgetExceeded: If the budget is exceeded or the statement is repeated
+            too many times in strict mode
+        """
+
+        self.count += 1
+        self.statements[statement] += 1
+        parameter_sets = self.parameter_sets.setdefault(statement, set())
+        parameter_sets.add(hash(repr(parameters)))
+
+        if not settings.query_stats.raise_on_exceed:
+            return
+
+        if self.count > self.budget:
+            raise QueryBudgetExceeded(
+                f"Request exceeded the budget of {self.budget} statements"
+            )
+
+        if len(parameter_sets) >= settings.query_stats.repeated_statement_threshold:
+            raise QueryBudgetExceeded(
+                f"Statement executed with {len(parameter_sets)} different parameters: "
+                f"{statement}"
+            )
+
+    def report(self, path: str) -> None:
+        """Logs the request's budget excess and N+1 patterns.
+
+        Args:
+            path (str): Route path of the request
+        """
+
+        if self.count > self.budget:
+            logger.warning(
+                "%s issued %d statements in %.1f ms, the budget is %d",
+                path,
+                self.count,
+                self.duration * 1000,
+                self.budget,
+            )
+
+        for statement, count in self.repeated_statements.items():
+            logger.warning(
+                "%s executed the same statement with %d different parameters, "
+                "possible N+1: %s",
+                path,
+                count,
+                statement,
+            )
+
+
+query_stats_var: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def query_budget(max_statements: int) -> Callable[[], None]:
+    """Builds a dependency setting the route's statements budget.
+
+    Args:
+        max_statements (int): The number of statements the route may issue
+
+    Returns:
+        Callable[[], None]: Dependency to use in the route's dependencies
+    """
+
+    def set_query_budget() -> None:
+        stats = query_stats_var.get()
+
+        if stats is not None:
+            stats.budget = max_statements
+
+    return set_query_budget
+
+
+def register_query_stats_events(engine: AsyncEngine) -> None:
+    """Counts statements and their execution time of the engine in the current
+    request's statistics.
+
+    Args:
+        engine (AsyncEngine): Async engine to listen to
+    """
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        stats = query_stats_var.get()
+
+        if stats is None:
+            return
+
+        stats.register_statement(statement, parameters)
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        stats = query_stats_var.get()
+
+        if stats is None or not conn.info.get("query_start_time"):
+            return
+
+        stats.duration += time.perf_counter() - conn.info["query_start_time"].pop()
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def handle_error(exception_context) -> None:
+        connection = exception_context.connection
+
+        if connection is not None and connection.info.get("query_start_time"):
+            connection.info["query_start_time"].pop()
+
+
+class QueryStatsMiddleware:
+    """ASGI middleware collecting sql statements statistics of every http request.
+
+    Adds "X-Query-Count" and "X-Query-Time" (milliseconds) headers with the
+    statistics collected before the response has started and reports the budget
+    excess and N+1 patterns when the response has finished.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Inits QueryStatsMiddleware.
+
+        Args:
+            app (ASGIApp): ASGI application to wrap
+        """
+
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(budget=settings.query_stats.default_budget)
+        token = query_stats_var.set(stats)
+
+        async def send_with_stats(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Query-Count", str(stats.count))
+                headers.append("X-Query-Time", f"{stats.duration * 1000:.1f}")
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            query_stats_var.reset(token)
+
+            route = scope.get("route")
+            stats.report(getattr(route, "path", scope["path"]))
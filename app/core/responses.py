@@ -0,0 +1,38 @@
+import importlib.util
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from core.config import settings
+
+PERFORMANCE_PROFILE_MODULES = ("orjson", "uvloop", "httptools")
+
+
+def get_default_response_class() -> type[JSONResponse]:
+    """Provides the api routes' response class, ORJSONResponse with the performance
+    profile enabled.
+
+    Raises:
+        RuntimeError: If the performance profile is enabled and its packages aren't
+        installed
+
+    Returns:
+        type[JSONResponse]: Default response class of the api routes
+    """
+
+    if not settings.run.performance_profile:
+        return JSONResponse
+
+    missing_modules = [
+        module
+        for module in PERFORMANCE_PROFILE_MODULES
+        if importlib.util.find_spec(module) is None
+    ]
+
+    if missing_modules:
+        raise RuntimeError(
+            "The performance profile requires the packages: "
+            + ", ".join(missing_modules)
+            + ", install them with `poetry install --with performance`"
+        )
+
+    return ORJSONResponse
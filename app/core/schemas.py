@@ -0,0 +1,33 @@
+from typing import Any
+
+from pydantic import BaseModel, field_validator
+
+
+class PartialUpdateSchema(BaseModel):
+    """Base schema for partial updates.
+
+    All the fields must be optional, only the fields set in the request are updated.
+    Fields can be omitted, but can't be explicitly set to null.
+    """
+
+    model_config = {"from_attributes": True}
+
+    @field_validator("*")
+    @classmethod
+    def check_not_null(cls, value: Any) -> Any:
+        """Rejects explicit null values, defaults aren't validated.
+
+        Args:
+            value (Any): Field value
+
+        Raises:
+            ValueError: If value is None
+
+        Returns:
+            Any: Field value
+        """
+
+        if value is None:
+            raise ValueError("Field can't be null")
+
+        return value
@@ -0,0 +1,279 @@
+import asyncio
+import contextvars
+import logging
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.config import settings
+from core.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+START_TIME_KEY = "slow_query_start_time"
+EXPLAIN_OPTION = "slow_query_explain"
+EXPLAIN_PREFIX = "EXPLAIN (ANALYZE, BUFFERS) "
+MAX_PENDING_EXPLAINS = 2
+
+slow_queries_total = Counter(
+    "db_slow_queries_total",
+    "The number of statements running longer than the slow query threshold",
+    label_names=("database",),
+)
+
+request_scope_var: ContextVar[Scope | None] = ContextVar("request_scope", default=None)
+
+
+@dataclass
+class SlowQuery:
+    """A statement running longer than the slow query threshold.
+
+    Attributes:
+        database (str): Name of the database the statement ran on
+        statement (str): Sql statement text
+        parameters (str | None): Bound parameters representation, None if the
+        parameters aren't logged
+        duration (float): Execution time in seconds
+        route (str | None): Method and route path of the request issued the
+        statement, None outside of a request
+        executed_at (datetime): When the statement finished
+        plan (str | None): EXPLAIN (ANALYZE, BUFFERS) output, None until captured or
+        if the statement isn't explained
+    """
+
+    database: str
+    statement: str
+    parameters: str | None
+    duration: float
+    route: str | None
+    executed_at: datetime
+    plan: str | None = None
+
+
+class SlowQueryLog:
+    """Ring buffer of the latest slow statements of the worker process."""
+
+    def __init__(self) -> None:
+        """Inits SlowQueryLog with the configured size."""
+
+        self.queries: deque[SlowQuery] = deque(
+            maxlen=settings.slow_queries.explain_buffer_size
+        )
+        self._explain_tasks: set[asyncio.Task] = set()
+
+    def add(self, query: SlowQuery) -> None:
+        """Adds the slow statement, dropping the oldest one if the buffer is full.
+
+        Args:
+            query (SlowQuery): Slow statement to add
+        """
+
+        self.queries.append(query)
+
+    def get_queries(self) -> list[dict]:
+        """Provides the kept slow statements, the latest first.
+
+        Returns:
+            list[dict]: Dicts with the slow statements, see SlowQuery
+        """
+
+        return [asdict(query) for query in reversed(self.queries)]
+
+    def explain(self, engine: AsyncEngine, query: SlowQuery, parameters) -> None:
+        """Starts capturing the statement's plan in the background, outside of the
+        request's context, so the request doesn't wait for it and the request's
+        deadline and statistics don't apply. Skipped if too many plans are already
+        being captured.
+
+        Args:
+            engine (AsyncEngine): Async engine the statement ran on
+            query (SlowQuery): Slow statement to explain
+            parameters: Statement's bound parameters in the driver format
+        """
+
+        if len(self._explain_tasks) >= MAX_PENDING_EXPLAINS:
+            logger.debug("Skipped the slow query plan capture: %s", query.statement)
+            return
+
+        task = asyncio.get_running_loop().create_task(
+            capture_plan(engine, query, parameters), context=contextvars.Context()
+        )
+        self._explain_tasks.add(task)
+        task.add_done_callback(self._explain_tasks.discard)
+
+
+slow_query_log = SlowQueryLog()
+
+
+def format_parameters(parameters) -> str:
+    """Builds the parameters representation truncated to the configured length.
+
+    Args:
+        parameters: Statement's bound parameters
+
+    Returns:
+        str: Parameters representation
+    """
+
+    representation = repr(parameters)
+    max_length = settings.slow_queries.max_parameters_length
+
+    if len(representation) > max_length:
+        return f"{representation[:max_length]}... ({len(representation)} chars)"
+
+    return representation
+
+
+def get_request_route() -> str | None:
+    """Provides the method and the route path of the current request. The route is
+    resolved by the router on the same scope, the request path is used before it.
+
+    Returns:
+        str | None: Method and route path, None outside of a request
+    """
+
+    scope = request_scope_var.get()
+
+    if scope is None:
+        return None
+
+    route = scope.get("route")
+
+    return f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+
+
+def is_select(statement: str) -> bool:
+    """Checks if the statement is a select, which is safe to run again.
+
+    Args:
+        statement (str): Sql statement text
+
+    Returns:
+        bool: True if the statement is a select
+    """
+
+    return statement.lstrip().upper().startswith(("SELECT", "WITH"))
+
+
+async def capture_plan(engine: AsyncEngine, query: SlowQuery, parameters) -> None:
+    """Runs the statement again with EXPLAIN (ANALYZE, BUFFERS) on a separate
+    connection in a read only transaction and stores the plan in the slow query.
+    The plan is built with the committed data, the changes of the issuing
+    transaction aren't seen.
+
+    Args:
+        engine (AsyncEngine): Async engine the statement ran on
+        query (SlowQuery): Slow statement to explain
+        parameters: Statement's bound parameters in the driver format
+    """
+
+    try:
+        async with engine.connect() as connection:
+            connection = await connection.execution_options(**{EXPLAIN_OPTION: True})
+            await connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+            result = await connection.exec_driver_sql(
+                EXPLAIN_PREFIX + query.statement, parameters
+            )
+            query.plan = "\n".join(row[0] for row in result)
+            await connection.rollback()
+    except SQLAlchemyError:
+        logger.exception("Failed to capture the slow query plan: %s", query.statement)
+
+
+def register_slow_query_events(engine: AsyncEngine, database: str) -> None:
+    """Logs the engine's statements running longer than the threshold along with
+    their parameters and the issuing route, and keeps them in the slow query log.
+    Captures the plans of the slow select statements if enabled.
+
+    Args:
+        engine (AsyncEngine): Async engine to listen to
+        database (str): Name of the database in the log
+    """
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        conn.info.setdefault(START_TIME_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        if not conn.info.get(START_TIME_KEY):
+            return
+
+        duration = time.perf_counter() - conn.info[START_TIME_KEY].pop()
+
+        if (
+            duration < settings.slow_queries.threshold
+            or conn.get_execution_options().get(EXPLAIN_OPTION)
+        ):
+            return
+
+        query = SlowQuery(
+            database=database,
+            statement=statement,
+            parameters=(
+                format_parameters(parameters)
+                if settings.slow_queries.log_parameters
+                else None
+            ),
+            duration=duration,
+            route=get_request_route(),
+            executed_at=datetime.now(timezone.utc),
+        )
+        slow_queries_total.inc(database=database)
+        slow_query_log.add(query)
+
+        logger.warning(
+            "Slow query on %s took %.1f ms in %s: %s; parameters: %s",
+            database,
+            duration * 1000,
+            query.route,
+            statement,
+            query.parameters,
+        )
+
+        if settings.slow_queries.explain and not executemany and is_select(statement):
+            slow_query_log.explain(engine, query, parameters)
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def handle_error(exception_context) -> None:
+        connection = exception_context.connection
+
+        if connection is not None and connection.info.get(START_TIME_KEY):
+            connection.info[START_TIME_KEY].pop()
+
+
+class SlowQueryMiddleware:
+    """ASGI middleware exposing the current http request to the slow query log, so
+    a slow statement is logged with the route issued it."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Inits SlowQueryMiddleware.
+
+        Args:
+            app (ASGIApp): ASGI application to wrap
+        """
+
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = request_scope_var.set(scope)
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_scope_var.reset(token)
@@ -0,0 +1,224 @@
+import asyncio
+import logging
+import random
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from functools import wraps
+from typing import Literal, ParamSpec, TypeVar
+
+from sqlalchemy import inspect, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.exceptions import TransactionConflict
+from core.loader import clear_model_loaders
+from core.metrics import Counter
+from core.model_adapter import ModelAdapter
+from core.models import db_connector
+
+logger = logging.getLogger(__name__)
+
+SERIALIZATION_FAILURE = "40001"
+DEADLOCK_DETECTED = "40P01"
+RETRYABLE_SQLSTATES = (SERIALIZATION_FAILURE, DEADLOCK_DETECTED)
+
+IsolationLevel = Literal["READ COMMITTED", "REPEATABLE READ", "SERIALIZABLE"]
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+transaction_retries = Counter(
+    "db_transaction_retries_total",
+    "The number of operation retries after a serialization failure or a deadlock",
+    label_names=("operation", "sqlstate"),
+)
+transaction_conflicts = Counter(
+    "db_transaction_conflicts_total",
+    "The number of operations failed after all the retries",
+    label_names=("operation",),
+)
+
+
+class TransactionHasChanges(RuntimeError):
+    """Raised when a transactional operation starts in a transaction which already
+    has changes, as retrying the operation would roll them back and commit only the
+    operation's own changes."""
+
+
+def get_service_session(service: object) -> AsyncSession:
+    """Finds the session of the service's adapter.
+
+    Args:
+        service (object): Service instance holding a model adapter
+
+    Raises:
+        TypeError: If the service has no model adapter
+
+    Returns:
+        AsyncSession: Session of the service's adapter
+    """
+
+    for value in vars(service).values():
+        if isinstance(value, ModelAdapter):
+            return value.session
+
+    raise TypeError(f"{type(service).__name__} has no model adapter")
+
+
+def get_sqlstate(error: DBAPIError) -> str | None:
+    """Provides the Postgres error code of the database error.
+
+    Args:
+        error (DBAPIError): Database error
+
+    Returns:
+        str | None: SQLSTATE code if the error comes from Postgres
+    """
+
+    return getattr(error.orig, "sqlstate", None)
+
+
+def get_retry_delay(attempt: int) -> float:
+    """Provides a random delay before the retry, its upper bound grows exponentially
+    with the attempt number, so concurrent conflicting operations spread out.
+
+    Args:
+        attempt (int): Number of the failed attempt, starting from 1
+
+    Returns:
+        float: Delay in seconds
+    """
+
+    return random.uniform(
+        0,
+        min(
+            settings.transactions.backoff_max,
+            settings.transactions.backoff_base * 2 ** (attempt - 1),
+        ),
+    )
+
+
+async def begin_transaction(
+    session: AsyncSession, isolation_level: IsolationLevel | None
+) -> None:
+    """Begins the session's own transaction for the operation with the isolation
+    level. The already begun read only transaction is committed first.
+
+    Args:
+        session (AsyncSession): Async database session
+        isolation_level (IsolationLevel | None): Isolation level of the
+        transaction, the database default if not provided
+
+    Raises:
+        TransactionHasChanges: If the session has changes made before the operation
+    """
+
+    await db_connector.release_connection(session)
+
+    if session.in_transaction() or session.new or session.dirty or session.deleted:
+        raise TransactionHasChanges(
+            "A transactional operation can't join a transaction with changes, "
+            "commit them first"
+        )
+
+    if isolation_level is not None:
+        await session.connection(execution_options={"isolation_level": isolation_level})
+
+
+async def reload_session_objects(session: AsyncSession) -> None:
+    """Loads again the objects expired by the rollback, with a query per model, so
+    the objects loaded before the failed attempt are usable by the next one.
+
+    Args:
+        session (AsyncSession): Async database session
+    """
+
+    clear_model_loaders(session)
+
+    ids_by_model: dict[type, set] = defaultdict(set)
+
+    for item in session.identity_map.values():
+        ids_by_model[type(item)].add(inspect(item).identity[0])
+
+    for model, ids in ids_by_model.items():
+        primary_key = inspect(model).primary_key[0]
+
+        await session.execute(
+            select(model)
+            .where(primary_key.in_(ids))
+            .execution_options(populate_existing=True)
+        )
+
+
+def transactional(
+    isolation_level: IsolationLevel | None = None, max_attempts: int | None = None
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Makes the service method a single transaction committed on success. The
+    whole method is run again after a random delay when the transaction fails with
+    a serialization failure or a deadlock.
+
+    The method must be idempotent up to its commit, its changes are rolled back
+    before the next attempt. The session is found in the service's model adapter,
+    it must have no changes made before the method, so a retry can't roll them back.
+
+    Args:
+        isolation_level (IsolationLevel | None): Isolation level of the
+        transaction, the database default if not provided
+        max_attempts (int | None): The number of times the method runs before the
+        conflict is reported. settings.transactions.max_attempts if not provided
+
+    Raises:
+        TransactionConflict: If the last attempt fails with a serialization failure
+        or a deadlock
+        TransactionHasChanges: If the session has changes made before the method
+
+    Returns:
+        Callable: Decorator of the service method
+    """
+
+    def decorator(method: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        operation = method.__qualname__
+
+        @wraps(method)
+        async def wrapper(self, *args: P.args, **kwargs: P.kwargs) -> R:
+            session = get_service_session(self)
+            attempts = max_attempts or settings.transactions.max_attempts
+
+            for attempt in range(1, attempts + 1):
+                try:
+                    await begin_transaction(session, isolation_level)
+
+                    if attempt > 1:
+                        await reload_session_objects(session)
+
+                    result = await method(self, *args, **kwargs)
+                    await session.commit()
+
+                    return result
+                except DBAPIError as error:
+                    sqlstate = get_sqlstate(error)
+
+                    if sqlstate not in RETRYABLE_SQLSTATES:
+                        raise
+
+                    await session.rollback()
+
+                    if attempt == attempts:
+                        transaction_conflicts.inc(operation=operation)
+                        raise TransactionConflict from error
+
+                    transaction_retries.inc(operation=operation, sqlstate=sqlstate)
+                    logger.info(
+                        "%s failed with %s, attempt %d of %d",
+                        operation,
+                        sqlstate,
+                        attempt,
+                        attempts,
+                    )
+
+                    await asyncio.sleep(get_retry_delay(attempt))
+
+        return wrapper
+
+    return decorator
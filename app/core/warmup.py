@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from functools import partial
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from core.config import settings
+from core.models import User, db_connector
+from core.redis import redis_connector
+from structures.adapters.relation_adapter import RelationAdapter
+from structures.adapters.role_adapter import RoleAdapter
+from work_tasks.adapters.work_task_adapter import WorkTaskAdapter
+from work_tasks.schemas import WorkTaskOut
+
+logger = logging.getLogger(__name__)
+
+WARMUP_ID = 0
+
+
+async def prepare_statements(session: AsyncSession) -> None:
+    """Runs the hot adapter statements with an id matching no rows, so the
+    connection's asyncpg statement cache holds them prepared.
+
+    Args:
+        session (AsyncSession): Async session bound to the connection to warm up
+    """
+
+    await User.get_db(session).get(WARMUP_ID)
+    await RoleAdapter(session).read_item_by_id(WARMUP_ID)
+
+    relations_adapter = RelationAdapter(session)
+    await relations_adapter.get_relation_by_superior_id_and_suboridinate_id(
+        WARMUP_ID, WARMUP_ID
+    )
+    await relations_adapter.get_subordinate_ids_of_superior(WARMUP_ID, [WARMUP_ID])
+
+    tasks_adapter = WorkTaskAdapter(session)
+    await tasks_adapter.get_user_assigned_tasks(WARMUP_ID, schema=WorkTaskOut)
+    await tasks_adapter.get_user_created_tasks(WARMUP_ID, schema=WorkTaskOut)
+
+
+async def warm_up_connection(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Checks a connection out of the pool, opening it if needed, and prepares the
+    hot statements on it.
+
+    Args:
+        session_factory (async_sessionmaker[AsyncSession]): Session factory of the
+        database to warm up
+    """
+
+    async with session_factory() as session:
+        await session.connection()
+
+        if (
+            settings.warmup.prepare_statements
+            and settings.main_db.pooler_mode != "transaction"
+        ):
+            await prepare_statements(session)
+
+
+async def warm_up_database(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    """Opens the configured number of the database pool connections at once, so
+    every one of them is a separate connection. Only the connections kept by the
+    pool are opened, a pool without kept connections isn't warmed up. In the
+    "transaction" pooler mode no statements are prepared, as they aren't cached.
+
+    Args:
+        session_factory (async_sessionmaker[AsyncSession]): Session factory of the
+        database to warm up
+    """
+
+    pool = session_factory.kw["bind"].sync_engine.pool
+    pool_size = pool.size() if isinstance(pool, QueuePool) else 0
+    connections = min(settings.warmup.db_connections, pool_size)
+
+    await asyncio.gather(
+        *(warm_up_connection(session_factory) for _ in range(connections))
+    )
+
+
+async def ping_redis() -> None:
+    """Opens a redis pool connection."""
+
+    await redis_connector.get_client().ping()
+
+
+async def run_step(name: str, step: Callable[[], Awaitable[None]]) -> None:
+    """Runs the warm-up step and logs its duration. A failed step is logged and
+    doesn't prevent the worker from starting, the requests pay for the cold start
+    instead.
+
+    Args:
+        name (str): Name of the step to log
+        step (Callable[[], Awaitable[None]]): The step to run
+    """
+
+    started_at = time.perf_counter()
+
+    try:
+        await step()
+    except Exception:
+        logger.exception(
+            "Warm-up step %r failed in %.1f ms",
+            name,
+            (time.perf_counter() - started_at) * 1000,
+        )
+    else:
+        logger.info(
+            "Warm-up step %r took %.1f ms",
+            name,
+            (time.perf_counter() - started_at) * 1000,
+        )
+
+
+async def warm_up() -> None:
+    """Opens the database and redis pools connections and prepares the hot
+    statements, so the first requests after the worker start don't pay for it."""
+
+    if not settings.warmup.enabled:
+        return
+
+    started_at = time.perf_counter()
+
+    if settings.warmup.redis:
+        await run_step("redis", ping_redis)
+
+    await run_step(
+        "primary database", partial(warm_up_database, db_connector.session_factory)
+    )
+
+    for index, replica in enumerate(db_connector.replicas):
+        await run_step(
+            f"replica {index}", partial(warm_up_database, replica.session_factory)
+        )
+
+    logger.info("Warm-up took %.1f ms", (time.perf_counter() - started_at) * 1000)
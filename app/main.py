@@ -3,15 +3,27 @@ from admin.admin_app import admin
 from api_router import router as api_router
 from fastapi import FastAPI
 from starlette.middleware.sessions import SessionMiddleware
+from uvicorn.config import LOGGING_CONFIG
 
 from core.config import settings
 from core.lifespan import lifespan
+from core.logging_setup import setup_logging
+from core.query_stats import QueryStatsMiddleware
+from core.slow_queries import SlowQueryMiddleware
+
+setup_logging()
 
 app = FastAPI(
     lifespan=lifespan,
 )
 app.add_middleware(SessionMiddleware, secret_key=settings.session_middleware.secret_key)
 
+if settings.query_stats.enabled:
+    app.add_middleware(QueryStatsMiddleware)
+
+if settings.slow_queries.enabled:
+    app.add_middleware(SlowQueryMiddleware)
+
 app.include_router(api_router)
 
 admin.mount_to(app)
@@ -23,4 +35,9 @@ if __name__ == "__main__":
         host=settings.run.host,
         port=settings.run.port,
         reload=settings.run.auto_reload,
+        workers=settings.run.workers,
+        limit_max_requests=settings.run.max_requests or None,
+        loop="uvloop" if settings.run.performance_profile else "auto",
+        http="httptools" if settings.run.performance_profile else "auto",
+        log_config=None if settings.logging.enabled else LOGGING_CONFIG,
     )
@@ -1,9 +1,13 @@
-from sqlalchemy import select
+import datetime
+
+from pydantic import BaseModel
+from sqlalchemy import Integer, Row, any_, delete, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from core.model_adapter import ModelAdapter
-from meetings.models import Meeting
+from meetings.models import Meeting, association_table
 from meetings.schemas.meeting import MeetingCreate
 from users.models import User
 
@@ -54,8 +58,7 @@ class MeetingAdapter(ModelAdapter):
         meeting = Meeting(**meeting_schema.model_dump(), creator_id=current_user_id)
 
         self.session.add(meeting)
-        await self.session.commit()
-        await self.session.refresh(meeting)
+        await self.session.flush()
 
         return meeting
 
@@ -73,7 +76,7 @@ class MeetingAdapter(ModelAdapter):
         meeting.users.append(user)
 
         self.session.add(meeting)
-        await self.session.commit()
+        await self.session.flush()
 
         return meeting
 
@@ -91,22 +94,75 @@ class MeetingAdapter(ModelAdapter):
         meeting.users.remove(user)
 
         self.session.add(meeting)
-        await self.session.commit()
+        await self.session.flush()
 
         return meeting
 
-    async def read_by_user_id(self, user_id: int) -> list[Meeting]:
-        """Gets user meetings by provided user id.
+    async def read_by_user_id(
+        self,
+        user_id: int,
+        date_from: datetime.datetime,
+        date_to: datetime.datetime | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+        schema: type[BaseModel] | None = None,
+    ) -> tuple[list[Meeting | Row], str | None]:
+        """Gets a page of user meetings by provided user id ordered by meet datetime.
 
         Args:
             user_id (int): User id
+            date_from (datetime.datetime): The earliest meet datetime to include
+            date_to (datetime.datetime | None): Meet datetime to include meetings
+            before. Not limited by default
+            cursor (str | None): Cursor returned with the previous page
+            limit (int | None): Maximum number of meetings in the page
+            schema (type[BaseModel] | None): Response schema to select the columns
+            for. Meeting objects are loaded if not provided
 
         Returns:
-            list[Meeting]: List of Meeting objects
+            tuple[list[Meeting | Row], str | None]: List of Meeting objects or rows and
+            the next page cursor
         """
 
-        stmt = select(User).options(joinedload(User.meetings)).where(User.id == user_id)
+        stmt = (
+            select(Meeting)
+            .join(association_table, association_table.c.meeting_id == Meeting.id)
+            .where(
+                association_table.c.user_id == user_id,
+                Meeting.meet_datetime >= date_from,
+            )
+        )
+
+        if date_to is not None:
+            stmt = stmt.where(Meeting.meet_datetime < date_to)
+
+        return await self.read_page(
+            stmt,
+            sort_column=Meeting.meet_datetime,
+            cursor=cursor,
+            limit=limit,
+            schema=schema,
+        )
+
+    async def bulk_delete_items(self, item_ids: list[int]) -> list[int]:
+        """Deletes meetings with provided ids and their users associations in one
+        transaction.
 
-        user = await self.session.scalar(stmt)
+        Args:
+            item_ids (list[int]): Ids of the meetings to delete
+
+        Returns:
+            list[int]: Ids of the deleted meetings
+        """
+
+        if not item_ids:
+            return []
+
+        await self.session.execute(
+            delete(association_table).where(
+                association_table.c.meeting_id
+                == any_(literal(item_ids, ARRAY(Integer)))
+            )
+        )
 
-        return user.meetings
+        return await super().bulk_delete_items(item_ids)
@@ -1,7 +1,7 @@
 import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, ForeignKey, Table
+from sqlalchemy import Column, ForeignKey, Index, Table
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from starlette.requests import Request
 
@@ -16,6 +16,7 @@ association_table = Table(
     Base.metadata,
     Column("meeting_id", ForeignKey("meetings.id")),
     Column("user_id", ForeignKey("users.id")),
+    Index("ix_meetings_users_association_user_id_meeting_id", "user_id", "meeting_id"),
 )
 
 
@@ -36,6 +37,8 @@ class Meeting(Base):
     )
     creator: Mapped["User"] = relationship(back_populates="created_meetings")
 
+    __table_args__ = (Index("ix_meetings_meet_datetime_id", "meet_datetime", "id"),)
+
     async def __admin_repr__(self, request: Request) -> str:
         """Model's representation in admin.
 
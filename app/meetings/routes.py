@@ -1,20 +1,33 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.batch import BatchResult, batch_query_budget
 from core.config import settings
+from core.deadline import DeadlineRoute
+from core.export import ExportFormat, export_response
 from core.model_adapter import ModelAdapter
 from core.models import User, db_connector
+from core.pagination import CursorPage, PaginationParams, get_pagination_params
 from structures.dependencies.role import current_user_role
-from users.dependencies.fastapi_users_routes import current_user
+from users.dependencies.fastapi_users_routes import current_superuser, current_user
 from users.schemas import UserRead
 
 from .adapters.meeting_adapter import MeetingAdapter
-from .schemas.meeting import MeetingCreate, MeetingOut, MeetingOutUsers, MeetingUpdate
+from .schemas.meeting import (
+    MeetingBatchUpdate,
+    MeetingCreate,
+    MeetingOut,
+    MeetingOutUsers,
+    MeetingPatch,
+    MeetingUpdate,
+)
 from .service import MeetingService
 
 router = APIRouter(
     prefix=settings.prefix.meetings,
     tags=["Meetings"],
+    route_class=DeadlineRoute,
 )
 
 
@@ -55,6 +68,117 @@ async def create_meeting(
     )
 
 
+@router.post(
+    "/batch",
+    response_model=BatchResult[MeetingOut],
+    dependencies=[Depends(batch_query_budget), Depends(current_user_role)],
+    summary="Create a batch of meetings",
+    description="""
+    Creates meetings using the provided list of schemas in a single transaction.
+    Requires authorization, the authenticated user registers as the meetings' creator.
+    Meetings which don't meet the requirements aren't created and are reported in
+    "errors" with their position in the batch.
+
+    Requirements:
+    - The "meet_datetime" datetimes for the meetings must be in the future
+    """,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "The current user unauthorized",
+        },
+    },
+)
+async def create_meetings(
+    meeting_input_schemas: list[MeetingCreate] = Body(
+        ..., max_length=settings.batch.max_size
+    ),
+    current_user: UserRead = Depends(current_user),
+    session: AsyncSession = Depends(db_connector.get_session),
+):
+    meetings_adapter = MeetingAdapter(session)
+
+    meetings_service = MeetingService(meetings_adapter)
+
+    return await meetings_service.create_meetings(
+        creator_id=current_user.id,
+        meeting_create_schemas=meeting_input_schemas,
+    )
+
+
+@router.put(
+    "/batch",
+    response_model=BatchResult[MeetingOut],
+    dependencies=[Depends(batch_query_budget)],
+    summary="Update a batch of meetings",
+    description="""
+    Updates meetings using the provided list of schemas with the meetings' ids in a
+    single transaction. Requires authorization. Meetings which don't meet the
+    requirements aren't updated and are reported in "errors" with their position in
+    the batch.
+
+    Requirements:
+    - The meetings with provided ids must exist
+    - The current user must be creator of the meetings
+    - The "meet_datetime" datetimes for the meetings must be in the future
+    """,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "The current user unauthorized",
+        },
+    },
+)
+async def update_meetings(
+    meeting_input_schemas: list[MeetingBatchUpdate] = Body(
+        ..., max_length=settings.batch.max_size
+    ),
+    current_user: UserRead = Depends(current_user),
+    session: AsyncSession = Depends(db_connector.get_session),
+):
+    meetings_adapter = MeetingAdapter(session)
+
+    meetings_service = MeetingService(meetings_adapter)
+
+    return await meetings_service.update_meetings(
+        user_id=current_user.id,
+        meeting_update_schemas=meeting_input_schemas,
+    )
+
+
+@router.delete(
+    "/batch",
+    response_model=BatchResult[int],
+    dependencies=[Depends(batch_query_budget)],
+    summary="Delete a batch of meetings",
+    description="""
+    Deletes meetings with provided ids in a single transaction. Requires authorization.
+    Returns ids of the deleted meetings, meetings which don't meet the requirements
+    aren't deleted and are reported in "errors" with their position in the batch.
+
+    Parameters:
+    - ids: The ids of the meetings to delete
+
+    Requirements:
+    - The meetings with provided ids must exist
+    - The current user must be creator of the meetings
+    """,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "The current user unauthorized",
+        },
+    },
+)
+async def delete_meetings(
+    ids: list[int] = Query(..., max_length=settings.batch.max_size),
+    current_user: UserRead = Depends(current_user),
+    session: AsyncSession = Depends(db_connector.get_session),
+):
+    meetings_adapter = MeetingAdapter(session)
+
+    meetings_service = MeetingService(meetings_adapter)
+
+    return await meetings_service.delete_meetings(ids, current_user.id)
+
+
 @router.put(
     "/{meeting_id}",
     response_model=MeetingOut,
@@ -100,6 +224,52 @@ async def update_meeting(
     )
 
 
+@router.patch(
+    "/{meeting_id}",
+    response_model=MeetingOut,
+    summary="Partially update a meeting",
+    description="""
+    Updates the provided fields of an existing meeting. Requires authorization.
+    Omitted fields are left unchanged, nothing is written if no field has changed.
+
+    Parameters:
+    - meeting_id: The id of the meeting to update
+
+    Requirements:
+    - A meeting with provided id must exist
+    - The current user must be creator of the meeting
+    - The "meet_datetime" datetime for the meeting, if provided, must be in the future
+    """,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "The current user unauthorized",
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "description": """The meet datetime is in the past;
+                              The current user isn't a creator of the meeting""",
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "A meeting with provided id isn't found",
+        },
+    },
+)
+async def patch_meeting(
+    meeting_id: int,
+    meeting_input_schema: MeetingPatch,
+    current_user: UserRead = Depends(current_user),
+    session: AsyncSession = Depends(db_connector.get_session),
+):
+    meetings_adapter = MeetingAdapter(session)
+
+    meetings_service = MeetingService(meetings_adapter)
+
+    return await meetings_service.update_meeting(
+        meeting_id=meeting_id,
+        user_id=current_user.id,
+        meeting_update_schema=meeting_input_schema,
+    )
+
+
 @router.delete(
     "/{meeting_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -166,6 +336,9 @@ async def delete_meeting(
             "description": """A meeting with provided id isn't found;
                               A user with provided id isn't found""",
         },
+        status.HTTP_409_CONFLICT: {
+            "description": "The operation conflicted with concurrent changes",
+        },
     },
 )
 async def add_user(
@@ -216,6 +389,9 @@ async def add_user(
             "description": """A meeting with provided id isn't found;
                               A user with provided id isn't found""",
         },
+        status.HTTP_409_CONFLICT: {
+            "description": "The operation conflicted with concurrent changes",
+        },
     },
 )
 async def remove_user(
@@ -239,15 +415,22 @@ async def remove_user(
 
 @router.get(
     "/me",
-    response_model=list[MeetingOut],
+    response_model=CursorPage[MeetingOut],
     summary="Get user's meetings",
     description="""
-    Retrieves all the user's meetings. Requires authorization.
+    Retrieves a page of the user's meetings ordered by the "meet_datetime" datetime.
+    Requires authorization.
 
     Parameters:
-    - today: If true retrieves only today meetings, if false - all the user's meetings
+    - today: If true retrieves only today meetings, if false - all the user's upcoming
+    meetings
+    - cursor: The "next_cursor" value of the previous page, omit to get the first page
+    - limit: The maximum number of the meetings in the page
     """,
     responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "The provided cursor is invalid",
+        },
         status.HTTP_401_UNAUTHORIZED: {
             "description": "The current user unauthorized",
         },
@@ -255,13 +438,51 @@ async def remove_user(
 )
 async def get_my_meetings(
     today: bool = False,
+    pagination: PaginationParams = Depends(get_pagination_params),
     current_user: UserRead = Depends(current_user),
-    session: AsyncSession = Depends(db_connector.get_session),
+    session: AsyncSession = Depends(db_connector.get_read_session),
 ):
     meetings_adapter = MeetingAdapter(session)
 
     meetings_service = MeetingService(meetings_adapter)
 
     return await meetings_service.get_user_meetings(
-        user_id=current_user.id, today=today
+        user_id=current_user.id, today=today, pagination=pagination
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    dependencies=[Depends(current_superuser)],
+    summary="Export all the meetings",
+    description="""
+    Streams all the meetings ordered by id as newline delimited JSON or CSV. The
+    meetings are fetched from the database by chunks, so the export runs in constant
+    memory. Requires superuser authorization.
+
+    Parameters:
+    - format: The export format, "ndjson" or "csv"
+    """,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+            "description": "The exported meetings",
+        },
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "The current user unauthorized",
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "description": "The current user is not a superuser",
+        },
+    },
+)
+async def export_meetings(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+):
+    return export_response(
+        adapter_factory=MeetingAdapter,
+        schema=MeetingOut,
+        export_format=export_format,
+        filename="meetings",
     )
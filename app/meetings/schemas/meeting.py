@@ -2,6 +2,7 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 
+from core.schemas import PartialUpdateSchema
 from users.schemas import UserRead
 
 
@@ -22,6 +23,16 @@ class MeetingUpdate(MeetingBase):
     pass
 
 
+class MeetingBatchUpdate(MeetingUpdate):
+    id: int
+
+
+class MeetingPatch(PartialUpdateSchema):
+    topic: str | None = Field(None, example="Introduction")
+    info: str | None = Field(None, example="Team introduction meeting")
+    meet_datetime: datetime | None = Field(None, example="2025-02-10T08:30:00")
+
+
 class MeetingCreate(MeetingBase):
     pass
 
@@ -1,10 +1,16 @@
+from datetime import datetime
 from typing import TypeVar
 
+from fastapi import HTTPException
+
+from core.batch import BatchItemError
+from core.exceptions import DuplicatedBatchItem
 from core.model_adapter import ModelAdapter
+from core.pagination import PaginationParams
+from core.transactions import transactional
 from users.exceptions import UserNotFound
-from utils.check_after_now import check_after_now
 from utils.check_time import check_datetime_after_now
-from utils.check_today import check_date_is_today
+from utils.get_today_bounds import get_today_bounds
 
 from .adapters.meeting_adapter import MeetingAdapter
 from .exceptions import (
@@ -15,7 +21,13 @@ from .exceptions import (
     UserNotFoundInMeeting,
 )
 from .models import Meeting
-from .schemas.meeting import MeetingCreate, MeetingUpdate
+from .schemas.meeting import (
+    MeetingBatchUpdate,
+    MeetingCreate,
+    MeetingOut,
+    MeetingPatch,
+    MeetingUpdate,
+)
 
 MM = TypeVar("MM", bound=Meeting)
 
@@ -107,18 +119,48 @@ class MeetingService:
             creator_id, meeting_create_schema
         )
 
+    async def create_meetings(
+        self, creator_id: int, meeting_create_schemas: list[MeetingCreate]
+    ) -> dict:
+        """Creates a batch of meetings by a single statement and reports the meetings
+        which can't be created.
+
+        Args:
+            creator_id (int): Creator id
+            meeting_create_schemas (list[MeetingCreate]): Schemas to create meetings
+
+        Returns:
+            dict: Dict {"items": <created Meeting models>, "errors": <item errors>}
+        """
+
+        valid_schemas = []
+        errors = []
+
+        for index, meeting_create_schema in enumerate(meeting_create_schemas):
+            if not check_datetime_after_now(meeting_create_schema.meet_datetime):
+                errors.append(BatchItemError.from_exception(index, MeetingBeforeNow))
+            else:
+                valid_schemas.append(meeting_create_schema)
+
+        meetings = await self.meetings_adapter.bulk_create_items(
+            valid_schemas, creator_id=creator_id
+        )
+
+        return {"items": meetings, "errors": errors}
+
     async def update_meeting(
         self,
         meeting_id: int,
         user_id: int,
-        meeting_update_schema: MeetingUpdate,
+        meeting_update_schema: MeetingUpdate | MeetingPatch,
     ) -> MM:
-        """Updates meeting by creator
+        """Updates meeting by creator. Only the fields set in the schema are updated.
 
         Args:
             meeting_id (int): Id of the meeting to update
             user_id (int): Id of the meeting creator
-            meeting_update_schema (MeetingUpdate): Schema to update meeting
+            meeting_update_schema (MeetingUpdate | MeetingPatch): Schema to update
+            meeting
 
         Raises:
             MeetingBeforeNow: If meet_datetime to update is before now
@@ -127,13 +169,74 @@ class MeetingService:
             Meeting: Updated meeting model
         """
 
-        if not check_datetime_after_now(meeting_update_schema.meet_datetime):
+        if (
+            meeting_update_schema.meet_datetime is not None
+            and not check_datetime_after_now(meeting_update_schema.meet_datetime)
+        ):
             raise MeetingBeforeNow
 
         meeting = await self.get_meeting_by_creator(meeting_id, user_id)
 
         return await self.meetings_adapter.update_item(meeting_update_schema, meeting)
 
+    async def update_meetings(
+        self, user_id: int, meeting_update_schemas: list[MeetingBatchUpdate]
+    ) -> dict:
+        """Updates a batch of meetings created by the user by a single statement and
+        reports the meetings which can't be updated. Unchanged meetings aren't written.
+
+        Args:
+            user_id (int): Id of the meetings creator
+            meeting_update_schemas (list[MeetingBatchUpdate]): Schemas with ids of the
+            meetings to update
+
+        Returns:
+            dict: Dict {"items": <updated Meeting models>, "errors": <item errors>}
+        """
+
+        meetings = {
+            meeting.id: meeting
+            for meeting in await self.meetings_adapter.read_items_by_ids(
+                {schema.id for schema in meeting_update_schemas}
+            )
+        }
+
+        valid_schemas = []
+        unchanged_meetings = []
+        errors = []
+        seen_ids = set()
+
+        for index, meeting_update_schema in enumerate(meeting_update_schemas):
+            try:
+                if meeting_update_schema.id in seen_ids:
+                    raise DuplicatedBatchItem
+
+                seen_ids.add(meeting_update_schema.id)
+
+                if not check_datetime_after_now(meeting_update_schema.meet_datetime):
+                    raise MeetingBeforeNow
+
+                meeting = meetings.get(meeting_update_schema.id)
+
+                if not meeting:
+                    raise MeetingsNotFound
+
+                if not meeting.creator_id == user_id:
+                    raise NotMeetingCreator
+            except HTTPException as error:
+                errors.append(BatchItemError.from_exception(index, error))
+            else:
+                if self.meetings_adapter.get_changed_values(
+                    meeting_update_schema, meeting
+                ):
+                    valid_schemas.append(meeting_update_schema)
+                else:
+                    unchanged_meetings.append(meeting)
+
+        meetings = await self.meetings_adapter.bulk_update_items(valid_schemas)
+
+        return {"items": meetings + unchanged_meetings, "errors": errors}
+
     async def delete_meeting(self, meeting_id: int, user_id: int) -> None:
         """Deletes meeting by creator.
 
@@ -146,6 +249,51 @@ class MeetingService:
 
         await self.meetings_adapter.delete_item(meeting)
 
+    async def delete_meetings(self, meeting_ids: list[int], user_id: int) -> dict:
+        """Deletes a batch of meetings created by the user in one transaction and
+        reports the meetings which can't be deleted.
+
+        Args:
+            meeting_ids (list[int]): Ids of the meetings to delete
+            user_id (int): Id of the meetings creator
+
+        Returns:
+            dict: Dict {"items": <deleted meeting ids>, "errors": <item errors>}
+        """
+
+        meetings = {
+            meeting.id: meeting
+            for meeting in await self.meetings_adapter.read_items_by_ids(meeting_ids)
+        }
+
+        valid_ids = []
+        errors = []
+        seen_ids = set()
+
+        for index, meeting_id in enumerate(meeting_ids):
+            try:
+                if meeting_id in seen_ids:
+                    raise DuplicatedBatchItem
+
+                seen_ids.add(meeting_id)
+
+                meeting = meetings.get(meeting_id)
+
+                if not meeting:
+                    raise MeetingsNotFound
+
+                if not meeting.creator_id == user_id:
+                    raise NotMeetingCreator
+            except HTTPException as error:
+                errors.append(BatchItemError.from_exception(index, error))
+            else:
+                valid_ids.append(meeting_id)
+
+        deleted_ids = await self.meetings_adapter.bulk_delete_items(valid_ids)
+
+        return {"items": deleted_ids, "errors": errors}
+
+    @transactional(isolation_level="SERIALIZABLE")
     async def add_user(
         self,
         meeting_id: int,
@@ -181,6 +329,7 @@ class MeetingService:
 
         return await self.meetings_adapter.add_user(meeting, user)
 
+    @transactional()
     async def remove_user(
         self,
         meeting_id: int,
@@ -216,31 +365,33 @@ class MeetingService:
 
         return await self.meetings_adapter.remove_user(meeting, user)
 
-    async def get_user_meetings(self, user_id: int, today: bool) -> list[MM]:
-        """Retrieve user meetings.
+    async def get_user_meetings(
+        self, user_id: int, today: bool, pagination: PaginationParams
+    ) -> dict:
+        """Retrieve a page of user meetings.
 
         Args:
             user_id (int): User id
             today (bool): True if need to get today only meetings, False if need to get
-            all meetings
+            all the upcoming meetings
+            pagination (PaginationParams): Cursor and limit of the page
 
         Returns:
-            list[Meeting]: List of meeting models
+            dict: Dict {"items": <list of MeetingOut rows>, "next_cursor": <cursor>}
         """
 
-        meetings = await self.meetings_adapter.read_by_user_id(user_id)
-
         if today:
-            meetings = [
-                meeting
-                for meeting in meetings
-                if check_date_is_today(meeting.meet_datetime)
-            ]
+            date_from, date_to = get_today_bounds()
         else:
-            meetings = [
-                meeting
-                for meeting in meetings
-                if check_after_now(meeting.meet_datetime)
-            ]
+            date_from, date_to = datetime.now(), None
+
+        meetings, next_cursor = await self.meetings_adapter.read_by_user_id(
+            user_id,
+            date_from=date_from,
+            date_to=date_to,
+            cursor=pagination.cursor,
+            limit=pagination.limit,
+            schema=MeetingOut,
+        )
 
-        return meetings
+        return {"items": meetings, "next_cursor": next_cursor}
@@ -0,0 +1,61 @@
+"""add keyset pagination indexes
+
+Revision ID: 8c1f3e5a7b20
+Revises: 44da0ef71fda
+Create Date: 2025-01-13 09:15:42.318204+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c1f3e5a7b20"
+down_revision: Union[str, None] = "44da0ef71fda"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_work_tasks_assignee_id_complete_by_id",
+        "work_tasks",
+        ["assignee_id", "complete_by", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_work_tasks_creator_id_complete_by_id",
+        "work_tasks",
+        ["creator_id", "complete_by", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_meetings_meet_datetime_id",
+        "meetings",
+        ["meet_datetime", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_meetings_users_association_user_id_meeting_id",
+        "meetings_users_association",
+        ["user_id", "meeting_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_roles_structure_id_name_id",
+        "roles",
+        ["structure_id", "name", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_roles_structure_id_name_id", table_name="roles")
+    op.drop_index(
+        "ix_meetings_users_association_user_id_meeting_id",
+        table_name="meetings_users_association",
+    )
+    op.drop_index("ix_meetings_meet_datetime_id", table_name="meetings")
+    op.drop_index("ix_work_tasks_creator_id_complete_by_id", table_name="work_tasks")
+    op.drop_index("ix_work_tasks_assignee_id_complete_by_id", table_name="work_tasks")
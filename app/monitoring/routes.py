@@ -0,0 +1,75 @@
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import PlainTextResponse
+
+from core.config import settings
+from core.deadline import DeadlineRoute
+from core.metrics import registry
+from core.models import db_connector
+from core.slow_queries import slow_query_log
+from users.dependencies.fastapi_users_routes import current_superuser
+
+router = APIRouter(
+    prefix=settings.prefix.monitoring,
+    tags=["Monitoring"],
+    route_class=DeadlineRoute,
+)
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="Get the application metrics",
+    description="""
+    Renders the application metrics in the Prometheus text format. The metrics are
+    collected by the current worker process only.
+    """,
+)
+async def get_metrics():
+    return PlainTextResponse(
+        registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+@router.get(
+    "/db-pools",
+    dependencies=[Depends(current_superuser)],
+    summary="Get the database connection pools statistics",
+    description="""
+    Returns the current state and the collected statistics of the primary and the
+    replicas connection pools of the current worker process. Requires superuser
+    authorization.
+    """,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "The current user unauthorized",
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "description": "The current user is not a superuser",
+        },
+    },
+)
+async def get_db_pools_stats() -> list[dict]:
+    return db_connector.stats()
+
+
+@router.get(
+    "/slow-queries",
+    dependencies=[Depends(current_superuser)],
+    summary="Get the latest slow queries",
+    description="""
+    Returns the latest statements of the current worker process running longer than
+    the slow query threshold, the latest first, with their parameters, the route
+    issued them and, if the plans capture is enabled, the EXPLAIN (ANALYZE, BUFFERS)
+    plans of the select statements. Requires superuser authorization.
+    """,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "The current user unauthorized",
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "description": "The current user is not a superuser",
+        },
+    },
+)
+async def get_slow_queries() -> list[dict]:
+    return slow_query_log.get_queries()
@@ -5,6 +5,7 @@ import logging
 from fastapi_users.exceptions import UserAlreadyExists
 
 from core.config import settings
+from core.logging_setup import setup_logging
 from core.models import db_connector
 from users.auth.user_manager import UserManager
 from users.dependencies.user_manager import get_user_manager
@@ -73,4 +74,5 @@ async def create_superuser(
 
 
 if __name__ == "__main__":
+    setup_logging()
     asyncio.run(create_superuser())
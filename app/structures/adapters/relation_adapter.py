@@ -1,4 +1,7 @@
-from sqlalchemy import select
+from collections.abc import Iterable
+
+from sqlalchemy import Integer, any_, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.model_adapter import ModelAdapter
@@ -37,8 +40,7 @@ class RelationAdapter(ModelAdapter):
         )
 
         self.session.add(relation)
-        await self.session.commit()
-        await self.session.refresh(relation)
+        await self.session.flush()
 
         return relation
 
@@ -55,3 +57,32 @@ class RelationAdapter(ModelAdapter):
         )
 
         return await self.session.scalar(stmt)
+
+    async def get_subordinate_ids_of_superior(
+        self,
+        superior_id: int,
+        subordinate_ids: Iterable[int],
+    ) -> set[int]:
+        """Gets ids of the provided subordinate roles having a relation with provided
+        superior role.
+
+        Args:
+            superior_id (int): Superior role id
+            subordinate_ids (Iterable[int]): Subordinate role ids to check
+
+        Returns:
+            set[int]: Subordinate role ids related to the superior role
+        """
+
+        subordinate_ids = list(subordinate_ids)
+
+        if not subordinate_ids:
+            return set()
+
+        stmt = select(Relation.subordinate_id).where(
+            Relation.superior_id == superior_id,
+            Relation.subordinate_id == any_(literal(subordinate_ids, ARRAY(Integer))),
+        )
+        results = await self.session.scalars(stmt)
+
+        return set(results.all())
@@ -36,7 +36,7 @@ class RoleAdapter(ModelAdapter):
         role = self.model(**role_create_schema.model_dump(), structure_id=structure_id)
 
         self.session.add(role)
-        await self.session.commit()
+        await self.session.flush()
 
         return role
 
@@ -54,7 +54,7 @@ class RoleAdapter(ModelAdapter):
         role.users.append(user)
 
         self.session.add(role)
-        await self.session.commit()
+        await self.session.flush()
 
         return role
 
@@ -72,6 +72,22 @@ class RoleAdapter(ModelAdapter):
 
         return await self.session.scalar(stmt)
 
+    async def get_with_structure(self, role_id: int) -> Role:
+        """Gets Role with provided id with joined loaded structure.
+
+        Args:
+            role_id (int): Role id
+
+        Returns:
+            Role: Role object
+        """
+
+        stmt = (
+            select(Role).options(joinedload(Role.structure)).where(Role.id == role_id)
+        )
+
+        return await self.session.scalar(stmt)
+
     async def get_with_subordinates(self, role_id: int) -> Role:
         """Gets Role with provided id with joined loaded suboridinates.
 
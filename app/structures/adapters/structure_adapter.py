@@ -1,7 +1,9 @@
-from sqlalchemy import select
+from pydantic import BaseModel
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.model_adapter import ModelAdapter
+from structures.adapters.role_adapter import RoleAdapter
 from structures.models import Role, Structure
 from structures.schemas.role import RoleCreateWithStructure
 from structures.schemas.structure import StructureCreate
@@ -39,19 +41,32 @@ class StructureAdapter(ModelAdapter):
 
         return await self.session.scalar(stmt)
 
-    async def read_structure_team(self, structure_id: int) -> list[Role]:
-        """Retrieves all roles of the structures
+    async def read_structure_team(
+        self,
+        structure_id: int,
+        cursor: str | None = None,
+        limit: int | None = None,
+        schema: type[BaseModel] | None = None,
+    ) -> tuple[list[Role | Row], str | None]:
+        """Retrieves a page of the structure's roles ordered by name.
 
         Args:
             structure_id (int): Strucutre id
+            cursor (str | None): Cursor returned with the previous page
+            limit (int | None): Maximum number of roles in the page
+            schema (type[BaseModel] | None): Response schema to select the columns
+            for. Roles are loaded if not provided
 
         Returns:
-            list[Role]: List of roles
+            tuple[list[Role | Row], str | None]: List of roles or rows and the next
+            page cursor
         """
 
         stmt = select(Role).where(Role.structure_id == structure_id)
 
-        return await self.session.scalars(stmt)
+        return await RoleAdapter(self.session).read_page(
+            stmt, sort_column=Role.name, cursor=cursor, limit=limit, schema=schema
+        )
 
     async def create_structure_with_admin_role(
         self, structure_schema: StructureCreate, current_user_id: int
@@ -84,6 +99,6 @@ class StructureAdapter(ModelAdapter):
         role.users.append(user)
 
         self.session.add(role)
-        await self.session.commit()
+        await self.session.flush()
 
         return structure
@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+
+from fastapi import Depends
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import db_connector
+from structures.adapters.role_adapter import RoleAdapter
+from structures.exceptions.structure import StructureNotFound
+from structures.models import Role, Structure
+from structures.services.role import RoleService
+from users.dependencies.fastapi_users_routes import current_user
+from users.models import User
+
+
+@dataclass
+class UserContext:
+    """The current user with the user's role and structure.
+
+    Attributes:
+        user (User): Current authenticated user
+        role (Role | None): The user's role, None if the user has no role
+        structure (Structure | None): The role's structure, None if the user has no
+        role
+    """
+
+    user: User
+    role: Role | None
+    structure: Structure | None
+
+
+async def current_user_context(
+    current_user: User = Depends(current_user),
+    session: AsyncSession = Depends(db_connector.get_session),
+) -> UserContext:
+    """Provides the current user's context shared by the request's dependencies. The
+    role and structure come joined loaded with the user, or by one joined query if
+    the user is taken from the auth cache or a signed token.
+
+    Args:
+        current_user (User): Current authenticated user
+        session (AsyncSession): Database session the user is bound to
+
+    Raises:
+        RoleNotFound: If the user's role doesn't exist
+
+    Returns:
+        UserContext: Current user with the role and structure
+    """
+
+    if current_user.role_id is None:
+        return UserContext(user=current_user, role=None, structure=None)
+
+    if "role" in inspect(current_user).unloaded:
+        role_service = RoleService(roles_adapter=RoleAdapter(session=session))
+        role = await role_service.get_role_with_structure(current_user.role_id)
+        await db_connector.release_connection(session)
+    else:
+        role = current_user.role
+
+    return UserContext(user=current_user, role=role, structure=role.structure)
+
+
+async def current_user_structure(
+    context: UserContext = Depends(current_user_context),
+) -> Structure:
+    """Fetches current user structure.
+
+    Args:
+        context (UserContext): Current user context
+
+    Raises:
+        StructureNotFound: If the user isn't bound to any structure
+
+    Returns:
+        Structure: Structure model associated with current user
+    """
+
+    if context.structure is None:
+        raise StructureNotFound
+
+    return context.structure
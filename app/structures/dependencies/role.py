@@ -1,32 +1,30 @@
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.models import db_connector
-from structures.adapters.role_adapter import RoleAdapter
-from structures.exceptions.role import NotTeamAdministrator
+from structures.exceptions.role import NotTeamAdministrator, RoleNotFound
 from structures.models import Role
-from structures.services.role import RoleService
-from users.dependencies.fastapi_users_routes import current_user
-from users.schemas import UserRead
+
+from .context import UserContext, current_user_context
 
 
 async def current_user_role(
-    current_user: UserRead = Depends(current_user),
-    session: AsyncSession = Depends(db_connector.get_session),
+    context: UserContext = Depends(current_user_context),
 ) -> Role:
     """Fetches current user role.
 
     Args:
-        current_user (UserRead): Current authenticated user
-        session (AsyncSession): Database session
+        context (UserContext): Current user context
+
+    Raises:
+        RoleNotFound: If the user has no role
 
     Returns:
         Role: Role model associated with current user
     """
 
-    role_service = RoleService(roles_adapter=RoleAdapter(session=session))
+    if context.role is None:
+        raise RoleNotFound
 
-    return await role_service.get_role_by_id(current_user.role_id)
+    return context.role
 
 
 async def current_user_team_admin(
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from starlette.requests import Request
 
@@ -37,6 +37,10 @@ class Role(Base):
         cascade="all, delete",
     )
 
+    __table_args__ = (
+        Index("ix_roles_structure_id_name_id", "structure_id", "name", "id"),
+    )
+
     async def __admin_repr__(self, request: Request) -> str:
         """Model's representation in admin.
 
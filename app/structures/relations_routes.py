@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.config import settings
+from core.deadline import DeadlineRoute
 from core.models import db_connector
 from users.dependencies.fastapi_users_routes import current_user
 from users.schemas import UserRead
@@ -17,6 +18,7 @@ from .services.role import RoleService
 router = APIRouter(
     prefix=settings.prefix.relations,
     tags=["Relations"],
+    route_class=DeadlineRoute,
 )
 
 
@@ -134,7 +136,7 @@ async def delete_relation(
 )
 async def get_me_subordinate(
     current_user: UserRead = Depends(current_user),
-    session: AsyncSession = Depends(db_connector.get_session),
+    session: AsyncSession = Depends(db_connector.get_read_session),
 ):
     roles_adapter = RoleAdapter(session)
 
@@ -165,7 +167,7 @@ async def get_me_subordinate(
 )
 async def get_me_superior(
     current_user: UserRead = Depends(current_user),
-    session: AsyncSession = Depends(db_connector.get_session),
+    session: AsyncSession = Depends(db_connector.get_read_session),
 ):
     roles_adapter = RoleAdapter(session)
 
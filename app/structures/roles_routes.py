@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.batch import BatchResult, batch_query_budget
 from core.config import settings
+from core.deadline import DeadlineRoute
 from core.model_adapter import ModelAdapter
 from core.models import db_connector
 from users.models import User
@@ -9,12 +11,14 @@ from users.models import User
 from .adapters.role_adapter import RoleAdapter
 from .dependencies.role import current_user_role, current_user_team_admin
 from .models.role import Role
-from .schemas.role import RoleCreate, RoleOut, RoleUpdate
+from .models.structure import Structure
+from .schemas.role import RoleBatchUpdate, RoleCreate, RoleOut, RoleUpdate
 from .services.role import RoleService
 
 router = APIRouter(
     prefix=settings.prefix.roles,
     tags=["Roles"],
+    route_class=DeadlineRoute,
 )
 
 
@@ -80,6 +84,142 @@ async def create_role(
     )
 
 
+@router.post(
+    "/batch",
+    response_model=BatchResult[RoleOut],
+    dependencies=[Depends(batch_query_budget)],
+    summary="Create a batch of roles",
+    description="""
+    Creates roles using the provided list of schemas in a single transaction. Requires
+    authorization. The created roles belong to the current user role's structure.
+    Roles which don't meet the requirements aren't created and are reported in "errors"
+    with their position in the batch.
+
+    Requirements:
+    - The current user must be the team administrator
+    - The current user role's structure must exist
+    - The roles' names must not repeat in the batch
+    """,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "The current user unauthorized",
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "description": "The current user is not a team administrator",
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "The current user doesn't have a role",
+        },
+    },
+)
+async def create_roles(
+    role_input_schemas: list[RoleCreate] = Body(
+        ..., max_length=settings.batch.max_size
+    ),
+    current_user_team_admin: RoleOut = Depends(current_user_team_admin),
+    session: AsyncSession = Depends(db_connector.get_session),
+):
+    roles_adapter = RoleAdapter(session)
+    structures_adapter = ModelAdapter(Structure, session)
+
+    role_service = RoleService(roles_adapter)
+
+    return await role_service.create_roles(
+        role_create_schemas=role_input_schemas,
+        structure_id=current_user_team_admin.structure_id,
+        structures_adapter=structures_adapter,
+    )
+
+
+@router.put(
+    "/batch",
+    response_model=BatchResult[RoleOut],
+    dependencies=[Depends(batch_query_budget)],
+    summary="Update a batch of roles",
+    description="""
+    Updates roles using the provided list of schemas with the roles' ids in a single
+    transaction. Requires authorization. Roles which don't meet the requirements aren't
+    updated and are reported in "errors" with their position in the batch.
+
+    Requirements:
+    - The current user must be the team administrator
+    - The roles with provided ids must exist
+    - The roles with provided ids must belong to the current user's structure
+    """,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "The current user unauthorized",
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "description": "The current user is not a team administrator",
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "The current user doesn't have a role",
+        },
+    },
+)
+async def update_roles(
+    role_input_schemas: list[RoleBatchUpdate] = Body(
+        ..., max_length=settings.batch.max_size
+    ),
+    current_user_team_admin: RoleOut = Depends(current_user_team_admin),
+    session: AsyncSession = Depends(db_connector.get_session),
+):
+    roles_adapter = RoleAdapter(session)
+
+    role_service = RoleService(roles_adapter)
+
+    return await role_service.update_roles(
+        role_update_schemas=role_input_schemas,
+        structure_id=current_user_team_admin.structure_id,
+    )
+
+
+@router.delete(
+    "/batch",
+    response_model=BatchResult[int],
+    dependencies=[Depends(batch_query_budget)],
+    summary="Delete a batch of roles",
+    description="""
+    Deletes roles with provided ids in a single transaction. Requires authorization.
+    Returns ids of the deleted roles, roles which don't meet the requirements aren't
+    deleted and are reported in "errors" with their position in the batch.
+
+    Parameters:
+    - ids: The ids of the roles to delete
+
+    Requirements:
+    - The current user must be a team administrator
+    - The roles with provided ids must exist
+    - The roles with provided ids must not be the current user's role
+    - The roles with provided ids must belong to the current user's structure
+    """,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "The current user unauthorized",
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "description": "The current user is not a team administrator",
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "The current user doesn't have a role",
+        },
+    },
+)
+async def delete_roles(
+    ids: list[int] = Query(..., max_length=settings.batch.max_size),
+    current_user_team_admin: RoleOut = Depends(current_user_team_admin),
+    session: AsyncSession = Depends(db_connector.get_session),
+):
+    roles_adapter = RoleAdapter(session)
+
+    role_service = RoleService(roles_adapter)
+
+    return await role_service.delete_roles(
+        role_ids=ids, current_user_role=current_user_team_admin
+    )
+
+
 @router.get(
     "/{role_id}/bound-user/{user_id}",
     response_model=RoleOut,
@@ -110,6 +250,9 @@ async def create_role(
                               A role with provided id isn't found;
                               A user with provided id isn't found""",
         },
+        status.HTTP_409_CONFLICT: {
+            "description": "The operation conflicted with concurrent changes",
+        },
     },
 )
 async def bound_user(
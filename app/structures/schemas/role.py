@@ -17,6 +17,10 @@ class RoleUpdate(RoleBase):
     pass
 
 
+class RoleBatchUpdate(RoleUpdate):
+    id: int
+
+
 class RoleCreate(RoleBase):
     name: str = Field(..., example="Manager")
 
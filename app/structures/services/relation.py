@@ -46,11 +46,8 @@ class RelationService:
         Returns:
             Relation: Created relation model
         """
-        superior_role = await roles_adapter.read_item_by_id(
-            relation_create_schema.superior_id
-        )
-        subordinate_role = await roles_adapter.read_item_by_id(
-            relation_create_schema.subordinate_id
+        superior_role, subordinate_role = await roles_adapter.loader.load_many(
+            [relation_create_schema.superior_id, relation_create_schema.subordinate_id]
         )
 
         if not superior_role or not subordinate_role:
@@ -1,6 +1,11 @@
 from typing import TypeVar
 
+from fastapi import HTTPException
+
+from core.batch import BatchItemError
+from core.exceptions import DuplicatedBatchItem
 from core.model_adapter import ModelAdapter
+from core.transactions import transactional
 from structures.adapters.role_adapter import RoleAdapter
 from structures.exceptions.role import (
     DeleteOtherTeamRole,
@@ -9,8 +14,9 @@ from structures.exceptions.role import (
     RoleNotFoundForUser,
     RoleOtherStructure,
 )
+from structures.exceptions.structure import StructureNotFound
 from structures.models import Role
-from structures.schemas.role import RoleCreate, RoleOut, RoleUpdate
+from structures.schemas.role import RoleBatchUpdate, RoleCreate, RoleOut, RoleUpdate
 from users.exceptions import UserNotFound
 
 RM = TypeVar("RM", bound=Role)
@@ -48,6 +54,26 @@ class RoleService:
 
         return role
 
+    async def get_role_with_structure(self, role_id: int) -> RM:
+        """Retrieves role by id with its structure by one query.
+
+        Args:
+            role_id (int): Id of the role
+
+        Raises:
+            RoleNotFound: Http exception
+
+        Returns:
+            Role: Role model with loaded structure
+        """
+
+        role = await self.roles_adapter.get_with_structure(role_id)
+
+        if not role:
+            raise RoleNotFound
+
+        return role
+
     async def get_role_subordinates(self, role_id: int) -> list[RM]:
         """Retrieves role's subordinates.
 
@@ -102,6 +128,52 @@ class RoleService:
             structure_id=structure_id,
         )
 
+    async def create_roles(
+        self,
+        role_create_schemas: list[RoleCreate],
+        structure_id: int,
+        structures_adapter: ModelAdapter,
+    ) -> dict:
+        """Creates a batch of roles with provided structure id by a single statement
+        and reports the roles which can't be created.
+
+        Args:
+            role_create_schemas (list[RoleCreate]): Schemas to create new roles
+            structure_id (int): Structure id
+            structures_adapter (ModelAdapter): Adapter for interactive with database
+            to retrieve structure model
+
+        Returns:
+            dict: Dict {"items": <created Role models>, "errors": <item errors>}
+        """
+
+        structure = await structures_adapter.read_item_by_id(structure_id)
+
+        valid_schemas = []
+        errors = []
+        seen_names = set()
+
+        for index, role_create_schema in enumerate(role_create_schemas):
+            try:
+                if not structure:
+                    raise StructureNotFound
+
+                if role_create_schema.name in seen_names:
+                    raise DuplicatedBatchItem
+
+                seen_names.add(role_create_schema.name)
+            except HTTPException as error:
+                errors.append(BatchItemError.from_exception(index, error))
+            else:
+                valid_schemas.append(role_create_schema)
+
+        roles = await self.roles_adapter.bulk_create_items(
+            valid_schemas, structure_id=structure_id
+        )
+
+        return {"items": roles, "errors": errors}
+
+    @transactional()
     async def bound_user(
         self,
         role_id: int,
@@ -159,6 +231,59 @@ class RoleService:
             update_schema=role_update_schema, item=role_to_update
         )
 
+    async def update_roles(
+        self, role_update_schemas: list[RoleBatchUpdate], structure_id: int
+    ) -> dict:
+        """Updates a batch of the structure's roles by a single statement and reports
+        the roles which can't be updated. Unchanged roles aren't written.
+
+        Args:
+            role_update_schemas (list[RoleBatchUpdate]): Schemas with ids of the roles
+            to update
+            structure_id (int): Structure id
+
+        Returns:
+            dict: Dict {"items": <updated Role models>, "errors": <item errors>}
+        """
+
+        roles = {
+            role.id: role
+            for role in await self.roles_adapter.read_items_by_ids(
+                {schema.id for schema in role_update_schemas}
+            )
+        }
+
+        valid_schemas = []
+        unchanged_roles = []
+        errors = []
+        seen_ids = set()
+
+        for index, role_update_schema in enumerate(role_update_schemas):
+            try:
+                if role_update_schema.id in seen_ids:
+                    raise DuplicatedBatchItem
+
+                seen_ids.add(role_update_schema.id)
+
+                role = roles.get(role_update_schema.id)
+
+                if not role:
+                    raise RoleNotFound
+
+                if not role.structure_id == structure_id:
+                    raise RoleOtherStructure
+            except HTTPException as error:
+                errors.append(BatchItemError.from_exception(index, error))
+            else:
+                if self.roles_adapter.get_changed_values(role_update_schema, role):
+                    valid_schemas.append(role_update_schema)
+                else:
+                    unchanged_roles.append(role)
+
+        roles = await self.roles_adapter.bulk_update_items(valid_schemas)
+
+        return {"items": roles + unchanged_roles, "errors": errors}
+
     async def delete_role(self, role_id: int, current_user_role: RoleOut) -> None:
         """Deletes role by provided role id.
 
@@ -184,3 +309,52 @@ class RoleService:
             raise DeleteOtherTeamRole
 
         await self.roles_adapter.delete_item(role_to_delete)
+
+    async def delete_roles(
+        self, role_ids: list[int], current_user_role: RoleOut
+    ) -> dict:
+        """Deletes a batch of roles by a single statement and reports the roles which
+        can't be deleted.
+
+        Args:
+            role_ids (list[int]): Ids of the roles to delete
+            current_user_role (RoleOut): Current user role schema
+
+        Returns:
+            dict: Dict {"items": <deleted role ids>, "errors": <item errors>}
+        """
+
+        roles = {
+            role.id: role
+            for role in await self.roles_adapter.read_items_by_ids(role_ids)
+        }
+
+        valid_ids = []
+        errors = []
+        seen_ids = set()
+
+        for index, role_id in enumerate(role_ids):
+            try:
+                if role_id in seen_ids:
+                    raise DuplicatedBatchItem
+
+                seen_ids.add(role_id)
+
+                if current_user_role.id == role_id:
+                    raise DeleteYourselfRole
+
+                role_to_delete = roles.get(role_id)
+
+                if not role_to_delete:
+                    raise RoleNotFoundForUser
+
+                if not current_user_role.structure_id == role_to_delete.structure_id:
+                    raise DeleteOtherTeamRole
+            except HTTPException as error:
+                errors.append(BatchItemError.from_exception(index, error))
+            else:
+                valid_ids.append(role_id)
+
+        deleted_ids = await self.roles_adapter.bulk_delete_items(valid_ids)
+
+        return {"items": deleted_ids, "errors": errors}
@@ -1,9 +1,11 @@
 from typing import TypeVar
 
+from core.pagination import PaginationParams
 from structures.adapters.structure_adapter import StructureAdapter
 from structures.exceptions.role import AlreadyHaveRole
 from structures.exceptions.structure import StructureNotFound
 from structures.models import Role, Structure
+from structures.schemas.role import RoleOut
 from structures.schemas.structure import StructureCreate, StructureUpdate
 from structures.services.role import RM
 from users.schemas.user import UserRead
@@ -43,22 +45,27 @@ class StructureService:
 
         return structure
 
-    async def get_user_team(self, user_id: int) -> list[RM]:
-        """Retrieve user's structure team.
+    async def get_structure_team(
+        self, structure_id: int, pagination: PaginationParams
+    ) -> dict:
+        """Retrieve a page of the structure's team.
 
         Args:
-            user_id (int): User id
+            structure_id (int): Structure id
+            pagination (PaginationParams): Cursor and limit of the page
 
         Returns:
-            list[Role]: List of structure's roles
+            dict: Dict {"items": <list of RoleOut rows>, "next_cursor": <cursor>}
         """
 
-        structure = await self.get_user_structure(user_id)
-
-        if not structure:
-            raise StructureNotFound
+        roles, next_cursor = await self.structures_adapter.read_structure_team(
+            structure_id,
+            cursor=pagination.cursor,
+            limit=pagination.limit,
+            schema=RoleOut,
+        )
 
-        return await self.structures_adapter.read_structure_team(structure.id)
+        return {"items": roles, "next_cursor": next_cursor}
 
     async def create_structure(
         self,
@@ -2,12 +2,16 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.config import settings
+from core.deadline import DeadlineRoute
 from core.models import db_connector
+from core.pagination import CursorPage, PaginationParams, get_pagination_params
 from users.dependencies.fastapi_users_routes import current_user
 from users.schemas import UserRead
 
 from .adapters.structure_adapter import StructureAdapter
+from .dependencies.context import current_user_structure
 from .dependencies.role import current_user_team_admin
+from .models import Structure
 from .schemas.role import RoleOut
 from .schemas.structure import StructureCreate, StructureOut, StructureUpdate
 from .services.structure import StructureService
@@ -15,6 +19,7 @@ from .services.structure import StructureService
 router = APIRouter(
     prefix=settings.prefix.structures,
     tags=["Structures"],
+    route_class=DeadlineRoute,
 )
 
 
@@ -38,28 +43,30 @@ router = APIRouter(
     },
 )
 async def get_my_strucure(
-    current_user: UserRead = Depends(current_user),
-    session: AsyncSession = Depends(db_connector.get_session),
+    current_user_structure: Structure = Depends(current_user_structure),
 ):
-    structures_adapter = StructureAdapter(session)
-
-    structures_service = StructureService(structures_adapter)
-
-    return await structures_service.get_user_structure(current_user.id)
+    return current_user_structure
 
 
 @router.get(
     "/team",
-    response_model=list[RoleOut],
+    response_model=CursorPage[RoleOut],
     summary="Get user's team",
     description="""
-    Retrieves a list of the roles of the current user's structure. Requires
-    authorization.
+    Retrieves a page of the roles of the current user's structure ordered by name.
+    Requires authorization.
+
+    Parameters:
+    - cursor: The "next_cursor" value of the previous page, omit to get the first page
+    - limit: The maximum number of the roles in the page
 
     Requirements:
     - The current user must be bound to a structure
     """,
     responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "The provided cursor is invalid",
+        },
         status.HTTP_401_UNAUTHORIZED: {
             "description": "The current user unauthorized",
         },
@@ -69,14 +76,17 @@ async def get_my_strucure(
     },
 )
 async def get_my_team(
-    current_user: UserRead = Depends(current_user),
-    session: AsyncSession = Depends(db_connector.get_session),
+    pagination: PaginationParams = Depends(get_pagination_params),
+    current_user_structure: Structure = Depends(current_user_structure),
+    session: AsyncSession = Depends(db_connector.get_read_session),
 ):
     structures_adapter = StructureAdapter(session)
 
     structures_service = StructureService(structures_adapter)
 
-    return await structures_service.get_user_team(current_user.id)
+    return await structures_service.get_structure_team(
+        current_user_structure.id, pagination
+    )
 
 
 @router.post(
@@ -0,0 +1,183 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from fastapi_users.password import PasswordHelper
+
+from core.config import settings
+from core.metrics import Counter, Gauge, Histogram
+from users.exceptions import PasswordHashingBusy
+
+password_hash_seconds = Histogram(
+    "password_hash_seconds",
+    "How long a password hash or verification takes in the worker thread",
+    label_names=("operation",),
+)
+password_queue_wait_seconds = Histogram(
+    "password_hash_queue_wait_seconds",
+    "How long a password operation waits for a worker thread",
+    label_names=("operation",),
+)
+password_operations_rejected = Counter(
+    "password_hash_rejected_total",
+    "The number of password operations rejected because the queue was full",
+    label_names=("operation",),
+)
+password_operations_pending = Gauge(
+    "password_hash_pending",
+    "The number of password operations running or waiting for a worker thread",
+)
+
+
+class PasswordHasher:
+    """Hashes and verifies the passwords in a bounded pool of threads, so the event
+    loop isn't blocked by them. The argon2 and bcrypt hashers release the GIL, so
+    the threads hash in parallel with the event loop. The threads are started by
+    the first operation after the hasher is created or shut down, so the hasher
+    serves any number of application lifespans in the process.
+
+    Attributes:
+        helper (PasswordHelper): Fastapi-users password helper doing the hashing
+        max_pending (int): The number of operations running or waiting for a
+        thread, further operations are rejected
+        pending (int): The number of operations running or waiting for a thread
+    """
+
+    def __init__(self, helper: PasswordHelper, workers: int, max_queue: int) -> None:
+        """Inits PasswordHasher.
+
+        Args:
+            helper (PasswordHelper): Fastapi-users password helper doing the hashing
+            workers (int): The number of threads
+            max_queue (int): The number of operations waiting for a thread
+        """
+
+        self.helper = helper
+        self.workers = workers
+        self.max_pending = workers + max_queue
+        self.pending = 0
+        self._executor: ThreadPoolExecutor | None = None
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        """Provides the pool of the threads, starts it if not started.
+
+        Returns:
+            ThreadPoolExecutor: Pool of the hashing threads
+        """
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="password-hasher"
+            )
+
+        return self._executor
+
+    def _release(self, executor: ThreadPoolExecutor) -> None:
+        """Marks an operation as finished, unless its pool was shut down, as the
+        count was reset then.
+
+        Args:
+            executor (ThreadPoolExecutor): Pool the operation ran in
+        """
+
+        if executor is self._executor:
+            self.pending -= 1
+
+    async def run(self, operation: str, function: Callable[..., Any], *args) -> Any:
+        """Runs the password operation in a worker thread.
+
+        Args:
+            operation (str): Operation name for the metrics
+            function (Callable[..., Any]): Password helper method
+            *args: Arguments of the method
+
+        Raises:
+            PasswordHashingBusy: If the queue of the operations is full
+
+        Returns:
+            Any: The method's result
+        """
+
+        if self.pending >= self.max_pending:
+            password_operations_rejected.inc(operation=operation)
+            raise PasswordHashingBusy
+
+        loop = asyncio.get_running_loop()
+        submitted_at = time.perf_counter()
+
+        def timed() -> tuple[Any, float, float]:
+            started_at = time.perf_counter()
+            result = function(*args)
+
+            return result, started_at, time.perf_counter()
+
+        executor = self.get_executor()
+        future = executor.submit(timed)
+        self.pending += 1
+
+        def release(_) -> None:
+            # The thread keeps running if the awaiting request is cancelled, so the
+            # operation is counted until the thread finishes it
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._release, executor)
+
+        future.add_done_callback(release)
+
+        result, started_at, finished_at = await asyncio.wrap_future(future)
+        password_queue_wait_seconds.observe(
+            started_at - submitted_at, operation=operation
+        )
+        password_hash_seconds.observe(finished_at - started_at, operation=operation)
+
+        return result
+
+    async def hash(self, password: str) -> str:
+        """Hashes the password.
+
+        Args:
+            password (str): Plain password
+
+        Returns:
+            str: Password hash
+        """
+
+        return await self.run("hash", self.helper.hash, password)
+
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """Verifies the password against the hash.
+
+        Args:
+            plain_password (str): Plain password
+            hashed_password (str): Password hash
+
+        Returns:
+            tuple[bool, str | None]: Whether the password is valid, and its new hash
+            if the hash algorithm is outdated
+        """
+
+        return await self.run(
+            "verify", self.helper.verify_and_update, plain_password, hashed_password
+        )
+
+    def shutdown(self) -> None:
+        """Stops the threads once the running operations finish and cancels the
+        waiting ones. The next operation starts new threads."""
+
+        if self._executor is None:
+            return
+
+        executor, self._executor = self._executor, None
+        self.pending = 0
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = PasswordHasher(
+    helper=PasswordHelper(),
+    workers=settings.password_hashing.workers,
+    max_queue=settings.password_hashing.max_queue,
+)
+password_operations_pending.set_function(lambda: password_hasher.pending)
@@ -0,0 +1,328 @@
+import asyncio
+import logging
+import math
+import time
+from uuid import uuid4
+
+import jwt
+from fastapi_users.authentication import JWTStrategy
+from fastapi_users.jwt import decode_jwt, generate_jwt
+from fastapi_users.manager import BaseUserManager
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from core.config import settings
+from core.metrics import Counter
+from core.redis import redis_connector
+from users.models import User
+
+from .user_cache import (
+    INVALIDATE_ALL,
+    TOKEN_PREFIX,
+    USER_PREFIX,
+    UserCache,
+    user_change_handlers,
+)
+
+logger = logging.getLogger(__name__)
+
+USER_CLAIMS = (
+    "email",
+    "name",
+    "last_name",
+    "info",
+    "role_id",
+    "is_active",
+    "is_superuser",
+    "is_verified",
+)
+
+signed_token_rejections = Counter(
+    "auth_signed_token_rejections_total",
+    "The number of valid signed tokens rejected as revoked or for the stale denylist",
+    label_names=("reason",),
+)
+
+
+class TokenDenylist:
+    """Revoked signed tokens and users kept in a redis hash. Every worker fetches the
+    whole hash periodically and checks the tokens against its local copy.
+
+    The hash fields are "token:<jti>" with the token's expiration time, and
+    "user:<id>" or "all" with the time the tokens issued before were revoked. A
+    field is removed once every token it revokes has expired, so the hash stays as
+    small as the number of revocations during a token lifetime.
+
+    Attributes:
+        redis (Redis): Redis client keeping the denylist
+        key (str): Redis hash of the denylist
+        lifetime_seconds (int): Lifetime of the tokens
+        sync_interval (float): How often in seconds the denylist is fetched
+        max_age (float): For how many seconds after the last sync the local copy is
+        trusted
+        entries (dict[str, float]): Local copy of the denylist
+        synced_at (float): Monotonic time of the last successful sync
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        key: str,
+        lifetime_seconds: int,
+        sync_interval: float,
+        max_age: float,
+    ) -> None:
+        """Inits TokenDenylist.
+
+        Args:
+            redis (Redis): Redis client keeping the denylist
+            key (str): Redis hash of the denylist
+            lifetime_seconds (int): Lifetime of the tokens
+            sync_interval (float): How often in seconds the denylist is fetched
+            max_age (float): For how many seconds after the last sync the local copy
+            is trusted
+        """
+
+        self.redis = redis
+        self.key = key
+        self.lifetime_seconds = lifetime_seconds
+        self.sync_interval = sync_interval
+        self.max_age = max_age
+        self.entries: dict[str, float] = {}
+        self.synced_at = -math.inf
+        self._syncer: asyncio.Task | None = None
+        self._revoke_tasks: set[asyncio.Task] = set()
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the local copy is recent enough to trust.
+
+        Returns:
+            bool: True if the last sync is within the max age
+        """
+
+        return time.monotonic() - self.synced_at <= self.max_age
+
+    def is_revoked(self, claims: dict) -> bool:
+        """Checks the token against the local copy of the denylist.
+
+        Args:
+            claims (dict): Verified claims of the token
+
+        Returns:
+            bool: True if the token, its user or every token is revoked
+        """
+
+        if f"{TOKEN_PREFIX}{claims['jti']}" in self.entries:
+            return True
+
+        return any(
+            claims["iat"] <= self.entries.get(field, -math.inf)
+            for field in (f"{USER_PREFIX}{claims['sub']}", INVALIDATE_ALL)
+        )
+
+    def is_expired(self, field: str, value: float, now: float) -> bool:
+        """Checks if every token the denylist field revokes has expired.
+
+        Args:
+            field (str): Denylist field
+            value (float): Expiration or revocation time of the field
+            now (float): Current time
+
+        Returns:
+            bool: True if the field can be removed
+        """
+
+        if field.startswith(TOKEN_PREFIX):
+            return value < now
+
+        return value < now - self.lifetime_seconds
+
+    async def sync(self) -> None:
+        """Fetches the whole denylist and removes its expired fields."""
+
+        now = time.time()
+        entries = {
+            field.decode(): float(value)
+            for field, value in (await self.redis.hgetall(self.key)).items()
+        }
+        expired = [
+            field
+            for field, value in entries.items()
+            if self.is_expired(field, value, now)
+        ]
+
+        if expired:
+            await self.redis.hdel(self.key, *expired)
+
+        self.entries = {
+            field: value for field, value in entries.items() if field not in expired
+        }
+        self.synced_at = time.monotonic()
+
+    async def revoke(self, entries: dict[str, float]) -> None:
+        """Adds the fields to the local copy at once and to the redis denylist.
+
+        Args:
+            entries (dict[str, float]): Denylist fields with their times
+        """
+
+        self.entries.update(entries)
+        await self.redis.hset(self.key, mapping=entries)
+
+    def revoke_users(self, messages: set[str]) -> None:
+        """Revokes the tokens issued before now to the users with changed columns
+        or deleted, as the tokens carry the users' data. Handler of the committed
+        users changes.
+
+        Args:
+            messages (set[str]): "user:<id>" or "all" messages of the changes
+        """
+
+        now = time.time()
+        entries = {
+            message: now
+            for message in messages
+            if message.startswith(USER_PREFIX) or message == INVALIDATE_ALL
+        }
+
+        if not entries:
+            return
+
+        task = asyncio.get_running_loop().create_task(self.revoke(entries))
+        self._revoke_tasks.add(task)
+        task.add_done_callback(self._revoke_tasks.discard)
+
+    async def run(self) -> None:
+        """Fetches the denylist periodically."""
+
+        while True:
+            try:
+                await self.sync()
+            except (RedisError, OSError) as error:
+                logger.warning("Signed tokens denylist sync failed: %s", error)
+
+            await asyncio.sleep(self.sync_interval)
+
+    def start(self) -> None:
+        """Starts fetching the denylist in the background."""
+
+        if self._syncer is None:
+            self._syncer = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stops fetching the denylist."""
+
+        if self._syncer is not None:
+            self._syncer.cancel()
+            await asyncio.gather(self._syncer, return_exceptions=True)
+            self._syncer = None
+
+
+token_denylist = TokenDenylist(
+    redis=redis_connector.get_client(),
+    key=settings.signed_token.denylist_key,
+    lifetime_seconds=settings.signed_token.lifetime_seconds,
+    sync_interval=settings.signed_token.denylist_sync_interval,
+    max_age=settings.signed_token.denylist_max_age,
+)
+
+if settings.signed_token.enabled:
+    user_change_handlers.append(token_denylist.revoke_users)
+
+
+class SignedTokenStrategy(JWTStrategy[User, int]):
+    """Strategy issuing short-lived signed tokens carrying the user's data and a
+    unique id. A token is verified by its signature and the local copy of the
+    denylist, and the user is built from its claims, without redis and database
+    queries.
+
+    A committed change of the user's columns or the user's deletion revokes the
+    user's tokens, as their claims become stale, the user has to log in again.
+    Changes of the user's meetings and tasks keep the tokens valid.
+    """
+
+    def __init__(
+        self,
+        secret: str,
+        lifetime_seconds: int,
+        denylist: TokenDenylist,
+        algorithm: str = "HS256",
+    ) -> None:
+        """Inits SignedTokenStrategy.
+
+        Args:
+            secret (str): Secret the tokens are signed with
+            lifetime_seconds (int): Lifetime of the token
+            denylist (TokenDenylist): Denylist of the revoked tokens
+            algorithm (str): Signing algorithm. "HS256" by default
+
+        Raises:
+            ValueError: If the secret is empty
+        """
+
+        if not secret:
+            raise ValueError("The signed tokens secret is required")
+
+        super().__init__(
+            secret=secret, lifetime_seconds=lifetime_seconds, algorithm=algorithm
+        )
+        self.denylist = denylist
+
+    def decode(self, token: str) -> dict:
+        """Verifies the token and provides its claims.
+
+        Args:
+            token (str): Signed token
+
+        Raises:
+            jwt.PyJWTError: If the token is invalid or expired
+
+        Returns:
+            dict: Token claims
+        """
+
+        return decode_jwt(
+            token, self.decode_key, self.token_audience, algorithms=[self.algorithm]
+        )
+
+    async def read_token(
+        self, token: str | None, user_manager: BaseUserManager[User, int]
+    ) -> User | None:
+        if token is None:
+            return None
+
+        try:
+            claims = self.decode(token)
+            snapshot = {"id": int(claims["sub"])} | {
+                claim: claims[claim] for claim in USER_CLAIMS
+            }
+        except (jwt.PyJWTError, KeyError, ValueError):
+            return None
+
+        if not self.denylist.is_fresh:
+            signed_token_rejections.inc(reason="stale_denylist")
+            return None
+
+        if self.denylist.is_revoked(claims):
+            signed_token_rejections.inc(reason="revoked")
+            return None
+
+        return await UserCache.load(snapshot, user_manager.user_db.session)
+
+    async def write_token(self, user: User) -> str:
+        data = {
+            "sub": str(user.id),
+            "aud": self.token_audience,
+            "jti": uuid4().hex,
+            "iat": time.time(),
+        } | {claim: getattr(user, claim) for claim in USER_CLAIMS}
+
+        return generate_jwt(
+            data, self.encode_key, self.lifetime_seconds, algorithm=self.algorithm
+        )
+
+    async def destroy_token(self, token: str, user: User) -> None:
+        claims = self.decode(token)
+
+        await self.denylist.revoke({f"{TOKEN_PREFIX}{claims['jti']}": claims["exp"]})
@@ -0,0 +1,321 @@
+import asyncio
+import logging
+from collections.abc import Callable
+
+from fastapi_users.authentication import RedisStrategy
+from fastapi_users.manager import BaseUserManager
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session, make_transient_to_detached
+
+from core.cache import TTLCache
+from core.config import settings
+from core.metrics import Counter
+from core.redis import redis_connector
+from structures.models import Role, Structure
+from users.models import User
+
+logger = logging.getLogger(__name__)
+
+INVALIDATIONS_KEY = "auth_cache_invalidations"
+INVALIDATE_ALL = "all"
+TOKEN_PREFIX = "token:"
+USER_PREFIX = "user:"
+RESUBSCRIBE_DELAY = 1.0
+
+auth_cache_lookups = Counter(
+    "auth_cache_lookups_total",
+    "The number of the authenticated user lookups in the in-process cache",
+    label_names=("result",),
+)
+
+
+class UserCache:
+    """In-process cache of the authenticated users snapshots by their tokens. The
+    workers invalidate each other's caches through a redis channel, the cache isn't
+    used while the worker isn't subscribed to it, as it could miss invalidations.
+
+    Attributes:
+        snapshots (TTLCache[str, dict]): Users' columns values by token
+        generation (int): The number of invalidations, a snapshot loaded before an
+        invalidation isn't stored
+        subscribed (bool): Whether the worker receives the invalidations
+    """
+
+    def __init__(self, redis: Redis, channel: str, max_size: int, ttl: float) -> None:
+        """Inits UserCache.
+
+        Args:
+            redis (Redis): Redis client to publish and receive the invalidations
+            channel (str): Redis channel of the invalidations
+            max_size (int): The number of users snapshots to keep
+            ttl (float): For how many seconds a snapshot is used
+        """
+
+        self.redis = redis
+        self.channel = channel
+        self.snapshots: TTLCache[str, dict] = TTLCache(max_size=max_size, ttl=ttl)
+        self.generation = 0
+        self.subscribed = False
+        self._listener: asyncio.Task | None = None
+        self._publish_tasks: set[asyncio.Task] = set()
+
+    def get(self, token: str) -> dict | None:
+        """Provides the snapshot of the user the token belongs to.
+
+        Args:
+            token (str): Access token
+
+        Returns:
+            dict | None: User's columns values, None if not cached or the cache is
+            unavailable
+        """
+
+        snapshot = self.snapshots.get(token) if self.subscribed else None
+        auth_cache_lookups.inc(result="miss" if snapshot is None else "hit")
+
+        return snapshot
+
+    def store(self, token: str, user: User, generation: int) -> None:
+        """Stores the user's snapshot if no invalidation happened since the user was
+        loaded.
+
+        Args:
+            token (str): Access token of the user
+            user (User): User loaded by the token
+            generation (int): The cache generation before the user was loaded
+        """
+
+        if not self.subscribed or generation != self.generation:
+            return
+
+        self.snapshots.set(
+            token,
+            {
+                attribute.key: getattr(user, attribute.key)
+                for attribute in inspect(User).column_attrs
+            },
+        )
+
+    @staticmethod
+    async def load(snapshot: dict, session: AsyncSession) -> User:
+        """Builds the user from the snapshot and adds it to the session as a
+        persistent object without a query.
+
+        Args:
+            snapshot (dict): User's columns values
+            session (AsyncSession): Async database session of the request
+
+        Returns:
+            User: User bound to the session
+        """
+
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+
+        return await session.merge(user, load=False)
+
+    def invalidate_locally(self, message: str) -> None:
+        """Removes the snapshots named by the invalidation message.
+
+        Args:
+            message (str): "token:<token>", "user:<id>" or "all"
+        """
+
+        self.generation += 1
+
+        if message.startswith(TOKEN_PREFIX):
+            self.snapshots.pop(message.removeprefix(TOKEN_PREFIX))
+        elif message.startswith(USER_PREFIX):
+            user_id = int(message.removeprefix(USER_PREFIX))
+            self.snapshots.remove_if(lambda snapshot: snapshot["id"] == user_id)
+        else:
+            self.snapshots.clear()
+
+    def invalidate(self, messages: set[str]) -> None:
+        """Removes the snapshots in this worker at once and publishes the
+        invalidations to the other workers in the background.
+
+        Args:
+            messages (set[str]): Invalidation messages, see invalidate_locally
+        """
+
+        if INVALIDATE_ALL in messages:
+            messages = {INVALIDATE_ALL}
+
+        for message in messages:
+            self.invalidate_locally(message)
+
+        task = asyncio.get_running_loop().create_task(self.publish(messages))
+        self._publish_tasks.add(task)
+        task.add_done_callback(self._publish_tasks.discard)
+
+    async def publish(self, messages: set[str]) -> None:
+        """Publishes the invalidations to the other workers.
+
+        Args:
+            messages (set[str]): Invalidation messages, see invalidate_locally
+        """
+
+        try:
+            for message in messages:
+                await self.redis.publish(self.channel, message)
+        except (RedisError, OSError):
+            logger.exception("Failed to publish the auth cache invalidations")
+
+    async def listen(self) -> None:
+        """Receives the invalidations of the other workers, resubscribing after a
+        connection failure. The cache is cleared and not used until subscribed."""
+
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    self.subscribed = True
+
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self.invalidate_locally(message["data"].decode())
+            except (RedisError, OSError) as error:
+                logger.warning("Auth cache invalidations channel failed: %s", error)
+            finally:
+                self.subscribed = False
+                self.invalidate_locally(INVALIDATE_ALL)
+
+            await asyncio.sleep(RESUBSCRIBE_DELAY)
+
+    def start(self) -> None:
+        """Starts receiving the invalidations in the background."""
+
+        if self._listener is None:
+            self._listener = asyncio.create_task(self.listen())
+
+    async def stop(self) -> None:
+        """Stops receiving the invalidations."""
+
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+
+
+user_cache = UserCache(
+    redis=redis_connector.get_client(),
+    channel=settings.auth_cache.channel,
+    max_size=settings.auth_cache.max_size,
+    ttl=settings.auth_cache.ttl,
+)
+
+# Called with the invalidation messages of every committed users change, see
+# UserCache.invalidate_locally for the messages
+user_change_handlers: list[Callable[[set[str]], None]] = []
+
+if settings.auth_cache.enabled:
+    user_change_handlers.append(user_cache.invalidate)
+
+
+class CachedRedisStrategy(RedisStrategy):
+    """Redis strategy resolving the token to the user from the in-process cache,
+    without redis and database queries, and falling back to them on a miss."""
+
+    async def read_token(
+        self, token: str | None, user_manager: BaseUserManager[User, int]
+    ) -> User | None:
+        if token is None:
+            return None
+
+        snapshot = user_cache.get(token)
+
+        if snapshot is not None:
+            return await user_cache.load(snapshot, user_manager.user_db.session)
+
+        generation = user_cache.generation
+        user = await super().read_token(token, user_manager)
+
+        if user is not None:
+            user_cache.store(token, user, generation)
+
+        return user
+
+    async def destroy_token(self, token: str, user: User) -> None:
+        await super().destroy_token(token, user)
+        user_cache.invalidate({f"{TOKEN_PREFIX}{token}"})
+
+
+@event.listens_for(Session, "after_flush")
+def collect_user_changes(session: Session, flush_context) -> None:
+    """Collects the invalidations of the flushed users changes. A user is dirty
+    when only its relationship collections change through a backref, such as a
+    meeting membership, so only the users with changed columns are invalidated.
+    Deleted roles and structures change the users' roles, so they invalidate
+    every snapshot.
+
+    Args:
+        session (Session): Flushed session
+        flush_context: Unit of work flush context
+    """
+
+    invalidations = session.info.setdefault(INVALIDATIONS_KEY, set())
+
+    for instance in session.dirty:
+        if isinstance(instance, User) and session.is_modified(
+            instance, include_collections=False
+        ):
+            invalidations.add(f"{USER_PREFIX}{instance.id}")
+
+    for instance in session.deleted:
+        if isinstance(instance, User):
+            invalidations.add(f"{USER_PREFIX}{instance.id}")
+
+    if any(isinstance(instance, (Role, Structure)) for instance in session.deleted):
+        invalidations.add(INVALIDATE_ALL)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def collect_bulk_user_changes(orm_execute_state: ORMExecuteState) -> None:
+    """Invalidates every snapshot on a bulk update or delete of users, roles or
+    structures.
+
+    Args:
+        orm_execute_state (ORMExecuteState): Executed statement state
+    """
+
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+
+    if any(
+        mapper.class_ in (User, Role, Structure)
+        for mapper in orm_execute_state.all_mappers
+    ):
+        orm_execute_state.session.info.setdefault(INVALIDATIONS_KEY, set()).add(
+            INVALIDATE_ALL
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def publish_user_changes(session: Session) -> None:
+    """Passes the invalidations of the committed users changes to the user change
+    handlers.
+
+    Args:
+        session (Session): Committed session
+    """
+
+    invalidations = session.info.pop(INVALIDATIONS_KEY, None)
+
+    if invalidations:
+        for handler in user_change_handlers:
+            handler(invalidations)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_user_changes(session: Session) -> None:
+    """Forgets the invalidations of the rolled back changes.
+
+    Args:
+        session (Session): Rolled back session
+    """
+
+    session.info.pop(INVALIDATIONS_KEY, None)
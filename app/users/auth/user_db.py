@@ -0,0 +1,21 @@
+from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+
+from structures.models import Role
+from users.models import User
+
+
+class UserDatabase(SQLAlchemyUserDatabase[User, int]):
+    """Fastapi-users database adapter of the User model loading the user's role and
+    structure by the same joined query, so the authenticated user comes with the
+    request context."""
+
+    async def get(self, id: int) -> User | None:
+        stmt = (
+            select(User)
+            .options(joinedload(User.role).joinedload(Role.structure))
+            .where(User.id == id)
+        )
+
+        return await self._get_user(stmt)
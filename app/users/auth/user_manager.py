@@ -1,19 +1,186 @@
 import logging
+from typing import Any
 
+import jwt
 from fastapi import Request
-from fastapi_users import BaseUserManager, IntegerIDMixin
+from fastapi.security import OAuth2PasswordRequestForm
+from fastapi_users import BaseUserManager, IntegerIDMixin, exceptions
+from fastapi_users.jwt import decode_jwt, generate_jwt
+from fastapi_users.schemas import BaseUserCreate
 
 from core.config import settings
 from users.models import User
 
+from .password_hasher import password_hasher
+
 logger = logging.getLogger(__name__)
 
 
 class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
-    """A class for users managment logic"""
+    """A class for users managment logic. The passwords are hashed and verified by
+    the password hasher threads instead of the event loop."""
 
     reset_password_token_secret = settings.access_token.reset_password_token_secret
     verification_token_secret = settings.access_token.verification_token_secret
+    password_hasher = password_hasher
+
+    async def create(
+        self,
+        user_create: BaseUserCreate,
+        safe: bool = False,
+        request: Request | None = None,
+    ) -> User:
+        """Creates a user in database.
+
+        Args:
+            user_create (BaseUserCreate): Pydantic schema to create user
+            safe (bool): Ignore is_superuser and is_verified values. Default to False
+            request (Request | None): Fastapi request object. Default to None
+
+        Raises:
+            UserAlreadyExists: If a user with the same email exists
+
+        Returns:
+            User: Created user
+        """
+
+        await self.validate_password(user_create.password, user_create)
+
+        if await self.user_db.get_by_email(user_create.email) is not None:
+            raise exceptions.UserAlreadyExists()
+
+        user_dict = (
+            user_create.create_update_dict()
+            if safe
+            else user_create.create_update_dict_superuser()
+        )
+        user_dict["hashed_password"] = await self.password_hasher.hash(
+            user_dict.pop("password")
+        )
+
+        created_user = await self.user_db.create(user_dict)
+
+        await self.on_after_register(created_user, request)
+
+        return created_user
+
+    async def authenticate(self, credentials: OAuth2PasswordRequestForm) -> User | None:
+        """Authenticates the user by email and password, upgrading the password hash
+        if it's outdated.
+
+        Args:
+            credentials (OAuth2PasswordRequestForm): User's credentials
+
+        Returns:
+            User | None: Authenticated user, None if the credentials are invalid
+        """
+
+        try:
+            user = await self.get_by_email(credentials.username)
+        except exceptions.UserNotExists:
+            # Hash the password anyway to mitigate the timing attack
+            await self.password_hasher.hash(credentials.password)
+            return None
+
+        verified, updated_password_hash = await self.password_hasher.verify_and_update(
+            credentials.password, user.hashed_password
+        )
+
+        if not verified:
+            return None
+
+        if updated_password_hash is not None:
+            await self.user_db.update(user, {"hashed_password": updated_password_hash})
+
+        return user
+
+    async def forgot_password(self, user: User, request: Request | None = None) -> None:
+        """Starts a forgot password request.
+
+        Args:
+            user (User): The user that forgot its password
+            request (Request | None): Fastapi request object. Default to None
+
+        Raises:
+            UserInactive: If the user is inactive
+        """
+
+        if not user.is_active:
+            raise exceptions.UserInactive()
+
+        token_data = {
+            "sub": str(user.id),
+            "password_fgpt": await self.password_hasher.hash(user.hashed_password),
+            "aud": self.reset_password_token_audience,
+        }
+        token = generate_jwt(
+            token_data,
+            self.reset_password_token_secret,
+            self.reset_password_token_lifetime_seconds,
+        )
+
+        await self.on_after_forgot_password(user, token, request)
+
+    async def reset_password(
+        self, token: str, password: str, request: Request | None = None
+    ) -> User:
+        """Resets the user's password by the forgot password token.
+
+        Args:
+            token (str): The token generated by forgot_password
+            password (str): New password
+            request (Request | None): Fastapi request object. Default to None
+
+        Raises:
+            InvalidResetPasswordToken: If the token is invalid or expired
+            UserInactive: If the user is inactive
+
+        Returns:
+            User: The user with updated password
+        """
+
+        try:
+            data = decode_jwt(
+                token,
+                self.reset_password_token_secret,
+                [self.reset_password_token_audience],
+            )
+            user_id = self.parse_id(data["sub"])
+            password_fingerprint = data["password_fgpt"]
+        except (jwt.PyJWTError, KeyError, exceptions.InvalidID) as error:
+            raise exceptions.InvalidResetPasswordToken() from error
+
+        user = await self.get(user_id)
+
+        valid_fingerprint, _ = await self.password_hasher.verify_and_update(
+            user.hashed_password, password_fingerprint
+        )
+
+        if not valid_fingerprint:
+            raise exceptions.InvalidResetPasswordToken()
+
+        if not user.is_active:
+            raise exceptions.UserInactive()
+
+        updated_user = await self._update(user, {"password": password})
+
+        await self.on_after_reset_password(user, request)
+
+        return updated_user
+
+    async def _update(self, user: User, update_dict: dict[str, Any]) -> User:
+        password = update_dict.get("password")
+
+        if password is not None:
+            await self.validate_password(password, user)
+            update_dict = {
+                field: value
+                for field, value in update_dict.items()
+                if field != "password"
+            }
+            update_dict["hashed_password"] = await self.password_hasher.hash(password)
+
+        return await super()._update(user, update_dict)
 
     async def on_after_register(
         self, user: User, request: Request | None = None
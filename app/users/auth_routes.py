@@ -2,7 +2,10 @@ from fastapi import APIRouter
 
 from core.config import settings
 
-from .dependencies.backend import redis_authentication_backend
+from .dependencies.backend import (
+    redis_authentication_backend,
+    signed_token_authentication_backend,
+)
 from .dependencies.fastapi_users_routes import fastapi_users
 from .schemas import UserCreate, UserRead
 
@@ -17,6 +20,13 @@ router.include_router(
     router=fastapi_users.get_auth_router(redis_authentication_backend),
 )
 
+# /signed/login
+# /signed/logout
+if settings.signed_token.enabled:
+    router.include_router(
+        router=fastapi_users.get_auth_router(signed_token_authentication_backend),
+        prefix="/signed",
+    )
 
 # /register
 router.include_router(
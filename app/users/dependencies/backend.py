@@ -2,7 +2,11 @@ from fastapi_users.authentication import AuthenticationBackend
 
 from users.auth import bearer_transport
 
-from .strategy import get_database_strategy, get_redis_strategy
+from .strategy import (
+    get_database_strategy,
+    get_redis_strategy,
+    get_signed_token_strategy,
+)
 
 authentication_backend = AuthenticationBackend(
     name="access-tokens-db",
@@ -16,3 +20,10 @@ redis_authentication_backend = AuthenticationBackend(
     transport=bearer_transport,
     get_strategy=get_redis_strategy,
 )
+
+
+signed_token_authentication_backend = AuthenticationBackend(
+    name="signed-tokens",
+    transport=bearer_transport,
+    get_strategy=get_signed_token_strategy,
+)
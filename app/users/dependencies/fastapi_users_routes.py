@@ -1,14 +1,45 @@
+from fastapi import Depends
 from fastapi_users import FastAPIUsers
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.config import settings
+from core.models import db_connector
 from users.models import User
 
-from .backend import redis_authentication_backend
+from .backend import redis_authentication_backend, signed_token_authentication_backend
 from .user_manager import get_user_manager
 
-fastapi_users = FastAPIUsers[User, int](
-    get_user_manager,
-    [redis_authentication_backend],
+# The signed tokens are tried first, as they are verified without I/O
+authentication_backends = (
+    [signed_token_authentication_backend, redis_authentication_backend]
+    if settings.signed_token.enabled
+    else [redis_authentication_backend]
 )
 
-current_user = fastapi_users.current_user(active=True)
+fastapi_users = FastAPIUsers[User, int](get_user_manager, authentication_backends)
+
+current_active_user = fastapi_users.current_user(active=True)
 current_superuser = fastapi_users.current_user(active=True, superuser=True)
+
+
+async def current_user(
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(db_connector.get_session),
+) -> User:
+    """Fetches the current active user and binds the request's database sessions to
+    the user, so the user's reads follow the user's writes. The connection used to
+    fetch the user goes back to the pool, so it isn't held while the route does
+    something else.
+
+    Args:
+        user (User): Current active user
+        session (AsyncSession): Async database session the user is fetched with
+
+    Returns:
+        User: Current active user
+    """
+
+    db_connector.set_session_owner(user.id)
+    await db_connector.release_connection(session)
+
+    return user
@@ -7,6 +7,8 @@ from fastapi_users.authentication.strategy.db import (
 
 from core.config import settings
 from core.redis import redis_connector
+from users.auth.signed_tokens import SignedTokenStrategy, token_denylist
+from users.auth.user_cache import CachedRedisStrategy
 from users.models import AccessToken
 
 from .access_tokens import get_access_token_db
@@ -31,13 +33,33 @@ def get_database_strategy(
 
 
 def get_redis_strategy() -> RedisStrategy:
-    """Provides RedisStrategy instance for handling access tokens.
+    """Provides RedisStrategy instance for handling access tokens. The tokens are
+    resolved to the users from the in-process cache if it's enabled.
 
     Returns:
         RedisStrategy: The strategy for managing access token
     """
 
-    return RedisStrategy(
+    strategy_class = (
+        CachedRedisStrategy if settings.auth_cache.enabled else RedisStrategy
+    )
+
+    return strategy_class(
         redis=redis_connector.get_client(),
         lifetime_seconds=settings.access_token.lifetime_seconds,
     )
+
+
+def get_signed_token_strategy() -> SignedTokenStrategy:
+    """Provides SignedTokenStrategy instance for handling signed access tokens.
+
+    Returns:
+        SignedTokenStrategy: The strategy for managing signed access token
+    """
+
+    return SignedTokenStrategy(
+        secret=settings.signed_token.secret,
+        lifetime_seconds=settings.signed_token.lifetime_seconds,
+        denylist=token_denylist,
+        algorithm=settings.signed_token.algorithm,
+    )
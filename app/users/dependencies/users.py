@@ -5,16 +5,18 @@ from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.models import db_connector
+from users.auth.user_db import UserDatabase
 from users.models import User
 
 
 async def get_user_db(
     session: AsyncSession = Depends(db_connector.get_session),
 ) -> AsyncGenerator[SQLAlchemyUserDatabase, None]:
-    """Provides initialized database adapter of User model.
+    """Provides initialized database adapter of User model loading the user's
+    role and structure with the user.
 
     Args:
         session (AsyncSession): Async database session.
     """
 
-    yield User.get_db(session=session)
+    yield UserDatabase(session, User)
@@ -3,3 +3,9 @@ from fastapi import HTTPException, status
 UserNotFound = HTTPException(
     status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
 )
+
+
+PasswordHashingBusy = HTTPException(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail="Too many password operations in progress, try again",
+)
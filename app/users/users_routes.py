@@ -1,14 +1,60 @@
-from fastapi import APIRouter
+from functools import partial
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 
 from core.config import settings
+from core.deadline import DeadlineRoute
+from core.export import ExportFormat, export_response
+from core.model_adapter import ModelAdapter
 
-from .dependencies.fastapi_users_routes import fastapi_users
+from .dependencies.fastapi_users_routes import current_superuser, fastapi_users
+from .models import User
 from .schemas import UserRead, UserUpdate
 
 router = APIRouter(
     prefix=settings.prefix.users,
     tags=["Users"],
+    route_class=DeadlineRoute,
+)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    dependencies=[Depends(current_superuser)],
+    summary="Export all the users",
+    description="""
+    Streams all the users ordered by id as newline delimited JSON or CSV. The users
+    are fetched from the database by chunks, so the export runs in constant memory.
+    Requires superuser authorization.
+
+    Parameters:
+    - format: The export format, "ndjson" or "csv"
+    """,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+            "description": "The exported users",
+        },
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "The current user unauthorized",
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "description": "The current user is not a superuser",
+        },
+    },
 )
+async def export_users(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+):
+    return export_response(
+        adapter_factory=partial(ModelAdapter, User),
+        schema=UserRead,
+        export_format=export_format,
+        filename="users",
+    )
+
 
 # /me
 # /{id}
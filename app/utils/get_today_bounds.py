@@ -0,0 +1,13 @@
+from datetime import datetime, time, timedelta
+
+
+def get_today_bounds() -> tuple[datetime, datetime]:
+    """Get datetimes of the current day's start and the next day's start.
+
+    Returns:
+        tuple[datetime, datetime]: Today's start and tomorrow's start datetimes
+    """
+
+    today_start = datetime.combine(datetime.now().date(), time.min)
+
+    return today_start, today_start + timedelta(days=1)
@@ -1,6 +1,7 @@
 import decimal
 
-from sqlalchemy import func, select
+from pydantic import BaseModel
+from sqlalchemy import Row, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.model_adapter import ModelAdapter
@@ -46,15 +47,15 @@ class WorkTaskAdapter(ModelAdapter):
         )
 
         self.session.add(work_task)
-        await self.session.commit()
-        await self.session.refresh(work_task)
+        await self.session.flush()
 
         return work_task
 
     async def update_status(
         self, status_update_schema: WorkTaskUpdateStatus, task: WorkTask
     ) -> WorkTask:
-        """Updates status of the work task using WorkTaskStatusEnum values.
+        """Updates status of the work task using WorkTaskStatusEnum values. Nothing is
+        written if the status hasn't changed.
 
         Args:
             status_update_schema (WorkTaskUpdateStatus): Pydantic schema with data to
@@ -66,10 +67,13 @@ class WorkTaskAdapter(ModelAdapter):
         """
 
         new_status: WorkTaskStatusEnum = status_update_schema.model_dump().get("status")
+
+        if task.status == new_status.value:
+            return task
+
         task.status = new_status.value
 
-        await self.session.commit()
-        await self.session.refresh(task)
+        await self.session.flush()
 
         return task
 
@@ -119,30 +123,66 @@ class WorkTaskAdapter(ModelAdapter):
 
         return await self.session.scalar(stmt)
 
-    async def get_user_assigned_tasks(self, user_id: int) -> list[WorkTask]:
-        """Gets all tasks where user with provided user id is assignee.
+    async def get_user_assigned_tasks(
+        self,
+        user_id: int,
+        cursor: str | None = None,
+        limit: int | None = None,
+        schema: type[BaseModel] | None = None,
+    ) -> tuple[list[WorkTask | Row], str | None]:
+        """Gets a page of tasks where user with provided user id is assignee ordered by
+        complete_by.
 
         Args:
             user_id (int): User id
+            cursor (str | None): Cursor returned with the previous page
+            limit (int | None): Maximum number of tasks in the page
+            schema (type[BaseModel] | None): Response schema to select the columns
+            for. Task models are loaded if not provided
 
         Returns:
-            list[WorkTask]: List of task models
+            tuple[list[WorkTask | Row], str | None]: List of task models or rows and
+            the next page cursor
         """
 
         stmt = select(self.model).where(self.model.assignee_id == user_id)
 
-        return await self.session.scalars(stmt)
+        return await self.read_page(
+            stmt,
+            sort_column=self.model.complete_by,
+            cursor=cursor,
+            limit=limit,
+            schema=schema,
+        )
 
-    async def get_user_created_tasks(self, user_id: int) -> list[WorkTask]:
-        """Gets all tasks where user with provided user id is creator.
+    async def get_user_created_tasks(
+        self,
+        user_id: int,
+        cursor: str | None = None,
+        limit: int | None = None,
+        schema: type[BaseModel] | None = None,
+    ) -> tuple[list[WorkTask | Row], str | None]:
+        """Gets a page of tasks where user with provided user id is creator ordered by
+        complete_by.
 
         Args:
             user_id (int): User id
+            cursor (str | None): Cursor returned with the previous page
+            limit (int | None): Maximum number of tasks in the page
+            schema (type[BaseModel] | None): Response schema to select the columns
+            for. Task models are loaded if not provided
 
         Returns:
-            list[WorkTask]: List of task models
+            tuple[list[WorkTask | Row], str | None]: List of task models or rows and
+            the next page cursor
         """
 
         stmt = select(self.model).where(self.model.creator_id == user_id)
 
-        return await self.session.scalars(stmt)
+        return await self.read_page(
+            stmt,
+            sort_column=self.model.complete_by,
+            cursor=cursor,
+            limit=limit,
+            schema=schema,
+        )
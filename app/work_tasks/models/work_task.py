@@ -1,7 +1,7 @@
 import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from starlette.requests import Request
 
@@ -34,6 +34,21 @@ class WorkTask(Base):
         foreign_keys=[assignee_id], back_populates="assigned_work_tasks"
     )
 
+    __table_args__ = (
+        Index(
+            "ix_work_tasks_assignee_id_complete_by_id",
+            "assignee_id",
+            "complete_by",
+            "id",
+        ),
+        Index(
+            "ix_work_tasks_creator_id_complete_by_id",
+            "creator_id",
+            "complete_by",
+            "id",
+        ),
+    )
+
     async def __admin_repr__(self, request: Request) -> str:
         """Model's representation in admin.
 
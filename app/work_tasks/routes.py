@@ -1,30 +1,40 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.batch import BatchResult, batch_query_budget
 from core.config import settings
+from core.deadline import DeadlineRoute, request_deadline
+from core.export import ExportFormat, export_response
 from core.model_adapter import ModelAdapter
 from core.models import db_connector
+from core.pagination import CursorPage, PaginationParams, get_pagination_params
 from structures.adapters.relation_adapter import RelationAdapter
 from structures.adapters.role_adapter import RoleAdapter
 from structures.dependencies.role import current_user_role
 from structures.schemas.role import RoleOut
-from users.dependencies.fastapi_users_routes import current_user
+from users.dependencies.fastapi_users_routes import current_superuser, current_user
 from users.models import User
 from users.schemas import UserRead
 
 from .adapters.work_task_adapter import WorkTaskAdapter
 from .schemas import (
+    WorkTaskBatchUpdate,
     WorkTaskCreate,
     WorkTaskOut,
+    WorkTaskPatch,
     WorkTaskUpdate,
     WorkTaskUpdateRate,
     WorkTaskUpdateStatus,
 )
 from .service import WorkTaskService
 
+RATING_DEADLINE_SECONDS = 5
+
 router = APIRouter(
     prefix=settings.prefix.work_tasks,
     tags=["Work Tasks"],
+    route_class=DeadlineRoute,
 )
 
 
@@ -81,6 +91,130 @@ async def create_task(
     )
 
 
+@router.post(
+    "/batch",
+    response_model=BatchResult[WorkTaskOut],
+    dependencies=[Depends(batch_query_budget)],
+    summary="Create a batch of work tasks",
+    description="""
+    Creates work tasks using the provided list of schemas in a single transaction.
+    Requires authorization, the authenticated user registers as the work tasks' creator.
+    Tasks which don't meet the requirements aren't created and are reported in "errors"
+    with their position in the batch.
+
+    Requirements:
+    - The creator must have a role
+    - The assignee users must exist
+    - The assignee users must be subordinates of the creator
+    - The "complete_by" datetimes for the work tasks must be in the future
+    """,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "The current user unauthorized",
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "description": "The current user doesn't have any role",
+        },
+    },
+)
+async def create_tasks(
+    task_input_schemas: list[WorkTaskCreate] = Body(
+        ..., max_length=settings.batch.max_size
+    ),
+    current_user: UserRead = Depends(current_user),
+    current_user_role: RoleOut = Depends(current_user_role),
+    session: AsyncSession = Depends(db_connector.get_session),
+):
+    tasks_adapter = WorkTaskAdapter(session)
+    users_adapter = ModelAdapter(User, session)
+    relations_adapter = RelationAdapter(session)
+
+    tasks_service = WorkTaskService(tasks_adapter)
+
+    return await tasks_service.create_tasks(
+        user_id=current_user.id,
+        user_role_id=current_user_role.id,
+        task_create_schemas=task_input_schemas,
+        users_adapter=users_adapter,
+        relations_adapter=relations_adapter,
+    )
+
+
+@router.put(
+    "/batch",
+    response_model=BatchResult[WorkTaskOut],
+    dependencies=[Depends(batch_query_budget)],
+    summary="Update a batch of work tasks",
+    description="""
+    Updates existing work tasks using the provided list of schemas with the work tasks'
+    ids in a single transaction. Requires authorization. Tasks which don't meet the
+    requirements aren't updated and are reported in "errors" with their position in
+    the batch.
+
+    Requirements:
+    - The work tasks with provided ids must exist
+    - The current user must be creator of the work tasks
+    - The "complete_by" datetimes for the work tasks must be in the future
+    """,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "The current user unauthorized",
+        },
+    },
+)
+async def update_tasks(
+    task_input_schemas: list[WorkTaskBatchUpdate] = Body(
+        ..., max_length=settings.batch.max_size
+    ),
+    current_user: UserRead = Depends(current_user),
+    session: AsyncSession = Depends(db_connector.get_session),
+):
+    tasks_adapter = WorkTaskAdapter(session)
+
+    tasks_service = WorkTaskService(tasks_adapter)
+
+    return await tasks_service.update_tasks(
+        user_id=current_user.id,
+        task_update_schemas=task_input_schemas,
+    )
+
+
+@router.delete(
+    "/batch",
+    response_model=BatchResult[int],
+    dependencies=[Depends(batch_query_budget)],
+    summary="Delete a batch of work tasks",
+    description="""
+    Deletes work tasks with provided ids in a single transaction. Requires
+    authorization. Returns ids of the deleted work tasks, tasks which don't meet the
+    requirements aren't deleted and are reported in "errors" with their position in
+    the batch.
+
+    Parameters:
+    - ids: The ids of the work tasks to delete
+
+    Requirements:
+    - The work tasks with provided ids must exist
+    - The current user must be creator of the work tasks
+    """,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "The current user unauthorized",
+        },
+    },
+)
+async def delete_tasks(
+    ids: list[int] = Query(..., max_length=settings.batch.max_size),
+    current_user: UserRead = Depends(current_user),
+    session: AsyncSession = Depends(db_connector.get_session),
+):
+    tasks_adapter = WorkTaskAdapter(session)
+
+    tasks_service = WorkTaskService(tasks_adapter)
+
+    return await tasks_service.delete_tasks(task_ids=ids, user_id=current_user.id)
+
+
 @router.put(
     "/{task_id}",
     response_model=WorkTaskOut,
@@ -126,6 +260,52 @@ async def update_task(
     )
 
 
+@router.patch(
+    "/{task_id}",
+    response_model=WorkTaskOut,
+    summary="Partially update a work task",
+    description="""
+    Updates the provided fields of an existing work task. Requires authorization.
+    Omitted fields are left unchanged, nothing is written if no field has changed.
+
+    Parameters:
+    - task_id: The id of the work task to update
+
+    Requirements:
+    - A work task with provided id must exist
+    - The current user must be creator of the work task
+    - The "complete_by" datetime for the work task, if provided, must be in the future
+    """,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "The current user unauthorized",
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "description": """The task complete by is in the past;
+                              The current user isn't a creator of the task""",
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "A task with provided id isn't found",
+        },
+    },
+)
+async def patch_task(
+    task_id: int,
+    task_input_schema: WorkTaskPatch,
+    current_user: UserRead = Depends(current_user),
+    session: AsyncSession = Depends(db_connector.get_session),
+):
+    tasks_adapter = WorkTaskAdapter(session)
+
+    tasks_service = WorkTaskService(tasks_adapter)
+
+    return await tasks_service.update_task(
+        task_id=task_id,
+        user_id=current_user.id,
+        task_update_schema=task_input_schema,
+    )
+
+
 @router.patch(
     "/{task_id}/status",
     response_model=WorkTaskOut,
@@ -150,6 +330,9 @@ async def update_task(
         status.HTTP_404_NOT_FOUND: {
             "description": "A task with provided id isn't found",
         },
+        status.HTTP_409_CONFLICT: {
+            "description": "The operation conflicted with concurrent changes",
+        },
     },
 )
 async def update_task_status(
@@ -252,6 +435,7 @@ async def delete_task(
 
 @router.get(
     "/rating/me",
+    dependencies=[Depends(request_deadline(RATING_DEADLINE_SECONDS))],
     summary="Get user's work tasks rating",
     description="""
     Retrieves an average rate of the completed work tasks of the current user. Requires
@@ -267,11 +451,14 @@ async def delete_task(
         status.HTTP_404_NOT_FOUND: {
             "description": "Tasks aren't found",
         },
+        status.HTTP_504_GATEWAY_TIMEOUT: {
+            "description": "The rating isn't calculated in time",
+        },
     },
 )
 async def get_my_rating(
     current_user: UserRead = Depends(current_user),
-    session: AsyncSession = Depends(db_connector.get_session),
+    session: AsyncSession = Depends(db_connector.get_read_session),
 ):
     tasks_adapter = WorkTaskAdapter(session)
 
@@ -282,6 +469,7 @@ async def get_my_rating(
 
 @router.get(
     "/rating/team",
+    dependencies=[Depends(request_deadline(RATING_DEADLINE_SECONDS))],
     summary="Get team's work tasks rating",
     description="""
     Retrieves an average rate of the completed work tasks of the current user's team.
@@ -301,11 +489,14 @@ async def get_my_rating(
         status.HTTP_404_NOT_FOUND: {
             "description": "Tasks aren't found",
         },
+        status.HTTP_504_GATEWAY_TIMEOUT: {
+            "description": "The rating isn't calculated in time",
+        },
     },
 )
 async def get_team_rating(
     current_user_role: RoleOut = Depends(current_user_role),
-    session: AsyncSession = Depends(db_connector.get_session),
+    session: AsyncSession = Depends(db_connector.get_read_session),
 ):
     tasks_adapter = WorkTaskAdapter(session)
 
@@ -318,39 +509,102 @@ async def get_team_rating(
 
 @router.get(
     "/me-assigned",
-    response_model=list[WorkTaskOut],
+    response_model=CursorPage[WorkTaskOut],
     summary="Get the user assigned work tasks",
     description="""
-    Retrieves all the work tasks which have the current user as an assignee. Requires
-    authorization.
+    Retrieves a page of the work tasks which have the current user as an assignee
+    ordered by the "complete_by" datetime. Requires authorization.
+
+    Parameters:
+    - cursor: The "next_cursor" value of the previous page, omit to get the first page
+    - limit: The maximum number of the work tasks in the page
     """,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "The provided cursor is invalid",
+        },
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "The current user unauthorized",
+        },
+    },
 )
 async def get_my_assigned_tasks(
+    pagination: PaginationParams = Depends(get_pagination_params),
     current_user: UserRead = Depends(current_user),
-    session: AsyncSession = Depends(db_connector.get_session),
+    session: AsyncSession = Depends(db_connector.get_read_session),
 ):
     tasks_adapter = WorkTaskAdapter(session)
 
     tasks_service = WorkTaskService(tasks_adapter)
 
-    return await tasks_service.get_user_assigned_tasks(current_user.id)
+    return await tasks_service.get_user_assigned_tasks(current_user.id, pagination)
 
 
 @router.get(
     "/me-created",
-    response_model=list[WorkTaskOut],
+    response_model=CursorPage[WorkTaskOut],
     summary="Get the user created work tasks",
     description="""
-    Retrieves all the work tasks which have the current user as a creator. Requires
-    authorization.
+    Retrieves a page of the work tasks which have the current user as a creator ordered
+    by the "complete_by" datetime. Requires authorization.
+
+    Parameters:
+    - cursor: The "next_cursor" value of the previous page, omit to get the first page
+    - limit: The maximum number of the work tasks in the page
     """,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "The provided cursor is invalid",
+        },
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "The current user unauthorized",
+        },
+    },
 )
 async def get_my_created_tasks(
+    pagination: PaginationParams = Depends(get_pagination_params),
     current_user: UserRead = Depends(current_user),
-    session: AsyncSession = Depends(db_connector.get_session),
+    session: AsyncSession = Depends(db_connector.get_read_session),
 ):
     tasks_adapter = WorkTaskAdapter(session)
 
     tasks_service = WorkTaskService(tasks_adapter)
 
-    return await tasks_service.get_user_created_tasks(current_user.id)
+    return await tasks_service.get_user_created_tasks(current_user.id, pagination)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    dependencies=[Depends(current_superuser)],
+    summary="Export all the work tasks",
+    description="""
+    Streams all the work tasks ordered by id as newline delimited JSON or CSV. The
+    work tasks are fetched from the database by chunks, so the export runs in constant
+    memory. Requires superuser authorization.
+
+    Parameters:
+    - format: The export format, "ndjson" or "csv"
+    """,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+            "description": "The exported work tasks",
+        },
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "The current user unauthorized",
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "description": "The current user is not a superuser",
+        },
+    },
+)
+async def export_tasks(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+):
+    return export_response(
+        adapter_factory=WorkTaskAdapter,
+        schema=WorkTaskOut,
+        export_format=export_format,
+        filename="tasks",
+    )
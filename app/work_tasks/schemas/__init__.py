@@ -2,14 +2,18 @@ __all__ = (
     "WorkTaskCreate",
     "WorkTaskOut",
     "WorkTaskUpdate",
+    "WorkTaskBatchUpdate",
+    "WorkTaskPatch",
     "WorkTaskStatusEnum",
     "WorkTaskUpdateStatus",
     "WorkTaskUpdateRate",
 )
 
 from .work_task import (
+    WorkTaskBatchUpdate,
     WorkTaskCreate,
     WorkTaskOut,
+    WorkTaskPatch,
     WorkTaskStatusEnum,
     WorkTaskUpdate,
     WorkTaskUpdateRate,
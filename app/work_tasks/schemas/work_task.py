@@ -3,6 +3,8 @@ from enum import Enum
 
 from pydantic import BaseModel, Field
 
+from core.schemas import PartialUpdateSchema
+
 
 class WorkTaskStatusEnum(Enum):
     CREATED = "CREATED"
@@ -35,6 +37,21 @@ class WorkTaskUpdate(WorkTaskBase):
     pass
 
 
+class WorkTaskBatchUpdate(WorkTaskUpdate):
+    id: int
+
+
+class WorkTaskPatch(PartialUpdateSchema):
+    name: str | None = Field(None, example="Prepare report")
+    description: str | None = Field(
+        None, example="Prepare a very important work report"
+    )
+    comments: str | None = Field(
+        None, example="Report must include all the work details"
+    )
+    complete_by: datetime | None = Field(None, example="2025-02-10T08:30:00")
+
+
 class WorkTaskUpdateStatus(BaseModel):
     status: WorkTaskStatusEnum
 
@@ -1,6 +1,12 @@
 from typing import TypeVar
 
+from fastapi import HTTPException
+
+from core.batch import BatchItemError
+from core.exceptions import DuplicatedBatchItem
 from core.model_adapter import ModelAdapter
+from core.pagination import PaginationParams
+from core.transactions import transactional
 from structures.adapters.relation_adapter import RelationAdapter
 from structures.adapters.role_adapter import RoleAdapter
 from structures.exceptions.role import RoleNotFound
@@ -17,7 +23,11 @@ from .exceptions import (
 )
 from .models import WorkTask
 from .schemas import (
+    WorkTaskBatchUpdate,
     WorkTaskCreate,
+    WorkTaskOut,
+    WorkTaskPatch,
+    WorkTaskStatusEnum,
     WorkTaskUpdate,
     WorkTaskUpdateRate,
     WorkTaskUpdateStatus,
@@ -97,6 +107,74 @@ class WorkTaskService:
             task_create_schema, user_id
         )
 
+    async def create_tasks(
+        self,
+        user_id: int,
+        user_role_id: int,
+        task_create_schemas: list[WorkTaskCreate],
+        users_adapter: ModelAdapter,
+        relations_adapter: RelationAdapter,
+    ) -> dict:
+        """Creates a batch of work tasks. Checks every task the same way as
+        create_task does, creates the valid ones by a single statement and reports the
+        invalid ones.
+
+        Args:
+            user_id (int): User id
+            user_role_id (int): User role id
+            task_create_schemas (list[WorkTaskCreate]): Schemas to create work tasks
+            users_adapter (ModelAdapter): Users adapter
+            relations_adapter (RelationAdapter): Relations adapter
+
+        Returns:
+            dict: Dict {"items": <created WorkTask models>, "errors": <item errors>}
+        """
+
+        assignees = {
+            user.id: user
+            for user in await users_adapter.read_items_by_ids(
+                {schema.assignee_id for schema in task_create_schemas}
+            )
+        }
+        subordinate_role_ids = await relations_adapter.get_subordinate_ids_of_superior(
+            superior_id=user_role_id,
+            subordinate_ids={
+                user.role_id for user in assignees.values() if user.role_id
+            },
+        )
+
+        valid_schemas = []
+        errors = []
+
+        for index, task_create_schema in enumerate(task_create_schemas):
+            try:
+                if not check_datetime_after_now(task_create_schema.complete_by):
+                    raise TaskBeforeNow
+
+                assignee_user = assignees.get(task_create_schema.assignee_id)
+
+                if not assignee_user:
+                    raise UserNotFound
+
+                if not assignee_user.role_id:
+                    raise RoleNotFound
+
+                if assignee_user.role_id not in subordinate_role_ids:
+                    raise TaskForThisUser
+            except HTTPException as error:
+                errors.append(BatchItemError.from_exception(index, error))
+            else:
+                valid_schemas.append(task_create_schema)
+
+        tasks = await self.tasks_adapter.bulk_create_items(
+            valid_schemas,
+            creator_id=user_id,
+            status=WorkTaskStatusEnum.CREATED.value,
+            rate=0,
+        )
+
+        return {"items": tasks, "errors": errors}
+
     async def get_task_by_creator(self, task_id: int, creator_id: int) -> WTM:
         """Get work task by creator
 
@@ -123,14 +201,18 @@ class WorkTaskService:
         return task
 
     async def update_task(
-        self, task_id: int, user_id: int, task_update_schema: WorkTaskUpdate
+        self,
+        task_id: int,
+        user_id: int,
+        task_update_schema: WorkTaskUpdate | WorkTaskPatch,
     ) -> WTM:
-        """Updates work task.
+        """Updates work task. Only the fields set in the schema are updated.
 
         Args:
             task_id (int): Work task id
             user_id (int): User id
-            task_update_schema (WorkTaskUpdate): Schema to update work task
+            task_update_schema (WorkTaskUpdate | WorkTaskPatch): Schema to update work
+            task
 
         Raises:
             TaskBeforeNow: If complete_by datetime to update is before now
@@ -139,13 +221,72 @@ class WorkTaskService:
             WorkTask: Updated work task model
         """
 
-        if not check_datetime_after_now(task_update_schema.complete_by):
+        if task_update_schema.complete_by is not None and not check_datetime_after_now(
+            task_update_schema.complete_by
+        ):
             raise TaskBeforeNow
 
         task = await self.get_task_by_creator(task_id=task_id, creator_id=user_id)
 
         return await self.tasks_adapter.update_item(task_update_schema, task)
 
+    async def update_tasks(
+        self, user_id: int, task_update_schemas: list[WorkTaskBatchUpdate]
+    ) -> dict:
+        """Updates a batch of work tasks created by the user by a single statement and
+        reports the tasks which can't be updated. Unchanged tasks aren't written.
+
+        Args:
+            user_id (int): User id
+            task_update_schemas (list[WorkTaskBatchUpdate]): Schemas with ids of the
+            work tasks to update
+
+        Returns:
+            dict: Dict {"items": <updated WorkTask models>, "errors": <item errors>}
+        """
+
+        tasks = {
+            task.id: task
+            for task in await self.tasks_adapter.read_items_by_ids(
+                {schema.id for schema in task_update_schemas}
+            )
+        }
+
+        valid_schemas = []
+        unchanged_tasks = []
+        errors = []
+        seen_ids = set()
+
+        for index, task_update_schema in enumerate(task_update_schemas):
+            try:
+                if task_update_schema.id in seen_ids:
+                    raise DuplicatedBatchItem
+
+                seen_ids.add(task_update_schema.id)
+
+                if not check_datetime_after_now(task_update_schema.complete_by):
+                    raise TaskBeforeNow
+
+                task = tasks.get(task_update_schema.id)
+
+                if not task:
+                    raise TasksNotFound
+
+                if not user_id == task.creator_id:
+                    raise NotTaskCreator
+            except HTTPException as error:
+                errors.append(BatchItemError.from_exception(index, error))
+            else:
+                if self.tasks_adapter.get_changed_values(task_update_schema, task):
+                    valid_schemas.append(task_update_schema)
+                else:
+                    unchanged_tasks.append(task)
+
+        tasks = await self.tasks_adapter.bulk_update_items(valid_schemas)
+
+        return {"items": tasks + unchanged_tasks, "errors": errors}
+
+    @transactional()
     async def update_task_status(
         self, task_id: int, user_id: int, task_update_schema: WorkTaskUpdateStatus
     ) -> WTM:
@@ -203,6 +344,50 @@ class WorkTaskService:
 
         await self.tasks_adapter.delete_item(task)
 
+    async def delete_tasks(self, task_ids: list[int], user_id: int) -> dict:
+        """Deletes a batch of work tasks created by the user by a single statement and
+        reports the tasks which can't be deleted.
+
+        Args:
+            task_ids (list[int]): Ids of the work tasks to delete
+            user_id (int): User id
+
+        Returns:
+            dict: Dict {"items": <deleted work task ids>, "errors": <item errors>}
+        """
+
+        tasks = {
+            task.id: task
+            for task in await self.tasks_adapter.read_items_by_ids(task_ids)
+        }
+
+        valid_ids = []
+        errors = []
+        seen_ids = set()
+
+        for index, task_id in enumerate(task_ids):
+            try:
+                if task_id in seen_ids:
+                    raise DuplicatedBatchItem
+
+                seen_ids.add(task_id)
+
+                task = tasks.get(task_id)
+
+                if not task:
+                    raise TasksNotFound
+
+                if not user_id == task.creator_id:
+                    raise NotTaskCreator
+            except HTTPException as error:
+                errors.append(BatchItemError.from_exception(index, error))
+            else:
+                valid_ids.append(task_id)
+
+        deleted_ids = await self.tasks_adapter.bulk_delete_items(valid_ids)
+
+        return {"items": deleted_ids, "errors": errors}
+
     async def get_user_rating(self, user_id: int) -> dict:
         """Get user's work tasks average rating for 90 days.
 
@@ -245,30 +430,46 @@ class WorkTaskService:
 
         return {"rating": rating}
 
-    async def get_user_assigned_tasks(self, user_id: int) -> list[WTM]:
-        """Retrieves all the work tasks assigned to the user with provided id.
+    async def get_user_assigned_tasks(
+        self, user_id: int, pagination: PaginationParams
+    ) -> dict:
+        """Retrieves a page of the work tasks assigned to the user with provided id.
 
         Args:
             user_id (int): User id
+            pagination (PaginationParams): Cursor and limit of the page
 
         Returns:
-            list[WorkTask]: List of WorkTask models
+            dict: Dict {"items": <list of WorkTaskOut rows>, "next_cursor": <cursor>}
         """
 
-        tasks = await self.tasks_adapter.get_user_assigned_tasks(user_id)
+        tasks, next_cursor = await self.tasks_adapter.get_user_assigned_tasks(
+            user_id,
+            cursor=pagination.cursor,
+            limit=pagination.limit,
+            schema=WorkTaskOut,
+        )
 
-        return tasks
+        return {"items": tasks, "next_cursor": next_cursor}
 
-    async def get_user_created_tasks(self, user_id: int) -> list[WTM]:
-        """Retrieves all the work tasks created by the user with provided id.
+    async def get_user_created_tasks(
+        self, user_id: int, pagination: PaginationParams
+    ) -> dict:
+        """Retrieves a page of the work tasks created by the user with provided id.
 
         Args:
             user_id (int): User id
+            pagination (PaginationParams): Cursor and limit of the page
 
         Returns:
-            list[WorkTask]: List of WorkTask models
+            dict: Dict {"items": <list of WorkTaskOut rows>, "next_cursor": <cursor>}
         """
 
-        tasks = await self.tasks_adapter.get_user_created_tasks(user_id)
+        tasks, next_cursor = await self.tasks_adapter.get_user_created_tasks(
+            user_id,
+            cursor=pagination.cursor,
+            limit=pagination.limit,
+            schema=WorkTaskOut,
+        )
 
-        return tasks
+        return {"items": tasks, "next_cursor": next_cursor}
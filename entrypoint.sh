@@ -2,4 +2,4 @@ python3 -m migration_utils upgrade head
 
 python3 -m scripts.create_superuser
 
-uvicorn main:app --host 0.0.0.0 --port 8000
+CONFIG__RUN__HOST=0.0.0.0 CONFIG__RUN__PORT=8000 CONFIG__RUN__AUTO_RELOAD=false python3 main.py